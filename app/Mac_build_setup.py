@@ -28,11 +28,6 @@ OPTIONS = {
     'includes': [
         'scipy.optimize',
         'scipy.linalg',
-        'sklearn.metrics',
-        'sklearn.utils._typedefs',
-        'sklearn.utils._heap',
-        'sklearn.utils._sorting',
-        'sklearn.utils._vector_sentinel',
         'numpy',
         'matplotlib.backends.backend_tkagg',
     ],
@@ -1,5 +1,7 @@
 import sys
 import os
+from simulation_startup_profile import startup_profiler, configure_startup_profiling
+configure_startup_profiling(sys.argv)
 import traceback
 import shutil
 import subprocess
@@ -9,27 +11,66 @@ import time
 import tkinter as tk
 import webbrowser
 from pathlib import Path
-import pandas as pd
-import matplotlib.pyplot as plt
 import customtkinter as ctk
 from tkinter import messagebox, filedialog
 from tkinter import ttk
 from dotenv import load_dotenv
 import psutil
-import openai
 import math
 from PIL import Image, ImageTk
-from openai import error as openai_error_v0
-import tiktoken
 import re
-from typing import Union, Tuple, Dict
-import numpy as np
-from scipy.optimize import curve_fit
-from sklearn.metrics import r2_score
-
-AuthenticationError_v0 = openai_error_v0.AuthenticationError
-InvalidRequestError_v0 = openai_error_v0.InvalidRequestError
-APIConnectionError_v0 = openai_error_v0.APIConnectionError
+from typing import Union, Tuple, Dict, Callable
+import multiprocessing
+import importlib
+import tempfile
+
+if __name__ == "__main__":
+    multiprocessing.freeze_support()
+
+class OpenAINotLoadedError(Exception):
+    pass
+
+# openai and the statistics stack (numpy, pandas, matplotlib, scipy) load on first use or from the
+# background pre-warm, so none of them delay the first frame of the window.
+openai = None
+AuthenticationError_v0 = InvalidRequestError_v0 = APIConnectionError_v0 = OpenAINotLoadedError
+LAZY_PREWARM_DELAY_MS = 500
+_lazy_import_lock = threading.Lock()
+
+def load_openai():
+    global openai, AuthenticationError_v0, InvalidRequestError_v0, APIConnectionError_v0
+    with _lazy_import_lock:
+        if openai is None:
+            import openai as openai_module
+            from openai import error as openai_error_v0
+            AuthenticationError_v0 = openai_error_v0.AuthenticationError
+            InvalidRequestError_v0 = openai_error_v0.InvalidRequestError
+            APIConnectionError_v0 = openai_error_v0.APIConnectionError
+            from simulation_api_session import api_session
+            api_session.configure(os.getenv("OPENAI_API_KEY"))
+            openai = openai_module
+    return openai
+
+# Every module here is also imported where it is used, so PyInstaller and py2app still bundle it.
+PREWARM_MODULES = ["simulation_plots", "simulation_report", "simulation_batch", "simulation_models", "simulation_live",
+                   "simulation_growth_online", "simulation_sparklines", "scipy.optimize"]
+
+def prewarm_heavy_imports():
+    started = time.perf_counter()
+    try:
+        load_openai()
+        for module_name in PREWARM_MODULES:
+            importlib.import_module(module_name)
+        from simulation_tokens import count_static_tokens
+        count_static_tokens(SYSTEM_MESSAGE_PRIMARY, count_tokens)
+        count_static_tokens(SYSTEM_MESSAGE_SECONDARY, count_tokens)
+    except Exception as e:
+        print(f"Warning: Background pre-warm of heavy modules failed: {type(e).__name__}: {e}")
+        return
+    print(f"Heavy modules pre-warmed in the background in {time.perf_counter() - started:.2f}s.")
+
+def start_background_prewarm():
+    threading.Thread(target=prewarm_heavy_imports, daemon=True).start()
 OPENAI_V0_ERROR_IMPORTED = True
 OPENAI_V1_CLIENT_EXISTS = False
 
@@ -54,6 +95,8 @@ STREAMING_ASSETS_FOLDER = None
 SIMULATION_LOADED_FILE = None
 last_simulation_loaded = None
 all_simulations_data = []
+sparkline_summaries = {}
+sparkline_generation = 0
 play_icon_text = "▶"
 delete_icon_text = "🗑️"
 loaded_indicator_text = "✓"
@@ -118,6 +161,11 @@ UNITY_PRODUCT_NAME = "InitialSetup"
 LOG_SUBFOLDER = "SimulationLoggerData"
 CSV_FILENAME = "SimulationStats.csv"
 GRAPHICS_SUBFOLDER = "Graphics"
+FPS_POPULATION_REPORT_FILENAME = "fps_by_population.csv"
+BATCH_REPORT_DIR = Path("./SimulationsReport")
+BULK_REPORT_DIR = BATCH_REPORT_DIR / "BulkCreation"
+STATS_REPORT_FORMATS = ["png", "html", "both"]
+DEFAULT_STATS_REPORT_FORMAT = "png"
 
 def find_unity_persistent_path(product_name: str) -> Union[Path, None]:
     system = platform.system()
@@ -178,10 +226,20 @@ def find_simulation_data_path(simulation_name: str) -> Union[Path, None]:
     simulation_path = product_base_path / LOG_SUBFOLDER / simulation_name
     return simulation_path
 
-def exponential_func(x, a, b):
-    return a * np.exp(b * x)
-
-def SimulationGraphics(simulation_name):
+def get_stats_report_format() -> str:
+    report_format = os.getenv("STATS_REPORT_FORMAT", DEFAULT_STATS_REPORT_FORMAT).strip().lower()
+    if report_format not in STATS_REPORT_FORMATS:
+        print(f"Warning: Unknown STATS_REPORT_FORMAT '{report_format}', using '{DEFAULT_STATS_REPORT_FORMAT}'. Expected one of {STATS_REPORT_FORMATS}.")
+        return DEFAULT_STATS_REPORT_FORMAT
+    return report_format
+
+def SimulationGraphics(simulation_name, report_format=None):
+    from simulation_stats import load_simulation_stats, csv_fingerprint
+    from simulation_plots import render_simulation_plots, stale_graph_jobs
+    from simulation_fitting import load_growth_fits
+    from simulation_models import load_growth_models, describe_growth_model
+    from simulation_groupby import write_population_report
+    from simulation_report import write_html_report, html_report_is_current, HTML_REPORT_FILENAME
     if not simulation_name:
         print("Error: A simulation name must be provided to the SimulationGraphics function.")
         return
@@ -208,299 +266,115 @@ def SimulationGraphics(simulation_name):
          print(f"  Critical Error creating/ensuring output folder '{output_folder}': {e}. Aborting.")
          return
 
-    print(f"Step 4: Verifying and reading CSV file...")
+    print(f"Step 4: Verifying and reading CSV file in chunks...")
     if not csv_path.is_file():
         print(f"  Error: CSV file not found at the expected path: {csv_path}")
         return
 
+    report_format = report_format or get_stats_report_format()
+    html_path = output_folder / HTML_REPORT_FILENAME
     try:
-        df = pd.read_csv(csv_path, sep=";", engine="python")
-        if df.empty:
-             print(f"  Error: The CSV file '{csv_path}' is empty.")
-             return
-        print(f"  CSV read successful ({len(df)} rows).")
-    except pd.errors.EmptyDataError:
-         print(f"  Error: The CSV file '{csv_path}' is empty or contains no data.")
-         return
-    except Exception as e:
-        print(f"  Critical Error reading or parsing CSV file '{csv_path}': {e}")
-        traceback.print_exc()
-        return
-
-    print(f"Step 5: Processing data...")
-    try:
-        df.columns = df.columns.str.strip()
-        if "Timestamp" not in df.columns:
-            print("  Error: Required column 'Timestamp' not found in the CSV.")
+        fingerprint = csv_fingerprint(csv_path)
+        stale_jobs = stale_graph_jobs(output_folder, fingerprint) if report_format in ("png", "both") else []
+        html_stale = report_format in ("html", "both") and not html_report_is_current(html_path, fingerprint)
+        if not stale_jobs and not html_stale:
+            print(f"  All requested statistics in '{output_folder}' are up to date with the CSV, skipping generation.")
+            return
+        if stale_jobs:
+            print(f"  Graphs to regenerate: {stale_jobs}")
+        stats = load_simulation_stats(csv_path)
+        if stats is None:
             return
-        df["Timestamp_str"] = df["Timestamp"].astype(str).str.strip()
-        df = df[df["Timestamp_str"].str.lower().isin(['0', '']) == False].copy()
-        df["Timestamp"] = pd.to_datetime(df["Timestamp_str"], format="%d-%m-%Y %H:%M:%S", errors='coerce')
-        initial_rows = len(df)
-        df.dropna(subset=["Timestamp"], inplace=True)
-        rows_dropped = initial_rows - len(df)
-        if rows_dropped > 0:
-            print(f"  Warning: Removed {rows_dropped} rows with invalid Timestamp format.")
-        if df.empty:
+        print(f"  CSV read successful ({stats.rows_read} rows).")
+        if stats.rows_dropped > 0:
+            print(f"  Warning: Removed {stats.rows_dropped} rows with invalid Timestamp format.")
+        if len(stats) == 0:
             print("  Error: No valid data remaining after processing Timestamps.")
             return
-        df.sort_values(by="Timestamp", inplace=True)
-        print("  Data processing completed.")
+        fps_summary = stats.rollups.summary("FPS") if stats.rollups is not None else None
+        if fps_summary and fps_summary["count"] > 0:
+            print(f"  FPS summary: mean {fps_summary['mean']:.2f}, min {fps_summary['min']:.2f}, max {fps_summary['max']:.2f} over {fps_summary['count']} rows.")
     except Exception as e:
-        print(f"  Error during data processing: {e}")
+        print(f"  Critical Error reading or parsing CSV file '{csv_path}': {e}")
         traceback.print_exc()
         return
 
-    known_columns = {"Timestamp", "Timestamp_str", "FPS", "RealTime", "SimulatedTime", "DeltaTime", "FrameCount", "Pausado"}
-    organism_columns = sorted([col for col in df.columns if col not in known_columns])
+    organism_columns = stats.organism_columns
     print(f"  Identified organism columns: {organism_columns}")
-    print(f"Step 7: Generating graphs...")
-    plot_generated_count = 0
-
-    if "FPS" in df.columns:
-        plt.figure(figsize=(12, 6))
-        plt.plot(df["Timestamp"], df["FPS"], marker=".", linestyle="-", color="blue")
-        plt.title(f"FPS over Time ({simulation_name})")
-        plt.xlabel("Timestamp")
-        plt.ylabel("FPS")
-        plt.xticks(rotation=45, ha='right')
-        plt.grid(True, linestyle='--', alpha=0.6)
-        plt.tight_layout()
-        try:
-            plt.savefig(str(output_folder / "fps_over_time.png"))
-            plot_generated_count += 1
-        except Exception as e:
-            print(f"Error saving fps_over_time.png: {e}")
-        plt.close()
-    else:
-        print("Column 'FPS' not found, skipping FPS over Time graph.")
-
-    if "RealTime" in df.columns and "SimulatedTime" in df.columns:
-        plt.figure(figsize=(12, 6))
-        plt.plot(df["Timestamp"], df["RealTime"], label="RealTime", marker=".", linestyle="-")
-        plt.plot(df["Timestamp"], df["SimulatedTime"], label="SimulatedTime", marker=".", linestyle="-", color="orange")
-        plt.title(f"RealTime vs SimulatedTime ({simulation_name})")
-        plt.xlabel("Timestamp")
-        plt.ylabel("Time (s)")
-        plt.xticks(rotation=45, ha='right')
-        plt.legend()
-        plt.grid(True, linestyle='--', alpha=0.6)
-        plt.tight_layout()
-        try:
-            plt.savefig(str(output_folder / "time_comparison.png"))
-            plot_generated_count += 1
-        except Exception as e:
-            print(f"Error saving time_comparison.png: {e}")
-        plt.close()
-    else:
-         print("Columns 'RealTime' or 'SimulatedTime' not found, skipping Time Comparison graph.")
-
-    if organism_columns:
-        plt.figure(figsize=(12, 6))
-        plotted_any_organism = False
-        for col in organism_columns:
-            if col in df.columns and pd.api.types.is_numeric_dtype(df[col]):
-                plt.plot(df["Timestamp"], df[col], label=col, marker=".", linestyle="-")
-                plotted_any_organism = True
-            else:
-                print(f"Warning: Skipping non-numeric or missing organism column: '{col}'")
-        if plotted_any_organism:
-            plt.title(f"Organism Counts over Time ({simulation_name})")
-            plt.xlabel("Timestamp")
-            plt.ylabel("Count")
-            plt.xticks(rotation=45, ha='right')
-            plt.legend()
-            plt.grid(True, linestyle='--', alpha=0.6)
-            plt.tight_layout()
-            try:
-                plt.savefig(str(output_folder / "organism_counts.png"))
-                plot_generated_count += 1
-            except Exception as e:
-                print(f"Error saving organism_counts.png: {e}")
-        plt.close()
-    else:
-        print("No specific organism columns found, skipping Organism Counts graph.")
-
-    if "Organism count" in df.columns:
-        plt.figure(figsize=(12, 6))
-        plt.plot(df["Timestamp"], df["Organism count"], marker=".", linestyle="-", color="purple")
-        plt.title(f"Total Organisms over Time ({simulation_name})")
-        plt.xlabel("Timestamp")
-        plt.ylabel("Total Count")
-        plt.xticks(rotation=45, ha='right')
-        plt.grid(True, linestyle='--', alpha=0.6)
-        plt.tight_layout()
-        try:
-            plt.savefig(str(output_folder / "total_organisms.png"))
-            plot_generated_count += 1
-        except Exception as e:
-            print(f"Error saving total_organisms.png: {e}")
-        plt.close()
-    else:
-        print("Column 'Organism count' not found, skipping Total Organisms graph.")
-
-    if "FrameCount" in df.columns:
-        plt.figure(figsize=(12, 6))
-        plt.plot(df["Timestamp"], df["FrameCount"], marker=".", linestyle="-", color="darkcyan")
-        plt.title(f"Frame Count over Time ({simulation_name})")
-        plt.xlabel("Timestamp")
-        plt.ylabel("Frame Count")
-        plt.xticks(rotation=45, ha='right')
-        plt.grid(True, linestyle='--', alpha=0.6)
-        plt.tight_layout()
-        try:
-            plt.savefig(str(output_folder / "frame_count.png"))
-            plot_generated_count += 1
-        except Exception as e:
-            print(f"Error saving frame_count.png: {e}")
-        plt.close()
-    else:
-        print("Column 'FrameCount' not found, skipping Frame Count graph.")
-
-    if "FPS" in df.columns and not df["FPS"].isnull().all():
-        plt.figure(figsize=(12, 6))
-        plt.hist(df["FPS"].dropna(), bins=20, color="green", edgecolor="black")
-        plt.title(f"FPS Distribution ({simulation_name})")
-        plt.xlabel("FPS")
-        plt.ylabel("Frequency")
-        plt.grid(True, axis='y', linestyle='--', alpha=0.6)
-        plt.tight_layout()
-        try:
-            plt.savefig(str(output_folder / "fps_histogram.png"))
-            plot_generated_count += 1
-        except Exception as e:
-             print(f"Error saving fps_histogram.png: {e}")
-        plt.close()
-    elif "FPS" in df.columns:
-         print("Column 'FPS' found but contains no valid data, skipping FPS histogram.")
-
-    if "Organism count" in df.columns and "FPS" in df.columns and not df["Organism count"].isnull().all() and not df["FPS"].isnull().all():
-        if pd.api.types.is_numeric_dtype(df["Organism count"]):
-            df_groupable = df.dropna(subset=["Organism count", "FPS"])
-            try:
-                 df_groupable["Organism count"] = df_groupable["Organism count"].astype(int)
-            except ValueError:
-                 print("Warning: 'Organism count' contains non-integer values, grouping by float values.")
-            df_grouped = df_groupable.groupby("Organism count")["FPS"].mean().reset_index()
-            if not df_grouped.empty:
-                plt.figure(figsize=(12, 6))
-                plt.plot(df_grouped["Organism count"], df_grouped["FPS"], marker="o", linestyle="-", color="red")
-                plt.title(f"Average FPS per Total Organisms ({simulation_name})")
-                plt.xlabel("Total Organisms")
-                plt.ylabel("Average FPS")
-                plt.grid(True, linestyle='--', alpha=0.6)
-                plt.tight_layout()
-                try:
-                    plt.savefig(str(output_folder / "total_organisms_vs_fps.png"))
-                    plot_generated_count += 1
-                except Exception as e:
-                    print(f"Error saving total_organisms_vs_fps.png: {e}")
-                plt.close()
+    print(f"Step 5: Fitting exponential growth curves...")
+    growth_fits = None
+    try:
+        growth_fits = load_growth_fits(csv_path, stats)
+    except Exception as e:
+        print(f"  Warning: Growth curve fitting failed: {e}")
+    if growth_fits is not None:
+        for col, fit in growth_fits.items():
+            if growth_fits.is_valid(col):
+                print(f"  {col}: a={fit['a']:.3f}, b={fit['b']:.5f}, R²={fit['r_squared']:.3f}, doubling time={fit['doubling_time']:.2f}s")
             else:
-                print("Could not group data for Average FPS per Total Organisms graph.")
-        else:
-            print("Column 'Organism count' is not numeric, skipping Average FPS per Total Organisms graph.")
-
-    if "SimulatedTime" in df.columns and organism_columns:
-        if pd.api.types.is_numeric_dtype(df["SimulatedTime"]) and not df["SimulatedTime"].isnull().all():
-            plt.figure(figsize=(14, 7))
-            plotted_something = False
-            actual_organisms_plotted = []
-            time_data_full = df["SimulatedTime"]
-            for col in organism_columns:
-                if col == "Organism count":
-                    print(f"  Skipping column '{col}' from Graph 8 as requested.")
-                    continue
-                if col in df.columns and pd.api.types.is_numeric_dtype(df[col]) and not df[col].isnull().all():
-                    valid_indices = df[col].notna() & time_data_full.notna()
-                    time_data_clean = time_data_full[valid_indices].values
-                    organism_data_clean = df.loc[valid_indices, col].values
-                    if len(time_data_clean) > 0:
-                        plt.plot(time_data_clean, organism_data_clean, label=f"{col}", marker=".", linestyle="-", alpha=0.7)
-                        plotted_something = True
-                        if col not in actual_organisms_plotted:
-                            actual_organisms_plotted.append(col)
-                    else:
-                        print(f"  Warning: No valid numeric data for '{col}' on Y-axis or corresponding 'SimulatedTime'.")
-                        continue
-                    if len(time_data_clean) >= 2:
-                        try:
-                            initial_a = organism_data_clean[0] if organism_data_clean[0] > 0 else 1.0
-                            if np.all(organism_data_clean == organism_data_clean[0]):
-                                initial_b = 0.0
-                            elif len(time_data_clean) > 1 and organism_data_clean[-1] > initial_a and time_data_clean[-1] > time_data_clean[0]:
-                                time_diff = time_data_clean[-1] - time_data_clean[0]
-                                if time_diff > 1e-9:
-                                    initial_b = np.log(organism_data_clean[-1] / initial_a) / time_diff
-                                else:
-                                    initial_b = 0.0
-                            else:
-                                initial_b = 0.01
-                            if not np.isfinite(initial_b):
-                                initial_b = 0.01
-                            p0 = [initial_a, initial_b]
-                            bounds = ([0, -np.inf], [np.inf, np.inf])
-                            params, covariance = curve_fit(
-                                exponential_func,
-                                time_data_clean,
-                                organism_data_clean,
-                                p0=p0,
-                                bounds=bounds,
-                                maxfev=10000
-                            )
-                            a_fit, b_fit = params
-                            organism_predicted = exponential_func(time_data_clean, a_fit, b_fit)
-                            r_squared = r2_score(organism_data_clean, organism_predicted)
-                            time_fit = np.linspace(time_data_clean.min(), time_data_clean.max(), 100)
-                            organism_fit = exponential_func(time_fit, a_fit, b_fit)
-                            label_fit = f"{col} (Exp: a={a_fit:.2f}, b={b_fit:.3f}, R²={r_squared:.2f})"
-                            plt.plot(time_fit, organism_fit, label=label_fit, linestyle="--")
-                        except RuntimeError:
-                            print(f"  Warning: Could not fit exponential curve for '{col}'. Optimization did not converge.")
-                        except ValueError as ve:
-                            print(f"  Warning: Value error during fitting for '{col}'. Incompatible data? {ve}")
-                        except Exception as e:
-                            print(f"  Warning: Unexpected error during curve fitting for '{col}': {e}")
-                    else:
-                        print(f"  Warning: Not enough data points ({len(time_data_clean)}) to fit curve for '{col}'.")
-            if plotted_something:
-                plt.title(f"Specific Organism Count & Exponential Fit over Simulated Time ({simulation_name})")
-                plt.xlabel("Simulated Time (s)")
-                plt.ylabel("Organism Count")
-                if len(actual_organisms_plotted) > 2:
-                    plt.legend(bbox_to_anchor=(1.04, 1), loc="upper left")
-                    plt.tight_layout(rect=[0, 0, 0.85, 1])
-                else:
-                    plt.legend()
-                    plt.tight_layout()
-                plt.grid(True, linestyle='--', alpha=0.6)
-                try:
-                    save_path = output_folder / "organisms_vs_simulated_time_fit.png"
-                    plt.savefig(str(save_path))
-                    plot_generated_count += 1
-                    print(f"  Graph 'organisms_vs_simulated_time_fit.png' saved (excluding 'Organism count').")
-                except Exception as e:
-                    print(f"  Error saving organisms_vs_simulated_time_fit.png: {e}")
+                print(f"  {col}: not enough positive counts to fit.")
+    print(f"Step 6: Selecting growth models (exponential, logistic, Gompertz)...")
+    growth_models = None
+    try:
+        growth_models = load_growth_models(csv_path, stats)
+    except Exception as e:
+        print(f"  Warning: Growth model selection failed: {e}")
+    if growth_models is not None:
+        for col, best in growth_models.items():
+            if best is not None:
+                print(f"  {col}: best by {growth_models.criterion.upper()} is {describe_growth_model(best)}")
             else:
-                print("  Nothing plotted for Organisms vs Simulated Time (no valid data or only 'Organism count' found).")
-            plt.close()
-        elif "SimulatedTime" in df.columns and df["SimulatedTime"].isnull().all():
-            print("Column 'SimulatedTime' exists but all values are null, skipping Organisms vs Simulated Time graph.")
-        else:
-            print("Column 'SimulatedTime' is not numeric, skipping Organisms vs Simulated Time graph.")
-    elif not organism_columns:
-        print("No specific organism columns found, skipping Organisms vs Simulated Time graph.")
-    else:
-        print("Column 'SimulatedTime' not found, skipping Organisms vs Simulated Time graph.")
+                print(f"  {col}: no growth model could be fitted.")
+    plot_generated_count = 0
+    if stale_jobs:
+        print(f"Step 7: Generating graphs...")
+        plot_generated_count = render_simulation_plots(stats, simulation_name, output_folder, growth_fits=growth_fits, only_jobs=stale_jobs, fingerprint=fingerprint,
+                                                        growth_models=growth_models)
+    if html_stale:
+        print(f"Step 8: Writing interactive HTML report...")
+        report_start = time.perf_counter()
+        if write_html_report(stats, simulation_name, html_path, growth_fits=growth_fits, fingerprint=fingerprint, growth_models=growth_models):
+            print(f"  Interactive report saved to '{html_path.name}' in {time.perf_counter() - report_start:.2f}s.")
+    if len(stats.fps_by_population) > 0:
+        report_path = output_folder / FPS_POPULATION_REPORT_FILENAME
+        if write_population_report(stats.fps_by_population, report_path):
+            print(f"  FPS percentiles per population size saved to '{report_path.name}'.")
 
     print(f"\n--- Graph generation process completed for '{simulation_name}' ---")
     if plot_generated_count > 0:
         print(f"{plot_generated_count} graphs were generated in: {output_folder}")
-    else:
+    elif stale_jobs:
         print("No useful graphs were generated due to missing data or issues.")
 
+def SimulationsBatchReport() -> int:
+    from simulation_batch import build_batch_report
+    print(f"\n--- Starting Batch Statistics Report ---")
+    simulations = get_simulations()
+    print(f"Step 1: Locating data for {len(simulations)} simulations...")
+    csv_paths = {}
+    for sim in simulations:
+        simulation_folder = find_simulation_data_path(sim["name"])
+        if not simulation_folder:
+            continue
+        csv_path = simulation_folder / CSV_FILENAME
+        if csv_path.is_file():
+            csv_paths[sim["name"]] = csv_path
+        else:
+            print(f"  Skipping '{sim['name']}': no statistics file at {csv_path}")
+    if not csv_paths:
+        print("  Error: No simulation has a statistics file yet. Run a simulation first.")
+        return 0
+    try:
+        BATCH_REPORT_DIR.mkdir(parents=True, exist_ok=True)
+    except OSError as e:
+        print(f"  Critical Error creating report folder '{BATCH_REPORT_DIR}': {e}. Aborting.")
+        return 0
+    print(f"Step 2: Summarizing {len(csv_paths)} simulations...")
+    chart_count = build_batch_report(csv_paths, BATCH_REPORT_DIR)
+    print(f"\n--- Batch report completed: {chart_count} comparison charts in {BATCH_REPORT_DIR.resolve()} ---")
+    return chart_count
+
 load_dotenv(dotenv_path="./.env")
-openai.api_key = os.getenv("OPENAI_API_KEY")
 FINE_TUNED_MODEL_NAME = os.getenv("FINE_TUNED_MODEL_NAME")
 SECOND_FINE_TUNED_MODEL_NAME = os.getenv("2ND_FINE_TUNED_MODEL_NAME")
 
@@ -512,49 +386,70 @@ SYSTEM_MESSAGE_SECONDARY = (
 )
 
 def count_tokens(text: str) -> int:
-    try:
-        encoding = tiktoken.encoding_for_model(FINE_TUNED_MODEL_NAME if FINE_TUNED_MODEL_NAME else "gpt-3.5-turbo")
-    except Exception:
-        encoding = tiktoken.get_encoding("cl100k_base")
-    return len(encoding.encode(text))
+    from simulation_tokens import count_tokens as count_model_tokens
+    return count_model_tokens(text, FINE_TUNED_MODEL_NAME)
 
 def check_api_connection() -> bool:
+    load_openai()
     if not openai.api_key:
         print("Error: OpenAI API key is not set.")
         return False
-    try:
-        openai.Model.list(limit=1)
+    # Recent real calls count as health checks; the probe only runs when cold or after the breaker trips.
+    from simulation_api_session import api_session
+    if api_session.ensure_available():
         return True
-    except AuthenticationError_v0:
-        print("Error connecting to API: Authentication failed (Invalid API Key?).")
-        return False
-    except APIConnectionError_v0 as e:
-        print(f"Error connecting to API: Connection issue. {e}")
-        return False
-    except Exception as e:
-        print(f"Error connecting to API: Unexpected error ({type(e).__name__}). {e}")
-        return False
+    print(f"Error connecting to API: {api_session.describe()}")
+    return False
 
-def call_api_generic(prompt: str, model_name: str, system_message: str) -> tuple[str, int, int]:
-    if not check_api_connection():
+async def call_api_generic_async(prompt: str, model_name: str, system_message: str, simulation_name: Union[str, None] = None, stage: str = "",
+                                 on_text: Union[Callable[[str], None], None] = None) -> tuple[str, int, int]:
+    from simulation_api_async import pipeline_runner
+    if not await pipeline_runner.to_thread(check_api_connection):
         return "Error: API Connection Failed", 0, 0
     if not model_name:
         print(f"Error calling API: Model name is not specified.")
         return "Error: Model Name Missing", 0, 0
     try:
+        from simulation_api_session import api_session
+        from simulation_tokens import count_static_tokens, usage_token_counts, record_token_usage
         messages = [
             {"role": "system", "content": system_message},
             {"role": "user", "content": prompt}
         ]
-        input_tokens = count_tokens(system_message) + count_tokens(prompt)
-        response = openai.ChatCompletion.create(
-            model=model_name,
-            messages=messages,
-            temperature=0,
-            timeout=30
-        )
-        reply = response.choices[0].message["content"].strip()
-        output_tokens = count_tokens(reply)
+        if on_text is None:
+            response = await pipeline_runner.api_call(
+                api_session.achat_completion,
+                model=model_name,
+                messages=messages,
+                temperature=0,
+                timeout=30
+            )
+            reply = response.choices[0].message["content"].strip()
+        else:
+            # Streamed, so the caller can act on each part of the reply while the rest is still being generated.
+            response = None
+            pieces = []
+            async with pipeline_runner.api_slot():
+                async for chunk in api_session.astream_chat_completion(model=model_name, messages=messages, temperature=0, timeout=30,
+                                                                      stream_options={"include_usage": True}):
+                    if chunk.get("usage"):
+                        response = chunk
+                    for choice in chunk.get("choices") or []:
+                        piece = choice.get("delta", {}).get("content")
+                        if piece:
+                            pieces.append(piece)
+                            on_text(piece)
+            reply = "".join(pieces).strip()
+        # The API reports exact usage; local counting is only the fallback when it is missing.
+        usage = usage_token_counts(response)
+        if usage is not None:
+            input_tokens, output_tokens = usage
+            source = "usage"
+        else:
+            input_tokens = count_static_tokens(system_message, count_tokens) + count_tokens(prompt)
+            output_tokens = count_tokens(reply)
+            source = "estimate"
+        await pipeline_runner.to_thread(record_token_usage, TOKEN_LEDGER_PATH, simulation_name, stage, model_name, input_tokens, output_tokens, source)
         return reply, input_tokens, output_tokens
     except InvalidRequestError_v0 as e:
         print(f"Error calling model {model_name}: Invalid Request. {e}")
@@ -566,19 +461,19 @@ def call_api_generic(prompt: str, model_name: str, system_message: str) -> tuple
         print(f"Error calling model {model_name}: Unexpected error ({type(e).__name__}). {e}")
         return f"Error: API Call Failed ({type(e).__name__})", 0, 0
 
-def call_primary_model(prompt: str) -> tuple[str, int, int]:
+async def call_primary_model_async(prompt: str, simulation_name: Union[str, None] = None, on_text: Union[Callable[[str], None], None] = None) -> tuple[str, int, int]:
     if not FINE_TUNED_MODEL_NAME:
         return "Error: Primary Fine-Tuned Model Name not set in .env", 0, 0
-    return call_api_generic(prompt, FINE_TUNED_MODEL_NAME, SYSTEM_MESSAGE_PRIMARY)
+    return await call_api_generic_async(prompt, FINE_TUNED_MODEL_NAME, SYSTEM_MESSAGE_PRIMARY, simulation_name, "primary", on_text)
 
-def call_secondary_model(prompt: str) -> tuple[str, int, int]:
+async def call_secondary_model_async(prompt: str, simulation_name: Union[str, None] = None) -> tuple[str, int, int]:
     model_to_use = SECONDARY_FINE_TUNED_MODEL_NAME
     if not model_to_use:
         print("Warning: Secondary Fine-Tuned Model Name not set. Using primary model for validation.")
         model_to_use = FINE_TUNED_MODEL_NAME
         if not model_to_use:
              return "Error: Neither Secondary nor Primary Model Name is set.", 0, 0
-    return call_api_generic(prompt, model_to_use, SYSTEM_MESSAGE_SECONDARY)
+    return await call_api_generic_async(prompt, model_to_use, SYSTEM_MESSAGE_SECONDARY, simulation_name, "secondary")
 
 def split_braces_outside_strings(code: str) -> str:
     result_lines = []
@@ -602,7 +497,8 @@ def split_braces_outside_strings(code: str) -> str:
     return ''.join(result_lines)
 
 def separar_codigos_por_archivo(respuesta: str) -> dict:
-    patrones = re.findall(r'(\d+)\.(\w+\.cs)\{(.*?)}(?=\d+\.|$)', respuesta, re.DOTALL)
+    from simulation_codeblocks import CODE_BLOCK_PATTERN
+    patrones = CODE_BLOCK_PATTERN.findall(respuesta)
     if not patrones:
         print("No se encontraron bloques de código en la respuesta.")
         return {}
@@ -627,28 +523,30 @@ def format_csharp(contenido: str) -> str:
             nivel_indentacion += 1
     return "\n".join(contenido_formateado)
 
-def import_codes(codes: dict, simulation_name: str) -> bool:
+def prepare_simulation_import(simulation_name: str, simulation_folder: Union[str, None] = None) -> Union[dict, None]:
     base_dir = os.getcwd()
-    simulation_folder = os.path.join(base_dir, "Simulations", simulation_name)
+    simulation_folder = simulation_folder or os.path.join(base_dir, "Simulations", simulation_name)
     if os.path.exists(simulation_folder):
         if os.path.isdir(simulation_folder):
              print(f"Advertencia: La carpeta de simulación '{simulation_name}' ya existe en {simulation_folder}.")
         else:
              print(f"Error: Ya existe un archivo llamado '{simulation_name}' en la ubicación de Simulaciones. Elija otro nombre.")
-             return False
+             return None
     template_folder = os.path.join(base_dir, "Template")
     if not os.path.exists(template_folder) or not os.path.isdir(template_folder):
          print(f"Error: No se encontró la carpeta 'Template' en {base_dir}. No se puede crear la simulación.")
-         return False
+         return None
+    created = False
     try:
         if not os.path.exists(simulation_folder):
             shutil.copytree(template_folder, simulation_folder)
+            created = True
             print(f"Estructura de Template copiada a: {simulation_folder}")
         else:
             print(f"Usando carpeta de simulación existente: {simulation_folder}")
     except Exception as e:
         print(f"Error al copiar la estructura del Template: {e}")
-        return False
+        return None
     assets_editor_folder = os.path.join(simulation_folder, "Assets", "Editor")
     assets_scripts_folder = os.path.join(simulation_folder, "Assets", "Scripts")
     assets_scripts_components = os.path.join(assets_scripts_folder, "Components")
@@ -666,6 +564,18 @@ def import_codes(codes: dict, simulation_name: str) -> bool:
     if not os.path.exists(template_create_path):
         print(f"Advertencia: No se encontró el archivo template 'CreatePrefabsOnClick.cs' en {template_create_path}. Este script se escribirá directamente.")
         template_create_path = None
+    return {"simulation_folder": simulation_folder, "created": created, "assets_editor_folder": assets_editor_folder,
+            "assets_scripts_components": assets_scripts_components, "assets_scripts_systems": assets_scripts_systems,
+            "assets_scripts_general": assets_scripts_general, "template_system_path": template_system_path,
+            "template_create_path": template_create_path}
+
+def write_simulation_scripts(context: dict, codes: dict) -> list:
+    assets_editor_folder = context["assets_editor_folder"]
+    assets_scripts_components = context["assets_scripts_components"]
+    assets_scripts_systems = context["assets_scripts_systems"]
+    assets_scripts_general = context["assets_scripts_general"]
+    template_system_path = context["template_system_path"]
+    template_create_path = context["template_create_path"]
     files_processed = []
     for file_name, content in codes.items():
         dest_path = ""
@@ -746,6 +656,10 @@ def import_codes(codes: dict, simulation_name: str) -> bool:
                  print(f"Error: No se pudo determinar la ruta de destino para '{file_name}'. Archivo omitido.")
         except Exception as e:
             print(f"Error procesando el archivo '{file_name}': {e}")
+    return files_processed
+
+def finish_simulation_import(context: dict, files_processed: list) -> bool:
+    assets_scripts_systems = context["assets_scripts_systems"]
     template_system_dest = os.path.join(assets_scripts_systems, "GeneralSystem.cs")
     if os.path.exists(template_system_dest):
         try:
@@ -759,7 +673,14 @@ def import_codes(codes: dict, simulation_name: str) -> bool:
         print("No se procesaron archivos.")
         return False
 
+def import_codes(codes: dict, simulation_name: str) -> bool:
+    context = prepare_simulation_import(simulation_name)
+    if context is None:
+        return False
+    return finish_simulation_import(context, write_simulation_scripts(context, codes))
+
 DELIMITER = "%|%"
+responses_csv_lock = threading.Lock()
 try:
     APP_DATA_DIR = Path.home() / "Documents" / "UnitySimulationManagerData"
     APP_DATA_DIR.mkdir(parents=True, exist_ok=True)
@@ -781,6 +702,8 @@ except Exception as e:
         print(f"CRITICAL ERROR: Fallback path also failed: {fallback_e}")
         messagebox.showerror("Fatal Error", "Cannot establish a data storage location (Documents or executable path). Caching and history will be disabled.")
         RESPONSES_CSV = None
+# Per-call token usage and estimated cost, queryable by day and by simulation (see simulation_tokens).
+TOKEN_LEDGER_PATH = RESPONSES_DIR / "TokenLedger.sqlite3" if RESPONSES_CSV else None
 
 def check_last_char_is_newline(filepath: Union[str, Path]) -> bool:
     if not RESPONSES_CSV: return True
@@ -834,6 +757,11 @@ def write_response_to_csv(prompt: str, response: str, input_tokens: int, output_
     if not RESPONSES_CSV:
          print("Error: Cannot write response to CSV, data path not configured.")
          return
+    # Concurrent pipelines append to the same file, and the next id depends on the last row.
+    with responses_csv_lock:
+        append_response_to_csv(prompt, response, input_tokens, output_tokens)
+
+def append_response_to_csv(prompt: str, response: str, input_tokens: int, output_tokens: int) -> None:
     try:
         file_exists = RESPONSES_CSV.exists()
         is_empty = file_exists and RESPONSES_CSV.stat().st_size == 0
@@ -886,11 +814,69 @@ def get_cached_response(prompt: str) -> Union[str, None]:
          return None
     return None
 
-def api_manager(simulation_name: str, simulation_description: str, use_cache: bool = True) -> tuple[bool, Union[str, None]]:
+def prepare_streamed_import(simulation_name: str) -> Union[dict, None]:
+    # Streamed scripts land in a hidden staging copy, so nothing under Simulations changes until the whole reply is accepted.
+    simulations_folder = os.path.join(os.getcwd(), "Simulations")
+    target_folder = os.path.join(simulations_folder, simulation_name)
+    if os.path.exists(target_folder) and not os.path.isdir(target_folder):
+        print(f"Error: Ya existe un archivo llamado '{simulation_name}' en la ubicación de Simulaciones. Elija otro nombre.")
+        return None
+    try:
+        os.makedirs(simulations_folder, exist_ok=True)
+        staging_root = tempfile.mkdtemp(prefix=f".{simulation_name}.", suffix=".staging", dir=simulations_folder)
+    except OSError as e:
+        print(f"Error creating the staging folder for '{simulation_name}': {e}")
+        return None
+    context = prepare_simulation_import(simulation_name, os.path.join(staging_root, simulation_name))
+    if context is None:
+        shutil.rmtree(staging_root, ignore_errors=True)
+        return None
+    context.update({"staging_root": staging_root, "target_folder": target_folder})
+    return context
+
+def publish_streamed_import(context: dict, files_processed: list) -> bool:
+    # Runs only once the reply passed validation: a new simulation is renamed into place in one step,
+    # an existing one receives just the new scripts, as the buffered import would have written them.
+    staged_folder = context["simulation_folder"]
+    target_folder = context["target_folder"]
+    def published_path(path):
+        return os.path.join(target_folder, os.path.relpath(path, staged_folder))
+    published = []
+    try:
+        if not os.path.exists(target_folder):
+            os.replace(staged_folder, target_folder)
+            published = [published_path(path) for path in files_processed]
+        else:
+            for path in files_processed:
+                destination = published_path(path)
+                os.makedirs(os.path.dirname(destination), exist_ok=True)
+                os.replace(path, destination)
+                published.append(destination)
+    except OSError as e:
+        print(f"Error moving the streamed scripts into {target_folder}: {e}")
+        return False
+    finally:
+        shutil.rmtree(context["staging_root"], ignore_errors=True)
+    published_context = {key: published_path(value) if key.startswith("assets_") else value for key, value in context.items()}
+    published_context["simulation_folder"] = target_folder
+    return finish_simulation_import(published_context, published)
+
+def write_streamed_script(context: dict, file_name: str, content: str) -> list:
+    return write_simulation_scripts(context, {file_name: format_csharp(content)})
+
+async def discard_streamed_scripts(writer) -> None:
+    # A rejected or failed response only ever wrote into the staging folder, so dropping that folder undoes it.
+    from simulation_api_async import pipeline_runner
+    await writer.wait()
+    if writer.context is not None:
+        await pipeline_runner.to_thread(shutil.rmtree, writer.context["staging_root"], True)
+
+async def api_manager_async(simulation_name: str, simulation_description: str, use_cache: bool = True) -> tuple[bool, Union[str, None]]:
+    from simulation_api_async import pipeline_runner
     print(f"\n--- Starting Process for Simulation: '{simulation_name}' ---")
     print(f"Description received: \"{simulation_description}\"")
     print("\n1. Validating and formatting description with secondary model...")
-    formatted_prompt, second_input_tk, second_output_tk = call_secondary_model(simulation_description)
+    formatted_prompt, second_input_tk, second_output_tk = await call_secondary_model_async(simulation_description, simulation_name)
     if formatted_prompt.startswith("Error:") or not formatted_prompt:
          error_msg = f"Error from validation model: {formatted_prompt}. Possible causes: Invalid API Key, connection issue, model unavailable/misconfigured, or required models not set in .env."
          print(f"Critical error from secondary/validation model: {error_msg}")
@@ -911,11 +897,12 @@ def api_manager(simulation_name: str, simulation_description: str, use_cache: bo
     print(f"Description validated and formatted:\n{formatted_prompt}")
     final_response = None
     cache_hit = False
+    writer = None
     total_input_tokens = second_input_tk
     total_output_tokens = second_output_tk
     if use_cache:
         print("\n2. Searching response cache...")
-        cached_response = get_cached_response(formatted_prompt)
+        cached_response = await pipeline_runner.to_thread(get_cached_response, formatted_prompt)
         if cached_response:
             print("   Response found in cache.")
             final_response = cached_response
@@ -925,28 +912,35 @@ def api_manager(simulation_name: str, simulation_description: str, use_cache: bo
     if not final_response:
         if not cache_hit and use_cache:
              print("   Response not found in cache.")
-        print("   Generating code with primary model...")
-        primary_response, primary_input_tk, primary_output_tk = call_primary_model(formatted_prompt)
+        print("   Generating code with primary model (each script is written as soon as it is complete)...")
+        from simulation_codeblocks import StreamedCodeWriter
+        writer = StreamedCodeWriter(pipeline_runner, lambda: prepare_streamed_import(simulation_name), write_streamed_script)
+        primary_response, primary_input_tk, primary_output_tk = await call_primary_model_async(formatted_prompt, simulation_name, on_text=writer.feed)
         total_input_tokens += primary_input_tk
         total_output_tokens += primary_output_tk
         if primary_response.startswith("Error:") or not primary_response:
             error_msg = f"Critical error from primary model: {primary_response}. Check API Key/connection/Primary Model ID ('{FINE_TUNED_MODEL_NAME}')."
             print("Error: " + error_msg)
+            await discard_streamed_scripts(writer)
             return False, error_msg
         if "ERROR INVALID QUESTION FORMAT" in primary_response.upper():
              error_msg = f"Format Error: The primary model rejected the formatted prompt:\n'{formatted_prompt}'\nThis might indicate an issue with the validation model's output or the primary model's training."
              print("Error: " + error_msg)
+             await discard_streamed_scripts(writer)
              return False, error_msg
         final_response = primary_response
         print("   Code generated.")
         if use_cache and RESPONSES_CSV:
-            write_response_to_csv(formatted_prompt, final_response, total_input_tokens, total_output_tokens)
+            await pipeline_runner.to_thread(write_response_to_csv, formatted_prompt, final_response, total_input_tokens, total_output_tokens)
     if not final_response:
          error_msg = "Critical Error: No final response obtained (neither from cache nor API)."
          print(error_msg)
          return False, error_msg
     print("\n3. Extracting and formatting C# codes...")
-    codes = separar_codigos_por_archivo(final_response)
+    if writer is not None:
+        codes = await writer.finish()
+    else:
+        codes = await pipeline_runner.to_thread(separar_codigos_por_archivo, final_response)
     if not codes:
         response_preview = final_response[:200].replace('\n', ' ') + ("..." if len(final_response) > 200 else "")
         error_msg = f"Code Extraction Error: Could not extract valid C# code blocks matching the expected format (e.g., '1.File.cs{{...}}') from the response.\n\nResponse start:\n'{response_preview}'"
@@ -955,12 +949,30 @@ def api_manager(simulation_name: str, simulation_description: str, use_cache: bo
     print(f"   Extracted and formatted {len(codes)} scripts:")
     for filename in codes.keys():
         print(f"   - {filename}")
-    print(f"\n4. Importing codes into simulation '{simulation_name}'...")
-    success = import_codes(codes, simulation_name)
+    if writer is not None:
+        from simulation_codeblocks import CODE_BLOCK_PATTERN
+        expected_blocks = len(CODE_BLOCK_PATTERN.findall(final_response.strip()))
+        if writer.parser.block_count != expected_blocks:
+            # The cached reply is parsed in one piece next time, so the streamed files must match it exactly.
+            error_msg = f"Code Extraction Error: {writer.parser.block_count} scripts were streamed but the full response contains {expected_blocks}."
+            print("Error: " + error_msg)
+            await discard_streamed_scripts(writer)
+            return False, error_msg
+        print(f"\n4. Finishing the scripts streamed into simulation '{simulation_name}'...")
+        if writer.first_file_seconds is not None:
+            print(f"   First script was written {writer.first_file_seconds:.2f}s after the request started.")
+        success = writer.context is not None and await pipeline_runner.to_thread(publish_streamed_import, writer.context, writer.files_processed)
+    else:
+        print(f"\n4. Importing codes into simulation '{simulation_name}'...")
+        success = await pipeline_runner.to_thread(import_codes, codes, simulation_name)
     if success:
         final_sim_path = SIMULATIONS_DIR / simulation_name
         print(f"\n--- Process Completed Successfully ---")
         print(f"Simulation '{simulation_name}' created/updated in: {final_sim_path}")
+        from simulation_tokens import simulation_token_summary
+        token_summary = await pipeline_runner.to_thread(simulation_token_summary, TOKEN_LEDGER_PATH, simulation_name)
+        if token_summary:
+            print(f"Token usage recorded for '{simulation_name}': {token_summary}")
         return True, None
     else:
         error_msg = f"File Import Error: Failed to save generated scripts for '{simulation_name}'. Check console logs and previous error messages for details on specific file issues."
@@ -968,6 +980,40 @@ def api_manager(simulation_name: str, simulation_description: str, use_cache: bo
         print(error_msg)
         return False, error_msg
 
+def api_manager(simulation_name: str, simulation_description: str, use_cache: bool = True) -> tuple[bool, Union[str, None]]:
+    # Runs on the shared pipeline loop, so concurrent creations overlap their API waits.
+    from simulation_api_async import pipeline_runner
+    return pipeline_runner.run(api_manager_async(simulation_name, simulation_description, use_cache))
+
+def SimulationsBulkCreate(manifest_path: Union[str, Path], on_progress=None) -> tuple[Union[dict, None], Union[Path, None]]:
+    from simulation_bulk import read_bulk_manifest, run_bulk_creation, write_bulk_report, count_bulk_results, BULK_DEFAULT_CONCURRENCY, BULK_DEFAULT_REQUESTS_PER_MINUTE
+    from simulation_api_async import pipeline_runner
+    print(f"\n--- Starting Bulk Creation from '{manifest_path}' ---")
+    try:
+        rows, invalid = read_bulk_manifest(manifest_path)
+    except Exception as e:
+        print(f"  Error reading manifest '{manifest_path}': {e}")
+        return None, None
+    print(f"Step 1: Manifest has {len(rows)} valid rows and {len(invalid)} rejected rows.")
+    for result in invalid:
+        print(f"  Line {result['line']}: {result['error']}")
+    try:
+        SIMULATIONS_DIR.mkdir(parents=True, exist_ok=True)
+    except OSError as e:
+        print(f"  Critical Error creating simulations folder '{SIMULATIONS_DIR}': {e}. Aborting.")
+        return None, None
+    print(f"Step 2: Creating simulations ({BULK_DEFAULT_CONCURRENCY} at a time, at most {BULK_DEFAULT_REQUESTS_PER_MINUTE} starts per minute)...")
+    # Rows whose simulation folder already exists are skipped, so an interrupted manifest can simply be run again.
+    results = pipeline_runner.run(run_bulk_creation(rows, api_manager_async, SIMULATIONS_DIR, BULK_DEFAULT_CONCURRENCY,
+                                                    BULK_DEFAULT_REQUESTS_PER_MINUTE, on_progress))
+    results = results + invalid
+    report_path = write_bulk_report(results, rows, BULK_REPORT_DIR)
+    counts = count_bulk_results(results)
+    print(f"\n--- Bulk creation completed: {counts['created']} created, {counts['failed']} failed, {counts['skipped']} skipped, {counts['invalid']} invalid ---")
+    if report_path:
+        print(f"Report saved to: {report_path.resolve()}")
+    return counts, report_path
+
 def center_window(window, width, height):
     window.update_idletasks()
     screen_width = window.winfo_screenwidth()
@@ -1089,6 +1135,8 @@ def on_closing():
         print("Attempting to close associated Unity instances (if any)...")
         close_unity_thread = threading.Thread(target=ensure_unity_closed, daemon=True)
         close_unity_thread.start()
+        from simulation_api_async import pipeline_runner
+        pipeline_runner.close_in_background()
         print("Closing GUI...")
         if 'main_window' in globals() and main_window:
             main_window.after(200, main_window.destroy)
@@ -1103,7 +1151,10 @@ def disable_all_interactions():
     try:
         if 'reload_btn' in globals(): reload_btn.configure(state="disabled", fg_color=disabled_color)
         if 'graph_btn' in globals(): graph_btn.configure(state="disabled", fg_color=disabled_color)
+        if 'live_btn' in globals(): live_btn.configure(state="disabled", fg_color=disabled_color)
+        if 'compare_btn' in globals(): compare_btn.configure(state="disabled", fg_color=disabled_color)
         if 'create_btn' in globals(): create_btn.configure(state="disabled", fg_color=disabled_color)
+        if 'bulk_create_btn' in globals(): bulk_create_btn.configure(state="disabled", fg_color=disabled_color)
         if 'sidebar_frame' in globals() and sidebar_frame.winfo_exists():
             for widget in sidebar_frame.winfo_children():
                 if isinstance(widget, (ctk.CTkButton, ctk.CTkSwitch)):
@@ -1265,6 +1316,19 @@ def open_graphs_folder(simulation_name):
          print(f"Error opening graphics folder: {e}")
          traceback.print_exc()
 
+def open_batch_report_folder():
+    report_path = BATCH_REPORT_DIR.resolve()
+    try:
+        print(f"  Opening folder: {report_path}")
+        if platform.system() == "Windows":
+            os.startfile(str(report_path))
+        else:
+            messagebox.showerror("Unsupported Operation", f"Opening folders is currently only supported on Windows. Current OS: {platform.system()}")
+    except Exception as e:
+         messagebox.showerror("Error", f"Could not open the report folder:\n{report_path}\n\nError: {e}")
+         print(f"Error opening report folder: {e}")
+         traceback.print_exc()
+
 def get_folder_size(path: Union[str, Path]) -> int:
     total = 0
     try:
@@ -2013,9 +2077,12 @@ def perform_verification(show_results_box=False, on_startup=False):
     if not OPENAI_API_KEY:
         results.append("❌ API Key: Missing in .env file.")
     else:
-        openai.api_key = OPENAI_API_KEY
+        load_openai()
+        from simulation_api_session import api_session
+        api_session.configure(OPENAI_API_KEY)
         try:
             openai.Model.list(limit=1)
+            api_session.record_success()
             apis_key_ok = True
             results.append("✅ API Key: Connection successful (using v0.x API).")
             primary_model_valid = False
@@ -2040,12 +2107,15 @@ def perform_verification(show_results_box=False, on_startup=False):
                 except Exception as sec_model_error:
                     results.append(f"⚠️ Secondary Model: Error verifying ID '{SECONDARY_FINE_TUNED_MODEL_NAME}'. Error: {type(sec_model_error).__name__}")
         except AuthenticationError_v0 as auth_err:
+             api_session.record_failure(auth_err)
              results.append(f"❌ API Key: Authentication failed. Invalid or expired key? Error: {auth_err}")
              apis_key_ok = False; apis_models_ok = False
         except APIConnectionError_v0 as conn_err:
+             api_session.record_failure(conn_err)
              results.append(f"❌ API Connection: Failed to connect to OpenAI. Check network/firewall. Error: {conn_err}")
              apis_key_ok = False; apis_models_ok = False
         except Exception as api_err:
+             api_session.record_failure(api_err)
              results.append(f"❌ API Error: Unexpected error during API verification. Error: {type(api_err).__name__}: {api_err}")
              apis_key_ok = False; apis_models_ok = False
              print(f"Unexpected API verification error: {api_err}")
@@ -2100,7 +2170,7 @@ def open_config_window():
     config_win = ctk.CTkToplevel(main_window)
     config_win.title("Settings (.env Configuration)")
     apply_icon(config_win)
-    center_window(config_win, 700, 200)
+    center_window(config_win, 700, 240)
     config_win.resizable(False, False)
     config_win.transient(main_window)
     config_win.grab_set()
@@ -2143,6 +2213,10 @@ def open_config_window():
         browse_button.grid(row=row_index, column=2, padx=(5, 0), pady=5)
     create_row(frame, 0, "Unity Executable:", "UNITY_EXECUTABLE", "unity_exe", browse_for_file=True)
     create_row(frame, 1, "Unity Projects Folder:", "UNITY_PROJECTS_PATH", "projects_path", browse_for_file=False)
+    ctk.CTkLabel(frame, text="Statistics Output:", anchor="w", font=APP_FONT).grid(row=2, column=0, padx=(0, 10), pady=5, sticky="w")
+    report_format_var = ctk.StringVar(value=get_stats_report_format())
+    report_format_selector = ctk.CTkSegmentedButton(frame, values=STATS_REPORT_FORMATS, variable=report_format_var, font=APP_FONT)
+    report_format_selector.grid(row=2, column=1, padx=5, pady=5, sticky="w")
     button_frame_bottom = ctk.CTkFrame(config_win, fg_color="transparent")
     button_frame_bottom.pack(fill="x", padx=20, pady=(0, 20))
     button_frame_bottom.columnconfigure(0, weight=1)
@@ -2165,6 +2239,7 @@ def open_config_window():
                 f.write(f"OPENAI_API_KEY={api_key}\n")
                 f.write(f"FINE_TUNED_MODEL_NAME={model1}\n")
                 f.write(f"2ND_FINE_TUNED_MODEL_NAME={model2}\n")
+                f.write(f"STATS_REPORT_FORMAT={report_format_var.get()}\n")
             messagebox.showinfo("Success", "Settings saved to .env file.\nRe-running verification...", parent=config_win)
             config_win.destroy()
             if 'main_window' in globals() and main_window:
@@ -2259,13 +2334,18 @@ def populate_simulations():
     cleanup_simulation_logger_data(actual_sim_names)
     all_simulations_data.sort(key=lambda x: x.get('name', '').lower())
     filter_simulations()
+    start_sparkline_worker()
     status_msg = f"List refreshed. Found {len(all_simulations_data)} total simulation(s)."
     if last_simulation_loaded:
          status_msg += f" ('{last_simulation_loaded}' is loaded)"
     if callable(globals().get('update_status')): update_status(status_msg)
     if callable(globals().get('update_button_states')): update_button_states()
+    if startup_profiler.enabled and "first_populate_simulations" not in startup_profiler.marks:
+        startup_profiler.mark("first_populate_simulations")
+        startup_profiler.write()
 
 def filter_simulations(event=None):
+    from simulation_sparklines import format_sparkline_cell
     if 'sim_tree' not in globals() or 'search_entry' not in globals():
         return
     search_term = search_entry.get().lower().strip()
@@ -2293,6 +2373,7 @@ def filter_simulations(event=None):
                                 sim_data["name"],
                                 sim_data["creation"],
                                 sim_data["last_opened"],
+                                format_sparkline_cell(sparkline_summaries.get(sim_data["name"])),
                                 loaded_symbol,
                                 play_symbol,
                                 delete_symbol
@@ -2315,6 +2396,40 @@ def filter_simulations(event=None):
         sort_column(sim_tree, last_sort_column, current_reverse)
     update_button_states()
 
+def apply_sparkline_summary(sim_name: str, summary: dict):
+    from simulation_sparklines import format_sparkline_cell
+    sparkline_summaries[sim_name] = summary
+    try:
+        if 'sim_tree' in globals() and sim_tree.exists(sim_name):
+            sim_tree.set(sim_name, "col_trend", format_sparkline_cell(summary))
+    except tk.TclError as e:
+        print(f"Warning: Could not update sparkline for '{sim_name}': {e}")
+
+def start_sparkline_worker():
+    global sparkline_generation
+    sparkline_generation += 1
+    generation = sparkline_generation
+    sim_names = [sim["name"] for sim in all_simulations_data]
+    def worker():
+        from simulation_sparklines import build_sparkline_summaries
+        # Cached summaries are read here too, so the list is drawn without touching any simulation data.
+        product_base_path = find_unity_persistent_path(UNITY_PRODUCT_NAME)
+        if not product_base_path:
+            return
+        csv_paths = {name: product_base_path / LOG_SUBFOLDER / name / CSV_FILENAME for name in sim_names}
+        csv_paths = {name: path for name, path in csv_paths.items() if path.is_file()}
+        def on_ready(sim_name, summary):
+            if generation == sparkline_generation and 'main_window' in globals() and main_window.winfo_exists():
+                main_window.after(0, apply_sparkline_summary, sim_name, summary)
+        try:
+            built = build_sparkline_summaries(csv_paths, on_ready, should_stop=lambda: generation != sparkline_generation)
+            if built:
+                print(f"Built sparkline summaries for {built} simulation(s).")
+        except Exception as e:
+            print(f"Error building sparkline summaries: {e}")
+            traceback.print_exc()
+    threading.Thread(target=worker, daemon=True).start()
+
 def clear_search():
     if 'search_entry' in globals():
         search_entry.delete(0, 'end')
@@ -2335,6 +2450,8 @@ def update_button_states():
     exit_enabled = not is_build_running
     reload_enabled = not is_build_running
     graph_enabled = has_selection and not is_build_running
+    live_enabled = has_selection and not is_build_running
+    compare_enabled = not is_build_running
     create_enabled = can_create and not is_build_running
     search_enabled = not is_build_running
     mode_idx = get_color_mode_index()
@@ -2342,7 +2459,10 @@ def update_button_states():
     try:
         if 'reload_btn' in globals(): reload_btn.configure(state=get_state(reload_enabled), fg_color=BTN_RELOAD_FG_COLOR[mode_idx] if reload_enabled else disabled_fg)
         if 'graph_btn' in globals(): graph_btn.configure(state=get_state(graph_enabled), fg_color=BTN_GRAPH_FG_COLOR[mode_idx] if graph_enabled else disabled_fg)
+        if 'live_btn' in globals(): live_btn.configure(state=get_state(live_enabled), fg_color=BTN_GRAPH_FG_COLOR[mode_idx] if live_enabled else disabled_fg)
+        if 'compare_btn' in globals(): compare_btn.configure(state=get_state(compare_enabled), fg_color=BTN_GRAPH_FG_COLOR[mode_idx] if compare_enabled else disabled_fg)
         if 'create_btn' in globals(): create_btn.configure(state=get_state(create_enabled), fg_color=BTN_CREATE_FG_COLOR[mode_idx] if create_enabled else disabled_fg)
+        if 'bulk_create_btn' in globals(): bulk_create_btn.configure(state=get_state(create_enabled), fg_color=BTN_CREATE_FG_COLOR[mode_idx] if create_enabled else disabled_fg)
         if 'settings_btn' in globals(): settings_btn.configure(state=get_state(settings_enabled), fg_color=BTN_SETTINGS_FG_COLOR[mode_idx] if settings_enabled else disabled_fg)
         if 'verify_btn' in globals(): verify_btn.configure(state=get_state(verify_enabled), fg_color=BTN_VERIFY_FG_COLOR[mode_idx] if verify_enabled else disabled_fg)
         if 'unity_down_btn' in globals(): unity_down_btn.configure(state=get_state(unity_down_enabled), fg_color=BTN_UNITY_DOWN_FG_COLOR[mode_idx] if unity_down_enabled else disabled_fg)
@@ -2444,7 +2564,24 @@ def on_show_graphs_thread():
     graph_thread = threading.Thread(target=show_graphs_logic, args=(sim_name,), daemon=True)
     graph_thread.start()
 
+def on_show_live_stats():
+    selected_items = sim_tree.selection()
+    if not selected_items:
+        messagebox.showwarning("No Selection", "Please select a simulation from the list to view its live statistics.")
+        return
+    sim_name = sim_tree.item(selected_items[0], "values")[0]
+    simulation_data_dir = find_simulation_data_path(sim_name)
+    if not simulation_data_dir:
+        messagebox.showerror("Error", f"Could not find the data directory for simulation '{sim_name}'.")
+        return
+    print(f"Opening live statistics for '{sim_name}'...")
+    update_status(f"Live statistics for '{sim_name}' will refresh as the simulation writes rows.")
+    LiveStatsWindow(main_window, sim_name, simulation_data_dir / CSV_FILENAME)
+
 def show_graphs_logic(sim_name: str):
+    from simulation_stats import csv_fingerprint
+    from simulation_plots import graphs_are_current
+    from simulation_report import html_report_is_current, HTML_REPORT_FILENAME
     if not callable(globals().get('find_simulation_data_path')) or \
        not callable(globals().get('SimulationGraphics')) or \
        not callable(globals().get('open_graphs_folder')):
@@ -2466,12 +2603,24 @@ def show_graphs_logic(sim_name: str):
                                  f"The required statistics file ('{CSV_FILENAME}') for simulation '{sim_name}' was not found in:\n{simulation_data_dir}\n\nCannot generate graphs.")
             if callable(globals().get('update_status')): update_status(f"Error: Statistics CSV file missing for '{sim_name}'.")
             return
-        if callable(globals().get('update_status')): update_status(f"Generating graphs for '{sim_name}'...")
-        print(f"  Calling SimulationGraphics for '{sim_name}'...")
-        SimulationGraphics(sim_name)
-        if callable(globals().get('update_status')): update_status(f"Graph generation attempted. Opening graphs folder for '{sim_name}'...")
-        print(f"  Calling open_graphs_folder for '{sim_name}'...")
-        open_graphs_folder(sim_name)
+        report_format = get_stats_report_format()
+        html_path = graphs_dir / HTML_REPORT_FILENAME
+        graphs_current = report_format == "html" or graphs_are_current(csv_path, graphs_dir)
+        html_current = report_format == "png" or html_report_is_current(html_path, csv_fingerprint(csv_path))
+        if graphs_current and html_current:
+            print(f"  Statistics for '{sim_name}' are up to date, opening them directly.")
+            if callable(globals().get('update_status')): update_status(f"Statistics for '{sim_name}' are up to date. Opening...")
+        else:
+            if callable(globals().get('update_status')): update_status(f"Generating statistics for '{sim_name}'...")
+            print(f"  Calling SimulationGraphics for '{sim_name}' ({report_format})...")
+            SimulationGraphics(sim_name, report_format)
+            if callable(globals().get('update_status')): update_status(f"Statistics generation attempted. Opening results for '{sim_name}'...")
+        if report_format in ("html", "both") and html_path.is_file():
+            print(f"  Opening interactive report: {html_path}")
+            webbrowser.open(html_path.resolve().as_uri())
+        if report_format in ("png", "both"):
+            print(f"  Calling open_graphs_folder for '{sim_name}'...")
+            open_graphs_folder(sim_name)
         if callable(globals().get('update_status')): update_status(f"Graph process completed for '{sim_name}'.")
     except FileNotFoundError as e:
         messagebox.showerror("File Error", f"A required file was not found during the graph process:\n{e}")
@@ -2494,6 +2643,78 @@ def show_graphs_logic(sim_name: str):
         except Exception as e:
             print(f"Error in finally block attempting to re-enable UI: {e}")
 
+def on_compare_simulations_thread():
+    global is_build_running
+    if is_build_running:
+        print("Compare request ignored: Build/Load in progress.")
+        return
+    disable_all_interactions()
+    update_status("Comparing statistics across all simulations...")
+    compare_thread = threading.Thread(target=compare_simulations_logic, daemon=True)
+    compare_thread.start()
+
+def compare_simulations_logic():
+    from simulation_batch import BATCH_TABLE_FILENAME
+    try:
+        chart_count = SimulationsBatchReport()
+        if chart_count > 0 or (BATCH_REPORT_DIR / BATCH_TABLE_FILENAME).is_file():
+            update_status(f"Batch report ready ({chart_count} charts). Opening report folder...")
+            open_batch_report_folder()
+        else:
+            update_status("Batch report: no simulation statistics available to compare.")
+            messagebox.showinfo("No Statistics", "None of the simulations has statistics data yet.\nRun a simulation first, then compare again.")
+    except Exception as e:
+        messagebox.showerror("Unexpected Error", f"An unexpected error occurred while comparing simulations:\n{type(e).__name__}: {e}")
+        update_status("Error building the batch report. Check console.")
+        print(f"compare_simulations_logic - Unexpected Exception: {e}")
+        traceback.print_exc()
+    finally:
+        if 'main_window' in globals() and main_window is not None and main_window.winfo_exists():
+            main_window.after(0, enable_all_interactions)
+
+def on_bulk_create_simulations():
+    global is_build_running
+    if is_build_running:
+        print("Bulk create request ignored: Build/Load in progress.")
+        return
+    if not apis_key_ok or not apis_models_ok:
+        messagebox.showerror("API Configuration Error", "Cannot create simulations: Invalid or unverified OpenAI API Key or Primary Model ID.\nPlease check Settings and Verify Config.")
+        return
+    manifest_path = filedialog.askopenfilename(title="Select Simulation Manifest",
+                                               filetypes=[("Simulation manifests", "*.jsonl *.csv"), ("JSON Lines", "*.jsonl"), ("CSV", "*.csv"), ("All files", "*.*")])
+    if not manifest_path:
+        update_status("Bulk creation cancelled.")
+        return
+    disable_all_interactions()
+    update_status(f"Starting bulk creation from '{Path(manifest_path).name}'...")
+    bulk_thread = threading.Thread(target=bulk_create_simulations_logic, args=(manifest_path,), daemon=True)
+    bulk_thread.start()
+
+def bulk_create_simulations_logic(manifest_path: str):
+    def report_progress(result, done, total):
+        update_status(f"Bulk creation: {done}/{total} ({result['name']}: {result['status']})")
+    try:
+        counts, report_path = SimulationsBulkCreate(manifest_path, on_progress=report_progress)
+        if counts is None:
+            update_status("Bulk creation failed. Check console.")
+            main_window.after(0, lambda: messagebox.showerror("Bulk Creation Failed", f"Could not read the manifest:\n{manifest_path}\n\nCheck the console for details."))
+            return
+        global all_simulations_data
+        all_simulations_data = get_simulations()
+        main_window.after(50, populate_simulations)
+        summary = f"{counts['created']} created, {counts['failed']} failed, {counts['skipped']} skipped, {counts['invalid']} invalid."
+        update_status(f"Bulk creation finished: {summary}")
+        details = f"\n\nReport: {report_path.resolve()}" if report_path else ""
+        main_window.after(0, lambda: messagebox.showinfo("Bulk Creation Finished", summary + details))
+    except Exception as e:
+        messagebox.showerror("Unexpected Error", f"An unexpected error occurred during bulk creation:\n{type(e).__name__}: {e}")
+        update_status("Error during bulk creation. Check console.")
+        print(f"bulk_create_simulations_logic - Unexpected Exception: {e}")
+        traceback.print_exc()
+    finally:
+        if 'main_window' in globals() and main_window is not None and main_window.winfo_exists():
+            main_window.after(0, enable_all_interactions)
+
 def on_create_simulation():
     global is_build_running
     if is_build_running:
@@ -2622,6 +2843,9 @@ def handle_tree_motion(event):
                     tooltip_text = f"Load / Run Simulation '{simulation_name}'"
                 elif column_name == "col_delete":
                     tooltip_text = f"Delete Simulation '{simulation_name}'"
+                elif column_name == "col_trend":
+                    from simulation_sparklines import describe_sparkline_summary
+                    tooltip_text = describe_sparkline_summary(sparkline_summaries.get(simulation_name))
                 elif column_name == "col_loaded":
                     cell_value = sim_tree.set(item_id, column=column_name)
                     if cell_value == loaded_indicator_text:
@@ -2740,7 +2964,10 @@ def toggle_appearance_mode():
         if 'exit_btn' in globals(): exit_btn.configure(fg_color=BTN_EXIT_FG_COLOR[mode_idx], hover_color=BTN_EXIT_HOVER_COLOR[mode_idx], text_color=BTN_EXIT_TEXT_COLOR[mode_idx])
         if 'reload_btn' in globals(): reload_btn.configure(fg_color=BTN_RELOAD_FG_COLOR[mode_idx], hover_color=BTN_RELOAD_HOVER_COLOR[mode_idx], text_color=BTN_RELOAD_TEXT_COLOR[mode_idx])
         if 'graph_btn' in globals(): graph_btn.configure(fg_color=BTN_GRAPH_FG_COLOR[mode_idx], hover_color=BTN_GRAPH_HOVER_COLOR[mode_idx], text_color=BTN_GRAPH_TEXT_COLOR[mode_idx])
+        if 'live_btn' in globals(): live_btn.configure(fg_color=BTN_GRAPH_FG_COLOR[mode_idx], hover_color=BTN_GRAPH_HOVER_COLOR[mode_idx], text_color=BTN_GRAPH_TEXT_COLOR[mode_idx])
+        if 'compare_btn' in globals(): compare_btn.configure(fg_color=BTN_GRAPH_FG_COLOR[mode_idx], hover_color=BTN_GRAPH_HOVER_COLOR[mode_idx], text_color=BTN_GRAPH_TEXT_COLOR[mode_idx])
         if 'create_btn' in globals(): create_btn.configure(fg_color=BTN_CREATE_FG_COLOR[mode_idx], hover_color=BTN_CREATE_HOVER_COLOR[mode_idx], text_color=BTN_CREATE_TEXT_COLOR[mode_idx])
+        if 'bulk_create_btn' in globals(): bulk_create_btn.configure(fg_color=BTN_CREATE_FG_COLOR[mode_idx], hover_color=BTN_CREATE_HOVER_COLOR[mode_idx], text_color=BTN_CREATE_TEXT_COLOR[mode_idx])
         if 'clear_search_btn' in globals(): clear_search_btn.configure(fg_color=BTN_CLEARSEARCH_FG_COLOR[mode_idx], hover_color=BTN_CLEARSEARCH_HOVER_COLOR[mode_idx], text_color=BTN_CLEARSEARCH_TEXT_COLOR[mode_idx])
         update_button_states()
         print("Widget colors updated for new theme.")
@@ -2750,6 +2977,7 @@ def toggle_appearance_mode():
         print(f"Error updating widget colors for theme: {e}")
 
 main_window = ctk.CTk()
+startup_profiler.mark("window_created")
 apply_icon(main_window)
 main_window.title("Unity Simulation Manager v1.0")
 initial_width=1050
@@ -2851,6 +3079,57 @@ class UnityHubInfoDialog(ctk.CTkToplevel):
             print(f"Error opening URL in browser: {e}")
             messagebox.showerror("Browser Error", f"Could not open the download page in your browser:\n{e}", parent=self)
 
+class LiveStatsWindow(ctk.CTkToplevel):
+    def __init__(self, parent, simulation_name, csv_path):
+        from simulation_stats import StatsTail
+        from simulation_live import LiveStatsChart, LIVE_BACKLOG_BYTES
+        from simulation_growth_online import OnlineGrowthEstimator, read_requested_doubling_times
+        super().__init__(parent)
+        self.title(f"Live Statistics - {simulation_name}")
+        apply_icon(self)
+        self._simulation_name = simulation_name
+        self._tail = StatsTail(csv_path, backlog_bytes=LIVE_BACKLOG_BYTES)
+        self._generation = self._tail.generation
+        self._after_id = None
+        self._requested_doubling_times = read_requested_doubling_times(SIMULATIONS_DIR / simulation_name)
+        self._growth = OnlineGrowthEstimator([])
+        self.summary_label = ctk.CTkLabel(self, text="Waiting for statistics rows...", font=APP_FONT, anchor="w")
+        self.summary_label.pack(fill="x", padx=10, pady=(10, 0))
+        self.growth_label = ctk.CTkLabel(self, text="", font=APP_FONT, anchor="w")
+        self.growth_label.pack(fill="x", padx=10, pady=(0, 5))
+        self.chart = LiveStatsChart(self)
+        self.chart.widget().pack(fill="both", expand=True, padx=10, pady=(0, 10))
+        center_window(self, 820, 630)
+        self.protocol("WM_DELETE_WINDOW", self.close)
+        self.bind("<Escape>", lambda e: self.close())
+        self.refresh()
+
+    def refresh(self):
+        from simulation_live import LIVE_REFRESH_MS
+        from simulation_growth_online import OnlineGrowthEstimator
+        try:
+            columns = self._tail.poll()
+            if self._tail.generation != self._generation:
+                self._generation = self._tail.generation
+                self.chart.reset()
+                self._growth = OnlineGrowthEstimator(self._tail.organism_columns)
+            if columns:
+                self.chart.append(columns)
+                self._growth.update(columns)
+            self.chart.redraw()
+            self.summary_label.configure(text=self.chart.summary())
+            if self._growth.rows:
+                self.growth_label.configure(text=self._growth.summary(self._requested_doubling_times))
+        except Exception as e:
+            print(f"Error refreshing live statistics for '{self._simulation_name}': {e}")
+        self._after_id = self.after(LIVE_REFRESH_MS, self.refresh)
+
+    def close(self):
+        if self._after_id is not None:
+            self.after_cancel(self._after_id)
+            self._after_id = None
+        self.destroy()
+
 def handle_unity_download_click():
     if not 'UNITY_REQUIRED_VERSION_STRING' in globals() or not UNITY_REQUIRED_VERSION_STRING:
         print("Error: UNITY_REQUIRED_VERSION_STRING constant is not defined.")
@@ -2955,7 +3234,7 @@ tree_frame = ctk.CTkFrame(main_content_frame, corner_radius=5)
 tree_frame.grid(row=2, column=0, sticky="nsew", padx=10, pady=5)
 tree_frame.columnconfigure(0, weight=1)
 tree_frame.rowconfigure(0, weight=1)
-columns = ("col_name", "col_created", "col_last_used", "col_loaded", "col_load", "col_delete")
+columns = ("col_name", "col_created", "col_last_used", "col_trend", "col_loaded", "col_load", "col_delete")
 sim_tree = ttk.Treeview(tree_frame, columns=columns, show="headings", selectmode="browse")
 sim_tree.heading("col_name", text="Simulation Name", anchor='w')
 sim_tree.column("col_name", width=250, minwidth=150, anchor="w", stretch=tk.YES)
@@ -2963,6 +3242,8 @@ sim_tree.heading("col_created", text="Created", anchor='center')
 sim_tree.column("col_created", width=120, minwidth=100, anchor="center", stretch=tk.NO)
 sim_tree.heading("col_last_used", text="Last Used", anchor='center')
 sim_tree.column("col_last_used", width=120, minwidth=100, anchor="center", stretch=tk.NO)
+sim_tree.heading("col_trend", text="Population / FPS", anchor='center')
+sim_tree.column("col_trend", width=200, minwidth=120, anchor="center", stretch=tk.NO)
 sim_tree.heading("col_loaded", text="Loaded", anchor='center')
 sim_tree.column("col_loaded", width=70, minwidth=60, stretch=tk.NO, anchor="center")
 sim_tree.heading("col_load", text="Load/Run", anchor='center')
@@ -2970,10 +3251,10 @@ sim_tree.column("col_load", width=90, minwidth=80, stretch=tk.NO, anchor="center
 sim_tree.heading("col_delete", text="Delete", anchor='center')
 sim_tree.column("col_delete", width=80, minwidth=70, stretch=tk.NO, anchor="center")
 last_sort_column = None
-sort_order = {col: False for col in columns if col not in ["col_load", "col_delete", "col_loaded"]}
+sort_order = {col: False for col in columns if col not in ["col_load", "col_delete", "col_loaded", "col_trend"]}
 
 def sort_column(tree, col, reverse):
-    if col in ["col_load", "col_delete", "col_loaded"]:
+    if col in ["col_load", "col_delete", "col_loaded", "col_trend"]:
         return
     global last_sort_column, sort_order
     try:
@@ -3000,7 +3281,7 @@ def sort_column(tree, col, reverse):
         print(f"Error sorting column '{col}': {e}")
 
 for col_name in columns:
-    if col_name not in ["col_load", "col_delete", "col_loaded"]:
+    if col_name not in ["col_load", "col_delete", "col_loaded", "col_trend"]:
         current_text = sim_tree.heading(col_name)['text']
         anchor_dir = 'w' if col_name=='col_name' else 'center'
         sim_tree.heading(col_name, text=current_text, command=lambda c=col_name: sort_column(sim_tree, c, False), anchor=anchor_dir)
@@ -3020,7 +3301,10 @@ button_frame_bottom.columnconfigure(0, weight=1)
 button_frame_bottom.columnconfigure(1, weight=0)
 button_frame_bottom.columnconfigure(2, weight=0)
 button_frame_bottom.columnconfigure(3, weight=0)
-button_frame_bottom.columnconfigure(4, weight=1)
+button_frame_bottom.columnconfigure(4, weight=0)
+button_frame_bottom.columnconfigure(5, weight=0)
+button_frame_bottom.columnconfigure(6, weight=0)
+button_frame_bottom.columnconfigure(7, weight=1)
 button_height=35
 reload_btn = ctk.CTkButton(button_frame_bottom, text="Reload List", command=populate_simulations, font=APP_FONT, height=button_height,
                            fg_color=BTN_RELOAD_FG_COLOR[mode_idx], hover_color=BTN_RELOAD_HOVER_COLOR[mode_idx], text_color=BTN_RELOAD_TEXT_COLOR[mode_idx])
@@ -3028,9 +3312,18 @@ reload_btn.grid(row=0, column=1, padx=10, pady=5)
 graph_btn = ctk.CTkButton(button_frame_bottom, text="Simulation Statistics", command=on_show_graphs_thread, font=APP_FONT, height=button_height,
                           fg_color=BTN_GRAPH_FG_COLOR[mode_idx], hover_color=BTN_GRAPH_HOVER_COLOR[mode_idx], text_color=BTN_GRAPH_TEXT_COLOR[mode_idx])
 graph_btn.grid(row=0, column=2, padx=10, pady=5)
+live_btn = ctk.CTkButton(button_frame_bottom, text="Live Statistics", command=on_show_live_stats, font=APP_FONT, height=button_height,
+                         fg_color=BTN_GRAPH_FG_COLOR[mode_idx], hover_color=BTN_GRAPH_HOVER_COLOR[mode_idx], text_color=BTN_GRAPH_TEXT_COLOR[mode_idx])
+live_btn.grid(row=0, column=3, padx=10, pady=5)
+compare_btn = ctk.CTkButton(button_frame_bottom, text="Compare All", command=on_compare_simulations_thread, font=APP_FONT, height=button_height,
+                            fg_color=BTN_GRAPH_FG_COLOR[mode_idx], hover_color=BTN_GRAPH_HOVER_COLOR[mode_idx], text_color=BTN_GRAPH_TEXT_COLOR[mode_idx])
+compare_btn.grid(row=0, column=4, padx=10, pady=5)
 create_btn = ctk.CTkButton(button_frame_bottom, text="Create Sim (API)", command=on_create_simulation, font=APP_FONT, height=button_height,
                            fg_color=BTN_CREATE_FG_COLOR[mode_idx], hover_color=BTN_CREATE_HOVER_COLOR[mode_idx], text_color=BTN_CREATE_TEXT_COLOR[mode_idx])
-create_btn.grid(row=0, column=3, padx=10, pady=5)
+create_btn.grid(row=0, column=5, padx=10, pady=5)
+bulk_create_btn = ctk.CTkButton(button_frame_bottom, text="Bulk Create (API)", command=on_bulk_create_simulations, font=APP_FONT, height=button_height,
+                                fg_color=BTN_CREATE_FG_COLOR[mode_idx], hover_color=BTN_CREATE_HOVER_COLOR[mode_idx], text_color=BTN_CREATE_TEXT_COLOR[mode_idx])
+bulk_create_btn.grid(row=0, column=6, padx=10, pady=5)
 
 status_frame = ctk.CTkFrame(main_window, height=25, corner_radius=0)
 status_frame.grid(row=1, column=0, columnspan=2, sticky="ew", padx=0, pady=0)
@@ -3038,10 +3331,13 @@ status_label = ctk.CTkLabel(status_frame, text="Initializing...", anchor="w", fo
 status_label.pack(side="left", fill="x", expand=True, padx=10, pady=3)
 
 if __name__ == "__main__":
+    startup_profiler.mark("window_built")
+    main_window.after_idle(startup_profiler.mark, "mainloop_first_idle")
     main_window.after(10, update_treeview_style)
     update_button_states()
     update_status("Performing initial configuration verification...")
-    initial_verify_thread = threading.Thread(target=perform_verification, args=(False, True), daemon=True)
+    initial_verify_thread = threading.Thread(target=startup_profiler.timed("perform_verification", perform_verification), args=(False, True), daemon=True)
     initial_verify_thread.start()
+    main_window.after(LAZY_PREWARM_DELAY_MS, start_background_prewarm)
     main_window.protocol("WM_DELETE_WINDOW", on_closing)
     main_window.mainloop()
\ No newline at end of file
@@ -0,0 +1,71 @@
+import argparse
+import sys
+import tempfile
+import threading
+import time
+from http.server import ThreadingHTTPServer
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from api_session_benchmark import StubOpenAIHandler, reset_counts
+from simulation_api_async import ApiPipelineRunner
+from simulation_api_session import ApiSessionManager
+
+
+def pipeline(runner: ApiPipelineRunner, session: ApiSessionManager, output_folder: Path, index: int):
+    # Same shape as api_manager_async: validate, look up the cache, generate, then write the scripts.
+    async def run():
+        messages = [{"role": "user", "content": f"simulation {index}"}]
+        await runner.api_call(session.achat_completion, model="stub-validator", messages=messages, temperature=0, timeout=30)
+        cache = output_folder / "Responses.csv"
+        await runner.to_thread(lambda: cache.exists() and cache.read_text(encoding="utf-8"))
+        response = await runner.api_call(session.achat_completion, model="stub-model", messages=messages, temperature=0, timeout=30)
+        folder = output_folder / f"Sim{index}"
+        def write_scripts():
+            folder.mkdir(parents=True, exist_ok=True)
+            for script in range(4):
+                (folder / f"{script}.cs").write_text(response.choices[0].message["content"] * 200, encoding="utf-8")
+        await runner.to_thread(write_scripts)
+    return run()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare one-at-a-time creations with the overlapped asyncio pipeline against a local stub server.")
+    parser.add_argument("--simulations", type=int, default=8)
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--latency-ms", type=float, default=250.0, help="Artificial server latency per request.")
+    args = parser.parse_args()
+
+    StubOpenAIHandler.latency_seconds = args.latency_ms / 1000.0
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubOpenAIHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    session = ApiSessionManager()
+    session.configure("sk-stub", api_base=f"http://127.0.0.1:{server.server_port}/v1")
+    session.record_success()
+    runner = ApiPipelineRunner(concurrency=args.concurrency)
+
+    with tempfile.TemporaryDirectory() as folder:
+        reset_counts()
+        start = time.perf_counter()
+        for index in range(args.simulations):
+            runner.run(pipeline(runner, session, Path(folder) / "serial", index))
+        serial_seconds = time.perf_counter() - start
+
+        reset_counts()
+        start = time.perf_counter()
+        futures = [runner.submit(pipeline(runner, session, Path(folder) / "overlapped", index)) for index in range(args.simulations)]
+        for future in futures:
+            future.result()
+        overlapped_seconds = time.perf_counter() - start
+        connections = StubOpenAIHandler.counts["connections"]
+    runner.close()
+    server.shutdown()
+
+    print(f"{'One creation at a time:':<32} {serial_seconds:7.3f}s")
+    print(f"{f'Overlapped (concurrency {args.concurrency}):':<32} {overlapped_seconds:7.3f}s  (new connections: {connections})")
+    print(f"Speed-up: {serial_seconds / max(overlapped_seconds, 1e-9):.2f}x for {args.simulations} simulations")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,112 @@
+import argparse
+import json
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from simulation_api_session import ApiSessionManager
+
+
+class StubOpenAIHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    latency_seconds = 0.0
+    counts = {"models": 0, "chat": 0, "connections": 0}
+    lock = threading.Lock()
+
+    def setup(self):
+        super().setup()
+        with self.lock:
+            self.counts["connections"] += 1
+
+    def log_message(self, *args):
+        pass
+
+    def _reply(self, payload: dict):
+        body = json.dumps(payload).encode("utf-8")
+        time.sleep(self.latency_seconds)
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        with self.lock:
+            self.counts["models"] += 1
+        self._reply({"object": "list", "data": [{"id": "stub-model", "object": "model", "owned_by": "stub"}]})
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        with self.lock:
+            self.counts["chat"] += 1
+        self._reply({"id": "chatcmpl-stub", "object": "chat.completion", "model": "stub-model",
+                     "choices": [{"index": 0, "finish_reason": "stop", "message": {"role": "assistant", "content": "ok"}}],
+                     "usage": {"prompt_tokens": 10, "completion_tokens": 1, "total_tokens": 11}})
+
+
+def reset_counts():
+    with StubOpenAIHandler.lock:
+        for key in StubOpenAIHandler.counts:
+            StubOpenAIHandler.counts[key] = 0
+
+
+def run_in_threads(worker, calls: int, threads: int) -> float:
+    # Each creation runs on its own short-lived thread, as the manager does for API simulations.
+    start = time.perf_counter()
+    for offset in range(0, calls, threads):
+        batch = [threading.Thread(target=worker) for _ in range(min(threads, calls - offset))]
+        for thread in batch:
+            thread.start()
+        for thread in batch:
+            thread.join()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare probe-per-call API access with the pooled, health-tracked session against a local stub server.")
+    parser.add_argument("--calls", type=int, default=40)
+    parser.add_argument("--threads", type=int, default=4)
+    parser.add_argument("--latency-ms", type=float, default=40.0, help="Artificial server latency per request.")
+    args = parser.parse_args()
+
+    import openai
+    StubOpenAIHandler.latency_seconds = args.latency_ms / 1000.0
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubOpenAIHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    openai.api_base = f"http://127.0.0.1:{server.server_port}/v1"
+    openai.api_key = "sk-stub"
+    messages = [{"role": "user", "content": "ping"}]
+
+    def legacy_call():
+        openai.Model.list(limit=1)
+        openai.ChatCompletion.create(model="stub-model", messages=messages, temperature=0, timeout=30)
+
+    openai.requestssession = None
+    reset_counts()
+    legacy_seconds = run_in_threads(legacy_call, args.calls, args.threads)
+    legacy_counts = dict(StubOpenAIHandler.counts)
+
+    manager = ApiSessionManager()
+    manager.configure("sk-stub")
+
+    def managed_call():
+        manager.chat_completion(model="stub-model", messages=messages, temperature=0, timeout=30)
+
+    reset_counts()
+    managed_seconds = run_in_threads(managed_call, args.calls, args.threads)
+    managed_counts = dict(StubOpenAIHandler.counts)
+    server.shutdown()
+
+    for label, seconds, counts in (("Probe + call, per-thread sessions", legacy_seconds, legacy_counts),
+                                   ("Health-tracked pooled session", managed_seconds, managed_counts)):
+        print(f"{label:<34} {seconds:7.3f}s  {seconds / args.calls * 1000.0:7.1f} ms/call  "
+              f"probes={counts['models']:<4} completions={counts['chat']:<4} connections={counts['connections']}")
+    print(f"Saved per call: {(legacy_seconds - managed_seconds) / args.calls * 1000.0:.1f} ms ({legacy_seconds / max(managed_seconds, 1e-9):.2f}x)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
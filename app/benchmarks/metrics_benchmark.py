@@ -0,0 +1,54 @@
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from simulation_metrics import regression_metrics
+
+
+def synthetic_columns(rows: int, columns: int):
+    rng = np.random.default_rng(0)
+    times = np.linspace(0, 3600, rows)[:, None]
+    rates = rng.uniform(0.0005, 0.002, columns)
+    observed = np.round(5 * np.exp(rates * times) + rng.normal(0, 2, (rows, columns)))
+    predicted = 5 * np.exp(rates * 1.01 * times)
+    valid = rng.random((rows, columns)) > 0.05
+    return observed, predicted, valid
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check the in-house metrics against scikit-learn (when installed) and time both.")
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--columns", type=int, default=4)
+    args = parser.parse_args()
+
+    observed, predicted, valid = synthetic_columns(args.rows, args.columns)
+    start = time.perf_counter()
+    metrics = regression_metrics(observed, predicted, valid, param_count=2)
+    batched_seconds = time.perf_counter() - start
+    print(f"Batched NumPy metrics for {args.columns} columns x {args.rows:,} rows: {batched_seconds:.3f}s")
+
+    try:
+        from sklearn.metrics import r2_score, mean_squared_error, mean_absolute_error, mean_absolute_percentage_error
+    except ImportError:
+        print("scikit-learn is not installed (it is no longer a runtime dependency); skipping the comparison.")
+        return 0
+    start = time.perf_counter()
+    worst = 0.0
+    for column in range(args.columns):
+        rows = valid[:, column]
+        y, y_hat = observed[rows, column], predicted[rows, column]
+        expected = {"r_squared": r2_score(y, y_hat), "rmse": mean_squared_error(y, y_hat) ** 0.5, "mae": mean_absolute_error(y, y_hat), "mape": mean_absolute_percentage_error(y, y_hat)}
+        for name, value in expected.items():
+            worst = max(worst, abs(metrics[name][column] - value) / max(abs(value), 1e-300))
+    sklearn_seconds = time.perf_counter() - start
+    print(f"scikit-learn, one column at a time:                  {sklearn_seconds:.3f}s")
+    print(f"Largest relative difference from scikit-learn: {worst:.2e}")
+    return 0 if worst < 1e-9 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
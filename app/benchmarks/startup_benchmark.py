@@ -0,0 +1,99 @@
+import argparse
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+APP_DIR = Path(__file__).resolve().parent.parent
+# What the manager scripts imported at module top before the heavy stack was deferred.
+EAGER_MODULES = [
+    "openai", "tiktoken", "numpy", "pandas", "scipy.optimize",
+    "simulation_stats", "simulation_live", "simulation_growth_online", "simulation_plots", "simulation_fitting",
+    "simulation_models", "simulation_groupby", "simulation_batch", "simulation_report", "simulation_sparklines",
+]
+# What they still import before building the window.
+STARTUP_MODULES = ["tkinter", "customtkinter", "PIL.Image", "PIL.ImageTk", "dotenv", "psutil"]
+FIRST_PAINT_MARKER = "FIRST_PAINT"
+
+
+def _preload_code(modules):
+    lines = [f"import sys; sys.path.insert(0, {str(APP_DIR)!r})"]
+    for module in modules:
+        # A missing optional package (tiktoken on macOS builds) should not abort the measurement.
+        lines.append(f"try:\n    import {module}\nexcept ImportError:\n    pass")
+    return "\n".join(lines)
+
+
+def time_imports(modules, repeats: int) -> float:
+    code = _preload_code(modules)
+    samples = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", code], cwd=APP_DIR, check=True)
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples)
+
+
+def _first_paint_code(script: Path) -> str:
+    # Runs the script under another name, so the window is built but its __main__ block (verification thread,
+    # pre-warm, mainloop) is not; the benchmark schedules its own first-idle exit instead.
+    return "\n".join([
+        "import runpy",
+        f"manager = runpy.run_path({str(script)!r}, run_name='manager_startup_benchmark')",
+        "window = manager['main_window']",
+        "manager['update_button_states']()",
+        "def exit_after_first_paint():",
+        "    window.wait_visibility()",
+        "    window.update_idletasks()",
+        f"    print({FIRST_PAINT_MARKER!r}, flush=True)",
+        "    window.destroy()",
+        "window.after_idle(exit_after_first_paint)",
+        "window.mainloop()",
+    ])
+
+
+def time_first_paint(script: Path, preload, repeats: int):
+    code = _preload_code(preload) + "\n" + _first_paint_code(script)
+    samples = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        result = subprocess.run([sys.executable, "-c", code], cwd=APP_DIR, capture_output=True, text=True)
+        elapsed = time.perf_counter() - start
+        if FIRST_PAINT_MARKER not in result.stdout:
+            print(f"  The manager did not reach its first frame (exit code {result.returncode}):")
+            print("  " + (result.stderr.strip().splitlines() or ["no output"])[-1])
+            return None
+        samples.append(elapsed)
+    return statistics.median(samples)
+
+
+def main():
+    default_script = "Mac_main.py" if platform.system() == "Darwin" else "Windows_main.py"
+    parser = argparse.ArgumentParser(description="Measure manager time-to-first-paint with the heavy imports eager (before) and deferred (after).")
+    parser.add_argument("--script", default=default_script)
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    startup_only = time_imports(STARTUP_MODULES, args.repeats)
+    with_eager = time_imports(STARTUP_MODULES + EAGER_MODULES, args.repeats)
+    print(f"Import cost before the window (median of {args.repeats} fresh interpreters):")
+    print(f"  before (eager heavy imports): {with_eager:6.2f}s")
+    print(f"  after  (deferred):            {startup_only:6.2f}s")
+
+    script = APP_DIR / args.script
+    before = time_first_paint(script, EAGER_MODULES, args.repeats)
+    after = time_first_paint(script, [], args.repeats) if before is not None else None
+    if before is None or after is None:
+        print("Time-to-first-paint needs a display and the manager's dependencies; only import cost was measured.")
+        return 0
+    print(f"Time-to-first-paint of {args.script}:")
+    print(f"  before (eager heavy imports): {before:6.2f}s")
+    print(f"  after  (deferred):            {after:6.2f}s")
+    print(f"  speed-up:                     {before / after:6.2f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
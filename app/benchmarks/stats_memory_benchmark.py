@@ -0,0 +1,67 @@
+import argparse
+import sys
+import tempfile
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from simulation_stats import TIMESTAMP_FORMAT, load_simulation_stats
+
+
+def write_synthetic_log(csv_path: Path, rows: int, rows_per_second: int):
+    seconds = np.arange(rows) // rows_per_second
+    timestamps = pd.to_datetime("2025-05-17 12:00:00") + pd.to_timedelta(seconds, unit="s")
+    simulated_time = np.arange(rows) / rows_per_second * 2
+    rate = np.log(20000) / max(simulated_time[-1], 1.0)
+    ecoli = np.round(5 * np.exp(rate * simulated_time)).astype(np.int64)
+    scerevisiae = np.round(3 * np.exp(0.75 * rate * simulated_time)).astype(np.int64)
+    frame = pd.DataFrame({
+        "Timestamp": timestamps.strftime(TIMESTAMP_FORMAT),
+        "FPS": np.round(np.random.default_rng(0).normal(60, 5, rows), 2),
+        "RealTime": np.round(np.arange(rows) / rows_per_second, 2),
+        "SimulatedTime": np.round(simulated_time, 2),
+        "DeltaTime": 0.0167,
+        "FrameCount": np.arange(rows),
+        "Paused": "No",
+        "EColi": ecoli,
+        "SCerevisiae": scerevisiae,
+        "Organism count": ecoli + scerevisiae,
+    })
+    frame.to_csv(csv_path, sep=";", index=False)
+
+
+def baseline_frame_bytes(csv_path: Path) -> int:
+    # The frame SimulationGraphics used to keep: default read_csv dtypes plus the Timestamp_str helper column.
+    df = pd.read_csv(csv_path, sep=";")
+    df["Timestamp_str"] = df["Timestamp"].astype(str).str.strip()
+    df["Timestamp"] = pd.to_datetime(df["Timestamp_str"], format=TIMESTAMP_FORMAT, errors="coerce")
+    return int(df.memory_usage(deep=True).sum())
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare the memory held by a loaded statistics run before and after dtype compaction.")
+    parser.add_argument("--rows", type=int, default=2_000_000)
+    parser.add_argument("--rows-per-second", type=int, default=60)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as folder:
+        csv_path = Path(folder) / "SimulationStats.csv"
+        write_synthetic_log(csv_path, args.rows, args.rows_per_second)
+        baseline_bytes = baseline_frame_bytes(csv_path)
+        stats = load_simulation_stats(csv_path, use_cache=False)
+    compact_bytes = sum(values.nbytes for values in stats.columns.values())
+    wide_bytes = sum(len(values) * 8 for values in stats.columns.values())
+    print(f"Rows: {len(stats):,}")
+    for name, values in stats.columns.items():
+        print(f"  {name:<16} {str(values.dtype):<8} {values.nbytes / 2**20:8.1f} MiB")
+    print(f"pandas frame with string columns: {baseline_bytes / 2**20:8.1f} MiB")
+    print(f"float64/int64 columns:            {wide_bytes / 2**20:8.1f} MiB")
+    print(f"compact columns:                  {compact_bytes / 2**20:8.1f} MiB")
+    print(f"Reduction vs pandas frame:        {baseline_bytes / compact_bytes:.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
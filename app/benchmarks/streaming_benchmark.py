@@ -0,0 +1,125 @@
+import argparse
+import json
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from simulation_api_async import ApiPipelineRunner
+from simulation_api_session import ApiSessionManager
+from simulation_codeblocks import StreamedCodeWriter, CODE_BLOCK_PATTERN
+
+SCRIPT_NAMES = ["PrefabMaterialCreator.cs", "CreatePrefabsOnClick.cs", "EColiComponent.cs", "SCerevisiaeComponent.cs", "EColiSystem.cs", "SCerevisiaeSystem.cs"]
+
+
+def synthetic_response(script_tokens: int) -> str:
+    body = "float growth=1.5f;if(t>0.5f){scale=math.lerp(a,b,t);}" * max(1, script_tokens // 20)
+    return "".join(f"{index}.{name}{{public class C{index}{{{body}}}}}" for index, name in enumerate(SCRIPT_NAMES, start=1))
+
+
+class StreamingStubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    response_text = ""
+    chunk_size = 16
+    seconds_per_chunk = 0.0
+
+    def log_message(self, *args):
+        pass
+
+    def do_POST(self):
+        request = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))))
+        pieces = [self.response_text[i:i + self.chunk_size] for i in range(0, len(self.response_text), self.chunk_size)]
+        usage = {"prompt_tokens": 900, "completion_tokens": len(pieces), "total_tokens": 900 + len(pieces)}
+        if not request.get("stream"):
+            time.sleep(self.seconds_per_chunk * len(pieces))
+            body = json.dumps({"id": "stub", "object": "chat.completion", "usage": usage,
+                               "choices": [{"index": 0, "finish_reason": "stop", "message": {"role": "assistant", "content": self.response_text}}]}).encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Connection", "close")
+        self.end_headers()
+        events = [{"choices": [{"index": 0, "delta": {"content": piece}, "finish_reason": None}]} for piece in pieces]
+        events.append({"choices": [], "usage": usage})
+        for event in events:
+            time.sleep(self.seconds_per_chunk)
+            self.wfile.write(f"data: {json.dumps(event)}\n\n".encode("utf-8"))
+            self.wfile.flush()
+        self.wfile.write(b"data: [DONE]\n\n")
+        self.wfile.flush()
+        self.close_connection = True
+
+
+def write_script(folder: Path):
+    def write(context: dict, file_name: str, content: str) -> list:
+        path = folder / file_name
+        path.write_text(content, encoding="utf-8")
+        return [str(path)]
+    return write
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare time-to-first-file for buffered and streamed primary-model responses against a local stub server.")
+    parser.add_argument("--script-tokens", type=int, default=400, help="Approximate size of each of the six scripts.")
+    parser.add_argument("--chunk-ms", type=float, default=5.0, help="Delay between streamed chunks (generation speed).")
+    args = parser.parse_args()
+
+    StreamingStubHandler.response_text = synthetic_response(args.script_tokens)
+    StreamingStubHandler.seconds_per_chunk = args.chunk_ms / 1000.0
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StreamingStubHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    session = ApiSessionManager()
+    session.configure("sk-stub", api_base=f"http://127.0.0.1:{server.server_port}/v1")
+    session.record_success()
+    runner = ApiPipelineRunner()
+    messages = [{"role": "user", "content": "simulation"}]
+
+    async def buffered(folder: Path):
+        start = time.perf_counter()
+        response = await runner.api_call(session.achat_completion, model="stub-model", messages=messages, temperature=0, timeout=30)
+        blocks = CODE_BLOCK_PATTERN.findall(response.choices[0].message["content"])
+        write = write_script(folder)
+        first = None
+        for _, file_name, content in blocks:
+            await runner.to_thread(write, {}, file_name, content.strip())
+            first = first or time.perf_counter() - start
+        return first, time.perf_counter() - start, len(blocks)
+
+    async def streamed(folder: Path):
+        start = time.perf_counter()
+        writer = StreamedCodeWriter(runner, dict, write_script(folder))
+        async with runner.api_slot():
+            async for chunk in session.astream_chat_completion(model="stub-model", messages=messages, temperature=0, timeout=30):
+                for choice in chunk.get("choices") or []:
+                    writer.feed(choice.get("delta", {}).get("content") or "")
+        codes = await writer.finish()
+        return writer.first_file_seconds, time.perf_counter() - start, len(codes)
+
+    with tempfile.TemporaryDirectory() as folder:
+        results = {}
+        for label, pipeline in (("Buffered", buffered), ("Streamed", streamed)):
+            target = Path(folder) / label
+            target.mkdir()
+            results[label] = runner.run(pipeline(target))
+            written = sorted(path.read_text(encoding="utf-8") for path in target.iterdir())
+            results[label] += (written,)
+    runner.close()
+    server.shutdown()
+
+    for label, (first, total, count, _) in results.items():
+        print(f"{label:<9} first file {first:6.3f}s   all {count} files {total:6.3f}s")
+    identical = results["Buffered"][3] == results["Streamed"][3]
+    print(f"Written files identical: {identical}")
+    return 0 if identical else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
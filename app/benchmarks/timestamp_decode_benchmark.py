@@ -0,0 +1,58 @@
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from simulation_stats import TIMESTAMP_FORMAT, decode_timestamps
+
+
+def decode_timestamps_to_datetime(raw_values: pd.Series) -> np.ndarray:
+    stripped = raw_values.astype(str).str.strip()
+    parsed = pd.to_datetime(stripped.where(~stripped.str.lower().isin(["0", "", "nan"])), format=TIMESTAMP_FORMAT, errors="coerce")
+    return parsed.values.astype("datetime64[s]").astype(np.int64)
+
+
+def build_timestamp_column(rows: int, rows_per_second: int) -> pd.Series:
+    seconds = -(-rows // rows_per_second)
+    distinct = pd.date_range("2025-05-17 12:00:00", periods=seconds, freq="s").strftime(TIMESTAMP_FORMAT)
+    values = np.repeat(np.asarray(distinct, dtype=object), rows_per_second)[:rows]
+    return pd.Series(values, dtype=object)
+
+
+def time_call(function, values: pd.Series, repeats: int):
+    best = None
+    result = None
+    for _ in range(repeats):
+        start = time.perf_counter()
+        result = function(values)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare Timestamp decoding against pd.to_datetime on a synthetic log column.")
+    parser.add_argument("--rows", type=int, default=5_000_000)
+    parser.add_argument("--rows-per-second", type=int, default=60)
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    values = build_timestamp_column(args.rows, args.rows_per_second)
+    print(f"Rows: {len(values):,} ({values.nunique():,} distinct timestamps)")
+    baseline_time, baseline = time_call(decode_timestamps_to_datetime, values, args.repeats)
+    decoder_time, decoded = time_call(decode_timestamps, values, args.repeats)
+    if not np.array_equal(baseline, decoded):
+        print("Error: decoded epochs differ from pd.to_datetime.")
+        return 1
+    print(f"pd.to_datetime:     {baseline_time:.3f}s")
+    print(f"decode_timestamps:  {decoder_time:.3f}s")
+    print(f"Speedup:            {baseline_time / decoder_time:.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,114 @@
+import asyncio
+import atexit
+import contextlib
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from functools import partial
+from typing import Union, Callable
+
+API_PIPELINE_CONCURRENCY = 4
+API_PIPELINE_DISK_WORKERS = 4
+API_PIPELINE_CONNECTIONS = 8
+API_PIPELINE_CLOSE_TIMEOUT_SECONDS = 5.0
+
+
+class ApiPipelineRunner:
+    # One background event loop shared by every creation, so their network waits overlap.
+    def __init__(self, concurrency: int = API_PIPELINE_CONCURRENCY, disk_workers: int = API_PIPELINE_DISK_WORKERS):
+        self.concurrency = concurrency
+        self.disk_workers = disk_workers
+        self._loop = None
+        self._thread = None
+        self._semaphore = None
+        self._http = None
+        self._disk = None
+        self._lock = threading.Lock()
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None or self._loop.is_closed():
+                self._loop = asyncio.new_event_loop()
+                self._disk = ThreadPoolExecutor(max_workers=self.disk_workers, thread_name_prefix="SimulationDisk")
+                self._thread = threading.Thread(target=self._loop.run_forever, name="SimulationApiLoop", daemon=True)
+                self._thread.start()
+                # Exit paths that skip the window's close handler still cancel requests and close the aiohttp session.
+                atexit.register(self.close)
+            return self._loop
+
+    async def _prepare(self):
+        # Created lazily on the loop thread; asyncio primitives and the aiohttp session belong to that loop.
+        import openai
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.concurrency)
+        if self._http is None or self._http.closed:
+            import aiohttp
+            self._http = aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit=API_PIPELINE_CONNECTIONS))
+        # aiosession is a ContextVar, so it is set inside every task rather than once for the loop.
+        openai.aiosession.set(self._http)
+
+    async def _run(self, coroutine):
+        await self._prepare()
+        return await coroutine
+
+    def submit(self, coroutine) -> Future:
+        return asyncio.run_coroutine_threadsafe(self._run(coroutine), self._ensure_loop())
+
+    def run(self, coroutine):
+        if threading.current_thread() is self._thread:
+            coroutine.close()
+            raise RuntimeError("ApiPipelineRunner.run() cannot wait on its own event loop; await the coroutine instead.")
+        return self.submit(coroutine).result()
+
+    @contextlib.asynccontextmanager
+    async def api_slot(self):
+        await self._prepare()
+        async with self._semaphore:
+            yield
+
+    async def api_call(self, function: Callable, *args, **kwargs):
+        async with self.api_slot():
+            return await function(*args, **kwargs)
+
+    async def to_thread(self, function: Callable, *args, **kwargs):
+        # Disk-bound and other blocking steps run on the pool so the loop keeps serving network waits.
+        self._ensure_loop()
+        return await asyncio.get_running_loop().run_in_executor(self._disk, partial(function, *args, **kwargs))
+
+    async def _shutdown(self):
+        current = asyncio.current_task()
+        pending = [task for task in asyncio.all_tasks() if task is not current]
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+        if self._http is not None and not self._http.closed:
+            await self._http.close()
+
+    def close(self, timeout: Union[float, None] = API_PIPELINE_CLOSE_TIMEOUT_SECONDS):
+        with self._lock:
+            loop, thread, disk = self._loop, self._thread, self._disk
+            self._loop = None
+        if loop is None or loop.is_closed():
+            return
+        atexit.unregister(self.close)
+        try:
+            asyncio.run_coroutine_threadsafe(self._shutdown(), loop).result(timeout)
+        except FutureTimeoutError:
+            print(f"Warning: API requests did not stop within {timeout}s; closing the pipeline anyway.")
+        except Exception as e:
+            print(f"Warning: Error while closing the API pipeline: {type(e).__name__}: {e}")
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join(timeout)
+        if not loop.is_running():
+            loop.close()
+        disk.shutdown(wait=False, cancel_futures=True)
+        self._semaphore = self._http = None
+
+    def close_in_background(self, timeout: Union[float, None] = API_PIPELINE_CLOSE_TIMEOUT_SECONDS) -> threading.Thread:
+        # For the window's close handler, which must not wait on in-flight requests. The thread is not a daemon,
+        # so the process still lets the requests cancel and the aiohttp session close before it exits.
+        thread = threading.Thread(target=self.close, args=(timeout,), name="SimulationApiClose")
+        thread.start()
+        return thread
+
+
+pipeline_runner = ApiPipelineRunner()
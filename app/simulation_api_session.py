@@ -0,0 +1,172 @@
+import threading
+import time
+from typing import Union, Callable
+
+API_HEALTH_TTL_SECONDS = 300
+API_BREAKER_FAILURE_THRESHOLD = 3
+API_BREAKER_COOLDOWN_SECONDS = 30
+API_POOL_CONNECTIONS = 4
+API_PROBE_TIMEOUT_SECONDS = 10
+
+STATE_COLD = "cold"
+STATE_HEALTHY = "healthy"
+STATE_OPEN = "open"
+STATE_HALF_OPEN = "half-open"
+
+
+class ApiUnavailableError(Exception):
+    pass
+
+
+def _is_health_failure(error: Exception) -> bool:
+    # A rejected request (unknown model, bad parameters) still proves the service and the key work.
+    from openai import error as openai_error
+    return not isinstance(error, openai_error.InvalidRequestError)
+
+
+class ApiSessionManager:
+    def __init__(self, ttl_seconds: float = API_HEALTH_TTL_SECONDS, failure_threshold: int = API_BREAKER_FAILURE_THRESHOLD,
+                 cooldown_seconds: float = API_BREAKER_COOLDOWN_SECONDS, clock: Callable[[], float] = time.monotonic):
+        self.ttl_seconds = ttl_seconds
+        self.failure_threshold = failure_threshold
+        self.cooldown_seconds = cooldown_seconds
+        self.clock = clock
+        self.api_key = None
+        self.http_session = None
+        self.last_success = None
+        self.consecutive_failures = 0
+        self.opened_at = None
+        self.last_error = None
+        self.probes = 0
+        self._lock = threading.RLock()
+        self._probe_lock = threading.Lock()
+
+    def configure(self, api_key: Union[str, None], api_base: Union[str, None] = None):
+        import openai
+        import requests
+        with self._lock:
+            if self.http_session is None:
+                # One pooled session for every worker thread, instead of a new connection per creation thread.
+                self.http_session = requests.Session()
+                adapter = requests.adapters.HTTPAdapter(pool_connections=API_POOL_CONNECTIONS, pool_maxsize=API_POOL_CONNECTIONS)
+                self.http_session.mount("https://", adapter)
+                self.http_session.mount("http://", adapter)
+            openai.requestssession = self.http_session
+            if api_base:
+                openai.api_base = api_base
+            if api_key != self.api_key:
+                self.api_key = api_key
+                self.last_success = None
+                self.consecutive_failures = 0
+                self.opened_at = None
+            openai.api_key = api_key
+
+    def state(self) -> str:
+        with self._lock:
+            now = self.clock()
+            if self.opened_at is not None:
+                return STATE_OPEN if now - self.opened_at < self.cooldown_seconds else STATE_HALF_OPEN
+            if self.last_success is not None and now - self.last_success < self.ttl_seconds:
+                return STATE_HEALTHY
+            return STATE_COLD
+
+    def record_success(self):
+        with self._lock:
+            self.last_success = self.clock()
+            self.consecutive_failures = 0
+            self.opened_at = None
+            self.last_error = None
+
+    def record_failure(self, error: Exception):
+        with self._lock:
+            self.last_error = error
+            self.last_success = None
+            self.consecutive_failures += 1
+            if self.consecutive_failures >= self.failure_threshold or self.opened_at is not None:
+                # A failed half-open probe re-arms the cooldown straight away.
+                self.opened_at = self.clock()
+
+    def record_outcome(self, error: Union[Exception, None]):
+        if error is None or not _is_health_failure(error):
+            self.record_success()
+        else:
+            self.record_failure(error)
+
+    def ensure_available(self) -> bool:
+        state = self.state()
+        if state == STATE_HEALTHY:
+            return True
+        if state == STATE_OPEN:
+            return False
+        import openai
+        if not openai.api_key:
+            return False
+        # Only a cold or half-open session pays for a round trip before the real call, and only one caller probes.
+        with self._probe_lock:
+            state = self.state()
+            if state != STATE_COLD and state != STATE_HALF_OPEN:
+                return state == STATE_HEALTHY
+            self.probes += 1
+            try:
+                openai.Model.list(limit=1, request_timeout=API_PROBE_TIMEOUT_SECONDS)
+            except Exception as e:
+                self.record_failure(e)
+                return False
+            self.record_success()
+            return True
+
+    def chat_completion(self, **kwargs):
+        import openai
+        if not self.ensure_available():
+            raise ApiUnavailableError(self.describe())
+        try:
+            response = openai.ChatCompletion.create(**kwargs)
+        except Exception as e:
+            self.record_outcome(e)
+            raise
+        self.record_success()
+        return response
+
+    async def _aensure_available(self):
+        import asyncio
+        available = self.state() == STATE_HEALTHY
+        if not available:
+            # The rare probe goes through the pooled blocking session without stalling the event loop.
+            available = await asyncio.get_running_loop().run_in_executor(None, self.ensure_available)
+        if not available:
+            raise ApiUnavailableError(self.describe())
+
+    async def achat_completion(self, **kwargs):
+        import openai
+        await self._aensure_available()
+        try:
+            response = await openai.ChatCompletion.acreate(**kwargs)
+        except Exception as e:
+            self.record_outcome(e)
+            raise
+        self.record_success()
+        return response
+
+    async def astream_chat_completion(self, **kwargs):
+        import openai
+        await self._aensure_available()
+        try:
+            stream = await openai.ChatCompletion.acreate(stream=True, **kwargs)
+            async for chunk in stream:
+                yield chunk
+        except Exception as e:
+            self.record_outcome(e)
+            raise
+        self.record_success()
+
+    def describe(self) -> str:
+        state = self.state()
+        if state == STATE_OPEN:
+            remaining = self.cooldown_seconds - (self.clock() - self.opened_at)
+            return f"API circuit open after {self.consecutive_failures} failures; retrying in {remaining:.0f}s. Last error: {self.last_error}"
+        if self.last_error is not None:
+            return f"API {state}. Last error: {type(self.last_error).__name__}: {self.last_error}"
+        return f"API {state}."
+
+
+api_session = ApiSessionManager()
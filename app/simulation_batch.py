@@ -0,0 +1,258 @@
+import csv
+import json
+import os
+import traceback
+from pathlib import Path
+from typing import Union, Dict, List, Tuple
+
+import numpy as np
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+from simulation_decimation import decimate_series
+from simulation_files import atomic_write
+from simulation_models import fit_growth_models
+from simulation_plots import PLOT_FIGSIZE, PLOT_DPI
+from simulation_stats import load_simulation_stats, csv_fingerprint
+from simulation_workers import run_in_spawn_pool
+
+SIMULATION_SUMMARY_FILENAME = "SimulationStats.summary.json"
+SIMULATION_SUMMARY_VERSION = 2
+BATCH_TABLE_FILENAME = "simulations_comparison.csv"
+TOTAL_ORGANISMS_COLUMN = "Organism count"
+# Overlay curves are stored with each summary, so they are kept small enough for a JSON file.
+OVERLAY_POINTS = 500
+BATCH_TABLE_FIELDS = [
+    ("simulation", "Simulation"),
+    ("rows", "Rows"),
+    ("peak_population", "Peak population"),
+    ("growth_model", "Growth model"),
+    ("growth_rate", "Growth rate (1/s)"),
+    ("doubling_time", "Doubling time (s)"),
+    ("carrying_capacity", "Carrying capacity"),
+    ("growth_r_squared", "Growth fit R²"),
+    ("mean_fps", "Mean FPS"),
+    ("p95_fps", "P95 FPS"),
+    ("sim_real_ratio", "SimulatedTime / RealTime"),
+]
+
+
+def get_simulation_summary_path(csv_path: Union[str, Path]) -> Path:
+    return Path(csv_path).with_name(SIMULATION_SUMMARY_FILENAME)
+
+
+def _total_organisms(stats) -> Union[np.ndarray, None]:
+    if TOTAL_ORGANISMS_COLUMN in stats:
+        return stats[TOTAL_ORGANISMS_COLUMN]
+    if not stats.organism_columns:
+        return None
+    return np.nansum(np.column_stack([stats[name] for name in stats.organism_columns]), axis=1)
+
+
+def _finite_span(values: np.ndarray) -> float:
+    finite = values[np.isfinite(values)]
+    return float(finite[-1] - finite[0]) if len(finite) >= 2 else np.nan
+
+
+def _json_float(value) -> Union[float, None]:
+    value = float(value)
+    return value if np.isfinite(value) else None
+
+
+def _overlay_series(x: np.ndarray, y: np.ndarray) -> List[List[float]]:
+    finite = np.isfinite(x) & np.isfinite(y)
+    x_points, y_points = decimate_series(x[finite], y[finite], OVERLAY_POINTS)
+    return [np.round(x_points, 3).tolist(), np.round(y_points, 3).tolist()]
+
+
+def summarize_simulation_stats(stats) -> dict:
+    summary = {"rows": len(stats), "peak_population": None, "growth_model": None, "growth_rate": None, "doubling_time": None,
+               "carrying_capacity": None, "growth_r_squared": None, "mean_fps": None, "p95_fps": None, "sim_real_ratio": None, "series": {}}
+    simulated_time = stats["SimulatedTime"] if "SimulatedTime" in stats else None
+    total = _total_organisms(stats)
+    if total is not None and np.isfinite(total).any():
+        summary["peak_population"] = _json_float(np.nanmax(total))
+        if simulated_time is not None:
+            # Summaries already run one simulation per worker, so the candidate models are fitted in this process.
+            best = fit_growth_models({"SimulatedTime": simulated_time, "total": total}, ["total"], max_workers=1).best("total")
+            if best is not None:
+                rate = best["params"]["b"] if best["model"] == "exponential" else best["params"]["r"]
+                summary["growth_model"] = best["model"]
+                summary["growth_rate"] = _json_float(rate)
+                summary["doubling_time"] = _json_float(best["doubling_time"])
+                summary["carrying_capacity"] = _json_float(best["params"].get("K", np.nan))
+                summary["growth_r_squared"] = _json_float(best["r_squared"])
+            summary["series"]["organisms"] = _overlay_series(simulated_time, total)
+    if "FPS" in stats and np.isfinite(stats["FPS"]).any():
+        fps = stats["FPS"]
+        summary["mean_fps"] = _json_float(np.nanmean(fps))
+        summary["p95_fps"] = _json_float(np.nanpercentile(fps, 95))
+        if simulated_time is not None:
+            summary["series"]["fps"] = _overlay_series(simulated_time, fps)
+    if simulated_time is not None and "RealTime" in stats:
+        with np.errstate(divide="ignore", invalid="ignore"):
+            summary["sim_real_ratio"] = _json_float(_finite_span(simulated_time) / _finite_span(stats["RealTime"]))
+    return summary
+
+
+def read_simulation_summary(csv_path: Union[str, Path], fingerprint: Union[dict, None] = None) -> Union[dict, None]:
+    try:
+        if fingerprint is None:
+            fingerprint = csv_fingerprint(csv_path)
+        with open(get_simulation_summary_path(csv_path), "r", encoding="utf-8") as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if cached.get("version") != SIMULATION_SUMMARY_VERSION or cached.get("fingerprint") != fingerprint:
+        return None
+    return cached.get("summary")
+
+
+def _write_simulation_summary(csv_path: Path, fingerprint: dict, summary: dict, messages: List[str]):
+    summary_path = get_simulation_summary_path(csv_path)
+    try:
+        with atomic_write(summary_path, "w", encoding="utf-8") as f:
+            json.dump({"version": SIMULATION_SUMMARY_VERSION, "fingerprint": fingerprint, "summary": summary}, f)
+    except OSError as e:
+        messages.append(f"  Warning: Could not write simulation summary '{summary_path}': {e}")
+
+
+def _summarize_simulation(simulation_name: str, csv_path: str) -> Tuple[str, Union[dict, None], List[str]]:
+    messages = []
+    csv_path = Path(csv_path)
+    try:
+        fingerprint = csv_fingerprint(csv_path)
+        stats = load_simulation_stats(csv_path)
+        if stats is None or len(stats) == 0:
+            messages.append(f"  Warning: No usable statistics rows for '{simulation_name}'.")
+            return simulation_name, None, messages
+        summary = summarize_simulation_stats(stats)
+        _write_simulation_summary(csv_path, fingerprint, summary, messages)
+    except Exception as e:
+        messages.append(f"  Error summarizing '{simulation_name}': {type(e).__name__}: {e}")
+        traceback.print_exc()
+        return simulation_name, None, messages
+    return simulation_name, summary, messages
+
+
+def summarize_simulations(csv_paths: Dict[str, Path], max_workers: Union[int, None] = None) -> Dict[str, dict]:
+    summaries = {}
+    pending = {}
+    for simulation_name, csv_path in csv_paths.items():
+        cached = read_simulation_summary(csv_path)
+        if cached is not None:
+            summaries[simulation_name] = cached
+        else:
+            pending[simulation_name] = str(csv_path)
+    print(f"  {len(summaries)} simulation summaries up to date, {len(pending)} to compute.")
+
+    def store(simulation_name, result):
+        _, summary, messages = result
+        for message in messages:
+            print(message)
+        if summary is not None:
+            summaries[simulation_name] = summary
+
+    worker_count = min(len(pending), max_workers or os.cpu_count() or 1)
+    run_in_spawn_pool(_summarize_simulation, {name: (name, path) for name, path in pending.items()},
+                      worker_count, store, "simulation summaries")
+    return summaries
+
+
+def write_comparison_table(summaries: Dict[str, dict], table_path: Union[str, Path]) -> bool:
+    try:
+        with open(table_path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f, delimiter=";")
+            writer.writerow([title for _, title in BATCH_TABLE_FIELDS])
+            for simulation_name in sorted(summaries, key=str.lower):
+                summary = dict(summaries[simulation_name], simulation=simulation_name)
+                row = []
+                for field, _ in BATCH_TABLE_FIELDS:
+                    value = summary.get(field)
+                    if value is None:
+                        row.append("")
+                    elif isinstance(value, float):
+                        row.append(f"{value:.6g}")
+                    else:
+                        row.append(value)
+                writer.writerow(row)
+        return True
+    except OSError as e:
+        print(f"  Warning: Could not write comparison table '{table_path}': {e}")
+        return False
+
+
+def _plot_overlay(summaries: Dict[str, dict], series_name: str, title: str, ylabel: str, output_path: Path, log_scale: bool = False) -> bool:
+    figure = Figure(figsize=PLOT_FIGSIZE, dpi=PLOT_DPI)
+    FigureCanvasAgg(figure)
+    axes = figure.add_subplot()
+    plotted = 0
+    for simulation_name in sorted(summaries, key=str.lower):
+        series = summaries[simulation_name].get("series", {}).get(series_name)
+        if not series or not series[0]:
+            continue
+        axes.plot(series[0], series[1], label=simulation_name, linewidth=1)
+        plotted += 1
+    if plotted == 0:
+        return False
+    if log_scale:
+        axes.set_yscale("log")
+    axes.set_title(title)
+    axes.set_xlabel("Simulated Time (s)")
+    axes.set_ylabel(ylabel)
+    axes.legend(fontsize="small", ncol=max(1, plotted // 15))
+    axes.grid(True, linestyle='--', alpha=0.6)
+    figure.tight_layout()
+    try:
+        figure.savefig(str(output_path))
+        return True
+    except Exception as e:
+        print(f"  Error saving {output_path.name}: {e}")
+        return False
+
+
+def _plot_fps_comparison(summaries: Dict[str, dict], output_path: Path) -> bool:
+    names = [name for name in sorted(summaries, key=str.lower) if summaries[name].get("mean_fps") is not None]
+    if not names:
+        return False
+    figure = Figure(figsize=PLOT_FIGSIZE, dpi=PLOT_DPI)
+    FigureCanvasAgg(figure)
+    axes = figure.add_subplot()
+    positions = np.arange(len(names))
+    axes.bar(positions - 0.2, [summaries[name]["mean_fps"] for name in names], width=0.4, label="Mean FPS", color="blue")
+    axes.bar(positions + 0.2, [summaries[name]["p95_fps"] for name in names], width=0.4, label="P95 FPS", color="darkorange")
+    axes.set_xticks(positions)
+    axes.set_xticklabels(names, rotation=45, ha="right", fontsize="small")
+    axes.set_title("FPS by Simulation")
+    axes.set_ylabel("FPS")
+    axes.legend()
+    axes.grid(True, axis="y", linestyle='--', alpha=0.6)
+    figure.tight_layout()
+    try:
+        figure.savefig(str(output_path))
+        return True
+    except Exception as e:
+        print(f"  Error saving {output_path.name}: {e}")
+        return False
+
+
+def render_comparison_charts(summaries: Dict[str, dict], output_folder: Union[str, Path]) -> int:
+    output_folder = Path(output_folder)
+    generated = [
+        _plot_overlay(summaries, "organisms", "Total Organisms by Simulation", "Total Organisms (log scale)", output_folder / "organisms_overlay.png", log_scale=True),
+        _plot_overlay(summaries, "fps", "FPS by Simulation", "FPS", output_folder / "fps_overlay.png"),
+        _plot_fps_comparison(summaries, output_folder / "fps_comparison.png"),
+    ]
+    return sum(generated)
+
+
+def build_batch_report(csv_paths: Dict[str, Path], output_folder: Union[str, Path], max_workers: Union[int, None] = None) -> int:
+    output_folder = Path(output_folder)
+    summaries = summarize_simulations(csv_paths, max_workers)
+    if not summaries:
+        print("  No simulation produced usable statistics; nothing to compare.")
+        return 0
+    table_path = output_folder / BATCH_TABLE_FILENAME
+    if write_comparison_table(summaries, table_path):
+        print(f"  Comparison table saved to '{table_path}'.")
+    return render_comparison_charts(summaries, output_folder)
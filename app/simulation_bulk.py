@@ -0,0 +1,181 @@
+import asyncio
+import csv
+import json
+import time
+from pathlib import Path
+from typing import Union, Callable, Dict, List, Tuple
+
+BULK_DEFAULT_CONCURRENCY = 4
+# Creation starts per minute; each creation makes up to two model calls.
+BULK_DEFAULT_REQUESTS_PER_MINUTE = 30
+BULK_REPORT_FILENAME = "bulk_creation_report.csv"
+BULK_FAILED_MANIFEST_FILENAME = "bulk_creation_failed.jsonl"
+BULK_REPORT_FIELDS = ["line", "name", "status", "seconds", "error"]
+BULK_MANIFEST_OPTIONS = {"use_cache": bool}
+INVALID_NAME_CHARACTERS = r'<>:"/\|?*' + "".join(map(chr, range(32)))
+STATUS_CREATED = "created"
+STATUS_FAILED = "failed"
+STATUS_SKIPPED = "skipped"
+STATUS_INVALID = "invalid"
+
+
+def _parse_option(name: str, value):
+    expected = BULK_MANIFEST_OPTIONS[name]
+    if expected is bool and isinstance(value, str):
+        lowered = value.strip().lower()
+        if lowered in ("1", "true", "yes", "y"):
+            return True
+        if lowered in ("0", "false", "no", "n", ""):
+            return False
+        raise ValueError(f"'{value}' is not a boolean")
+    return expected(value)
+
+
+def _manifest_row(line: int, record: dict) -> Tuple[Union[dict, None], Union[str, None]]:
+    name = str(record.get("name") or "").strip()
+    description = str(record.get("description") or "").strip()
+    if not name:
+        return None, "missing name"
+    if any(c in INVALID_NAME_CHARACTERS for c in name):
+        return None, f"name '{name}' contains invalid characters"
+    if not description:
+        return None, f"'{name}' has no description"
+    options = record.get("options") or {}
+    if isinstance(options, str):
+        try:
+            options = json.loads(options)
+        except json.JSONDecodeError as e:
+            return None, f"'{name}' has unreadable options: {e}"
+    # CSV manifests may also give options as their own columns.
+    options = dict(options, **{key: record[key] for key in BULK_MANIFEST_OPTIONS if record.get(key) not in (None, "")})
+    parsed = {}
+    for key, value in options.items():
+        if key not in BULK_MANIFEST_OPTIONS:
+            return None, f"'{name}' has unknown option '{key}'"
+        try:
+            parsed[key] = _parse_option(key, value)
+        except (TypeError, ValueError) as e:
+            return None, f"'{name}' has an invalid '{key}' option: {e}"
+    return {"line": line, "name": name, "description": description, "options": parsed}, None
+
+
+def read_bulk_manifest(manifest_path: Union[str, Path]) -> Tuple[List[dict], List[dict]]:
+    # JSONL: one {"name", "description", "options"} object per line. CSV: a header with name,description[,options|use_cache].
+    manifest_path = Path(manifest_path)
+    records = []
+    if manifest_path.suffix.lower() == ".csv":
+        with open(manifest_path, "r", encoding="utf-8-sig", newline="") as f:
+            for line, record in enumerate(csv.DictReader(f), start=2):
+                records.append((line, record))
+    else:
+        with open(manifest_path, "r", encoding="utf-8-sig") as f:
+            for line, text in enumerate(f, start=1):
+                if not text.strip() or text.lstrip().startswith("#"):
+                    continue
+                try:
+                    record = json.loads(text)
+                except json.JSONDecodeError as e:
+                    records.append((line, {"__error__": f"unreadable JSON: {e}"}))
+                    continue
+                records.append((line, record if isinstance(record, dict) else {"__error__": "expected a JSON object"}))
+    rows, invalid = [], []
+    seen = set()
+    for line, record in records:
+        row, error = (None, record["__error__"]) if "__error__" in record else _manifest_row(line, record)
+        if row is not None and row["name"].lower() in seen:
+            row, error = None, f"duplicate name '{row['name']}'"
+        if row is None:
+            invalid.append({"line": line, "name": str(record.get("name") or ""), "status": STATUS_INVALID, "seconds": 0.0, "error": error})
+            continue
+        seen.add(row["name"].lower())
+        rows.append(row)
+    return rows, invalid
+
+
+class RateLimiter:
+    # Spaces out starts evenly instead of letting a burst through and then stalling.
+    def __init__(self, per_minute: float):
+        self.interval = 60.0 / per_minute if per_minute and per_minute > 0 else 0.0
+        self._next_start = 0.0
+        self._lock = asyncio.Lock()
+
+    async def wait(self):
+        if self.interval <= 0:
+            return
+        async with self._lock:
+            now = time.monotonic()
+            delay = self._next_start - now
+            self._next_start = max(now, self._next_start) + self.interval
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+async def run_bulk_creation(rows: List[dict], create, simulations_dir: Union[str, Path],
+                            concurrency: int = BULK_DEFAULT_CONCURRENCY, requests_per_minute: float = BULK_DEFAULT_REQUESTS_PER_MINUTE,
+                            on_progress: Union[Callable[[dict, int, int], None], None] = None,
+                            should_stop: Union[Callable[[], bool], None] = None) -> List[dict]:
+    # `create(name, description, **options)` is awaited and returns (success, error message), like api_manager_async.
+    simulations_dir = Path(simulations_dir)
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+    limiter = RateLimiter(requests_per_minute)
+    done = 0
+
+    async def run_row(row: dict) -> dict:
+        nonlocal done
+        result = {"line": row["line"], "name": row["name"], "status": STATUS_SKIPPED, "seconds": 0.0, "error": ""}
+        async with semaphore:
+            # Checked at start time as well, so a rerun of an interrupted manifest resumes where it stopped.
+            if (simulations_dir / row["name"]).exists():
+                result["error"] = "simulation folder already exists"
+            elif should_stop is not None and should_stop():
+                result["error"] = "cancelled"
+            else:
+                await limiter.wait()
+                start = time.perf_counter()
+                try:
+                    success, error_message = await create(row["name"], row["description"], **row["options"])
+                except Exception as e:
+                    success, error_message = False, f"{type(e).__name__}: {e}"
+                result["seconds"] = round(time.perf_counter() - start, 3)
+                result["status"] = STATUS_CREATED if success else STATUS_FAILED
+                result["error"] = "" if success else (error_message or "unknown error")
+        done += 1
+        if on_progress is not None:
+            on_progress(result, done, len(rows))
+        return result
+
+    results = await asyncio.gather(*(run_row(row) for row in rows))
+    return sorted(results, key=lambda result: result["line"])
+
+
+def write_bulk_report(results: List[dict], rows: List[dict], report_folder: Union[str, Path]) -> Union[Path, None]:
+    report_folder = Path(report_folder)
+    report_path = report_folder / BULK_REPORT_FILENAME
+    failed_path = report_folder / BULK_FAILED_MANIFEST_FILENAME
+    try:
+        report_folder.mkdir(parents=True, exist_ok=True)
+        with open(report_path, "w", encoding="utf-8", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=BULK_REPORT_FIELDS)
+            writer.writeheader()
+            for result in sorted(results, key=lambda result: result["line"]):
+                writer.writerow({field: result.get(field, "") for field in BULK_REPORT_FIELDS})
+        # Failed rows as a manifest of their own, ready to be retried.
+        failed = {result["name"] for result in results if result["status"] == STATUS_FAILED}
+        failed_rows = [row for row in rows if row["name"] in failed]
+        if failed_rows:
+            with open(failed_path, "w", encoding="utf-8") as f:
+                for row in failed_rows:
+                    f.write(json.dumps({"name": row["name"], "description": row["description"], "options": row["options"]}, ensure_ascii=False) + "\n")
+        elif failed_path.exists():
+            failed_path.unlink()
+    except OSError as e:
+        print(f"Error writing bulk creation report '{report_path}': {e}")
+        return None
+    return report_path
+
+
+def count_bulk_results(results: List[dict]) -> Dict[str, int]:
+    counts = {STATUS_CREATED: 0, STATUS_FAILED: 0, STATUS_SKIPPED: 0, STATUS_INVALID: 0}
+    for result in results:
+        counts[result["status"]] = counts.get(result["status"], 0) + 1
+    return counts
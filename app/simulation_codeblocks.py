@@ -0,0 +1,94 @@
+import asyncio
+import re
+import time
+from typing import Union, Callable, Dict, List, Tuple
+
+# "1.PrefabMaterialCreator.cs{...}2.CreatePrefabsOnClick.cs{...}": a block ends at the "}" right before the next "<n>." or the end.
+CODE_BLOCK_PATTERN = re.compile(r'(\d+)\.(\w+\.cs)\{(.*?)}(?=\d+\.|$)', re.DOTALL)
+NEXT_BLOCK_PATTERN = re.compile(r'\d+\.')
+
+
+class IncrementalCodeBlockParser:
+    # Yields exactly the blocks CODE_BLOCK_PATTERN.findall() would find in the whole text, each as soon as it is final.
+    def __init__(self):
+        self.text = ""
+        self.position = 0
+        self.block_count = 0
+
+    def _scan(self, final: bool) -> List[Tuple[str, str]]:
+        blocks = []
+        # The buffered path strips the whole reply first, so trailing whitespace must not hide the last block's "$".
+        text = self.text.rstrip() if final else self.text
+        while True:
+            match = CODE_BLOCK_PATTERN.search(text, self.position)
+            if match is None:
+                break
+            # A block closed by the end of the text is only final once the stream is; otherwise more may follow.
+            if not final and not NEXT_BLOCK_PATTERN.match(text, match.end()):
+                break
+            blocks.append((match.group(2), match.group(3).strip()))
+            self.position = match.end()
+        self.block_count += len(blocks)
+        return blocks
+
+    def feed(self, chunk: str) -> List[Tuple[str, str]]:
+        if not chunk:
+            return []
+        self.text += chunk
+        # A block can only become final when the "." of the following "<n>." arrives.
+        if "." not in chunk:
+            return []
+        return self._scan(final=False)
+
+    def close(self) -> List[Tuple[str, str]]:
+        return self._scan(final=True)
+
+
+class StreamedCodeWriter:
+    # Writes each block on the runner's thread pool as soon as the parser closes it, while the model keeps generating.
+    def __init__(self, runner, prepare: Callable[[], Union[dict, None]], write: Callable[[dict, str, str], list]):
+        self.parser = IncrementalCodeBlockParser()
+        self.runner = runner
+        self.prepare = prepare
+        self.write = write
+        self.codes = {}
+        self.files_processed = []
+        self.context = None
+        self.started = time.perf_counter()
+        self.first_file_seconds = None
+        self._prepared = None
+        self._last_write = None
+
+    def feed(self, chunk: str):
+        self._schedule(self.parser.feed(chunk))
+
+    def _schedule(self, blocks: List[Tuple[str, str]]):
+        for file_name, content in blocks:
+            self.codes[file_name] = content
+            if self._prepared is None:
+                # The simulation folder is only created once the first script is known to exist.
+                self._prepared = asyncio.ensure_future(self.runner.to_thread(self.prepare))
+            self._last_write = asyncio.ensure_future(self._write_after(self._last_write, file_name, content))
+
+    async def _write_after(self, previous, file_name: str, content: str):
+        # Writes stay in stream order, so a repeated file name ends with the last version, as in the buffered path.
+        if previous is not None:
+            await previous
+        self.context = await self._prepared
+        if self.context is None:
+            return
+        written = await self.runner.to_thread(self.write, self.context, file_name, content)
+        if written:
+            # A repeated file name overwrites the same path, which is still one processed file.
+            self.files_processed.extend(path for path in written if path not in self.files_processed)
+            if self.first_file_seconds is None:
+                self.first_file_seconds = time.perf_counter() - self.started
+
+    async def wait(self):
+        if self._last_write is not None:
+            await self._last_write
+
+    async def finish(self) -> Dict[str, str]:
+        self._schedule(self.parser.close())
+        await self.wait()
+        return self.codes
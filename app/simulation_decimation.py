@@ -0,0 +1,100 @@
+from typing import Union, Tuple
+
+import numpy as np
+
+DECIMATION_METHODS = ("lttb", "minmax")
+DEFAULT_DECIMATION_METHOD = "lttb"
+MIN_DECIMATION_POINTS = 3
+
+
+def _as_float_array(values) -> np.ndarray:
+    return np.asarray(values).astype(np.float64, copy=False)
+
+
+def _finite_positions(x: np.ndarray, y: np.ndarray) -> Union[np.ndarray, None]:
+    finite = np.isfinite(x) & np.isfinite(y)
+    if finite.all():
+        return None
+    return np.flatnonzero(finite)
+
+
+def lttb_indices(x, y, max_points: int) -> np.ndarray:
+    x = _as_float_array(x)
+    y = _as_float_array(y)
+    length = len(y)
+    if max_points >= length or max_points < MIN_DECIMATION_POINTS:
+        return np.arange(length)
+    positions = _finite_positions(x, y)
+    if positions is not None:
+        if len(positions) <= max_points:
+            return positions
+        return positions[lttb_indices(x[positions], y[positions], max_points)]
+
+    # Epoch-second x values would exhaust float64 precision in the running sums below.
+    x = x - x[0]
+    bucket_count = max_points - 2
+    # Bucket i spans [edges[i], edges[i + 1]); the first and last rows are always kept.
+    edges = (np.floor(np.arange(bucket_count + 1) * ((length - 2) / bucket_count)) + 1).astype(np.int64)
+    edges[-1] = length - 1
+    x_sums = np.concatenate(([0.0], np.cumsum(x)))
+    y_sums = np.concatenate(([0.0], np.cumsum(y)))
+    next_starts = edges[1:]
+    next_ends = np.append(edges[2:], length)
+    next_sizes = next_ends - next_starts
+    next_x = (x_sums[next_ends] - x_sums[next_starts]) / next_sizes
+    next_y = (y_sums[next_ends] - y_sums[next_starts]) / next_sizes
+
+    selected = np.empty(max_points, dtype=np.int64)
+    selected[0] = 0
+    selected[-1] = length - 1
+    previous = 0
+    for bucket in range(bucket_count):
+        start, end = edges[bucket], edges[bucket + 1]
+        x_prev, y_prev = x[previous], y[previous]
+        areas = np.abs(
+            (x_prev - next_x[bucket]) * (y[start:end] - y_prev)
+            - (x_prev - x[start:end]) * (next_y[bucket] - y_prev)
+        )
+        previous = start + int(np.argmax(areas))
+        selected[bucket + 1] = previous
+    return np.unique(selected)
+
+
+def minmax_indices(y, max_points: int) -> np.ndarray:
+    y = _as_float_array(y)
+    length = len(y)
+    if max_points >= length or max_points < MIN_DECIMATION_POINTS:
+        return np.arange(length)
+    bucket_count = max(1, (max_points - 2) // 2)
+    bucket_size = -(-length // bucket_count)
+    padded = np.full(bucket_count * bucket_size, np.nan)
+    padded[:length] = y
+    buckets = padded.reshape(bucket_count, bucket_size)
+    nan_mask = np.isnan(buckets)
+    offsets = np.arange(bucket_count) * bucket_size
+    lows = offsets + np.argmin(np.where(nan_mask, np.inf, buckets), axis=1)
+    highs = offsets + np.argmax(np.where(nan_mask, -np.inf, buckets), axis=1)
+    selected = np.concatenate(([0, length - 1], lows, highs))
+    selected = selected[selected < length]
+    selected = np.unique(selected)
+    keep = np.isfinite(y[selected])
+    keep[0] = keep[-1] = True
+    return selected[keep]
+
+
+def decimation_indices(x, y, max_points: int, method: str = DEFAULT_DECIMATION_METHOD) -> np.ndarray:
+    if method == "lttb":
+        return lttb_indices(x, y, max_points)
+    if method == "minmax":
+        return minmax_indices(y, max_points)
+    raise ValueError(f"Unknown decimation method '{method}'. Expected one of {DECIMATION_METHODS}.")
+
+
+def decimate_series(x, y, max_points: int, method: str = DEFAULT_DECIMATION_METHOD) -> Tuple[np.ndarray, np.ndarray]:
+    x = np.asarray(x)
+    y = np.asarray(y)
+    if len(y) <= max_points:
+        return x, y
+    numeric_x = x.astype("int64") if np.issubdtype(x.dtype, np.datetime64) else x
+    indices = decimation_indices(numeric_x, y, max_points, method)
+    return x[indices], y[indices]
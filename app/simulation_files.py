@@ -0,0 +1,24 @@
+import contextlib
+import os
+import tempfile
+from pathlib import Path
+from typing import Union
+
+
+@contextlib.contextmanager
+def atomic_write(path: Union[str, Path], mode: str = "w", encoding: Union[str, None] = None):
+    # Writes go to a unique temp file next to path, which replaces path only once the block finishes.
+    # Graphs, sparkline workers and batch summaries can write the same sidecar at once, so every writer gets its own
+    # temp file, and it is removed whenever the write fails.
+    path = Path(path)
+    descriptor, temp_name = tempfile.mkstemp(prefix=path.name + ".", suffix=".tmp", dir=path.parent)
+    try:
+        with os.fdopen(descriptor, mode, encoding=encoding) as f:
+            yield f
+        os.replace(temp_name, path)
+    except BaseException:
+        try:
+            os.unlink(temp_name)
+        except OSError:
+            pass
+        raise
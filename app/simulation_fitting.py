@@ -0,0 +1,160 @@
+import json
+from pathlib import Path
+from typing import Union, Dict, List
+
+import numpy as np
+
+from simulation_files import atomic_write
+from simulation_metrics import r2_scores
+
+GROWTH_FITS_FILENAME = "SimulationStats.fits.npz"
+GROWTH_FITS_VERSION = 2
+# Weighting log residuals by y**2 approximates least squares on the counts themselves; zero counts get no weight.
+GROWTH_FIT_WEIGHT_POWER = 2
+GROWTH_FIT_DTYPE = np.dtype([
+    ("a", np.float64),
+    ("b", np.float64),
+    ("r_squared", np.float64),
+    ("doubling_time", np.float64),
+    ("points", np.int64),
+])
+
+
+def exponential_func(x, a, b):
+    return a * np.exp(b * x)
+
+
+class GrowthFits:
+    def __init__(self, columns: List[str], records: np.ndarray, time_column: str = "SimulatedTime"):
+        self.columns = list(columns)
+        self.records = records
+        self.time_column = time_column
+
+    def __len__(self):
+        return len(self.columns)
+
+    def __contains__(self, column):
+        return column in self.columns
+
+    def __getitem__(self, column) -> Dict[str, Union[float, int, bool]]:
+        record = self.records[self.columns.index(column)]
+        return {name: record[name].item() for name in GROWTH_FIT_DTYPE.names}
+
+    def items(self):
+        return [(column, self[column]) for column in self.columns]
+
+    def is_valid(self, column) -> bool:
+        record = self.records[self.columns.index(column)]
+        return bool(np.isfinite(record["a"]) and np.isfinite(record["b"]))
+
+
+def _r_squared(observed: np.ndarray, predicted: np.ndarray, valid: np.ndarray) -> np.ndarray:
+    r_squared = r2_scores(observed, predicted, valid)
+    r_squared[valid.sum(axis=0) < 2] = np.nan
+    return r_squared
+
+
+def _doubling_times(rates: np.ndarray) -> np.ndarray:
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(rates > 0, np.log(2.0) / rates, np.nan)
+
+
+def fit_exponential_growth(time_values: np.ndarray, counts: np.ndarray) -> np.ndarray:
+    time_values = np.asarray(time_values, dtype=np.float64)
+    counts = np.asarray(counts, dtype=np.float64)
+    if counts.ndim == 1:
+        counts = counts[:, None]
+    records = np.zeros(counts.shape[1], dtype=GROWTH_FIT_DTYPE)
+    records["a"] = records["b"] = records["r_squared"] = records["doubling_time"] = np.nan
+    if counts.shape[1] == 0:
+        return records
+
+    times = time_values[:, None]
+    valid = np.isfinite(times) & np.isfinite(counts)
+    positive = valid & (counts > 0)
+    weights = np.where(positive, counts, 0.0) ** GROWTH_FIT_WEIGHT_POWER
+    log_counts = np.log(np.where(positive, counts, 1.0))
+    shifted_times = np.where(positive, times, 0.0)
+
+    weight_sums = weights.sum(axis=0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        mean_times = (weights * shifted_times).sum(axis=0) / weight_sums
+        mean_logs = (weights * log_counts).sum(axis=0) / weight_sums
+        centered = np.where(positive, shifted_times - mean_times, 0.0)
+        spread = (weights * centered ** 2).sum(axis=0)
+        rates = np.where(spread > 0, (weights * centered * (log_counts - mean_logs)).sum(axis=0) / spread, 0.0)
+    scales = np.exp(mean_logs - rates * mean_times)
+
+    fitted = positive.sum(axis=0) >= 2
+    records["points"] = valid.sum(axis=0)
+    records["a"][fitted] = scales[fitted]
+    records["b"][fitted] = rates[fitted]
+    predicted = scales * np.exp(rates * np.where(valid, times, 0.0))
+    records["r_squared"][fitted] = _r_squared(counts, predicted, valid)[fitted]
+    records["doubling_time"][fitted] = _doubling_times(rates[fitted])
+    return records
+
+
+def fit_growth_columns(columns: Dict[str, np.ndarray], organism_columns: List[str], time_column: str = "SimulatedTime") -> GrowthFits:
+    if organism_columns:
+        counts = np.column_stack([columns[name] for name in organism_columns])
+    else:
+        counts = np.empty((len(columns[time_column]), 0))
+    return GrowthFits(organism_columns, fit_exponential_growth(columns[time_column], counts), time_column)
+
+
+def get_growth_fits_path(csv_path: Union[str, Path]) -> Path:
+    return Path(csv_path).with_name(GROWTH_FITS_FILENAME)
+
+
+def _growth_fits_key(csv_path: Path, organism_columns: List[str], time_column: str) -> dict:
+    stat = csv_path.stat()
+    return {
+        "version": GROWTH_FITS_VERSION,
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+        "columns": list(organism_columns),
+        "time_column": time_column,
+    }
+
+
+def _read_growth_fits(cache_path: Path, key: dict) -> Union[GrowthFits, None]:
+    try:
+        with np.load(cache_path, allow_pickle=False) as cache:
+            meta = json.loads(str(cache["meta"]))
+            if meta != key:
+                return None
+            records = cache["records"].astype(GROWTH_FIT_DTYPE)
+    except (OSError, KeyError, ValueError, TypeError):
+        return None
+    return GrowthFits(key["columns"], records, key["time_column"])
+
+
+def _write_growth_fits(cache_path: Path, key: dict, fits: GrowthFits):
+    try:
+        with atomic_write(cache_path, "wb") as handle:
+            np.savez(handle, meta=np.array(json.dumps(key)), records=fits.records)
+    except OSError as e:
+        print(f"  Warning: Could not write growth fit cache '{cache_path}': {e}")
+
+
+def load_growth_fits(csv_path: Union[str, Path], stats, time_column: str = "SimulatedTime", use_cache: bool = True) -> Union[GrowthFits, None]:
+    csv_path = Path(csv_path)
+    if time_column not in stats:
+        return None
+    organism_columns = list(stats.organism_columns)
+    cache_path = get_growth_fits_path(csv_path)
+    key = None
+    if use_cache:
+        try:
+            key = _growth_fits_key(csv_path, organism_columns, time_column)
+        except OSError:
+            key = None
+    if key is not None:
+        cached = _read_growth_fits(cache_path, key)
+        if cached is not None:
+            return cached
+    fits = fit_growth_columns(stats.columns, organism_columns, time_column)
+    if key is not None:
+        _write_growth_fits(cache_path, key, fits)
+    return fits
@@ -0,0 +1,174 @@
+import csv
+from pathlib import Path
+from typing import Union, Dict, List
+
+import numpy as np
+
+# Populations below the limit keep their exact count; larger ones share bins about 1% wide so the table stays bounded.
+POPULATION_EXACT_LIMIT = 1024
+POPULATION_BIN_GROWTH = 1.01
+# Relative-error FPS sketch: every bucket value is within 1% of the rows it stands for.
+FPS_SKETCH_ACCURACY = 0.01
+FPS_SKETCH_MIN = 0.01
+FPS_ZERO_BUCKET = np.iinfo(np.int64).min
+FPS_QUANTILES = [0.5, 0.95, 0.99]
+
+_SKETCH_GAMMA = (1 + FPS_SKETCH_ACCURACY) / (1 - FPS_SKETCH_ACCURACY)
+_SKETCH_LOG_GAMMA = np.log(_SKETCH_GAMMA)
+
+
+def population_bins(organism_counts: np.ndarray) -> np.ndarray:
+    counts = np.asarray(organism_counts, dtype=np.int64)
+    scaled = np.maximum(counts, POPULATION_EXACT_LIMIT) / POPULATION_EXACT_LIMIT
+    binned = POPULATION_EXACT_LIMIT + np.floor(np.log(scaled) / np.log(POPULATION_BIN_GROWTH)).astype(np.int64)
+    return np.where(counts < POPULATION_EXACT_LIMIT, counts, binned)
+
+
+def fps_sketch_buckets(fps_values: np.ndarray) -> np.ndarray:
+    fps_values = np.asarray(fps_values, dtype=np.float64)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        buckets = np.ceil(np.log(np.maximum(fps_values, FPS_SKETCH_MIN)) / _SKETCH_LOG_GAMMA).astype(np.int64)
+    return np.where(fps_values > FPS_SKETCH_MIN, buckets, FPS_ZERO_BUCKET)
+
+
+def fps_bucket_values(buckets: np.ndarray) -> np.ndarray:
+    zero = buckets == FPS_ZERO_BUCKET
+    values = 2.0 * np.power(_SKETCH_GAMMA, np.where(zero, 0, buckets).astype(np.float64)) / (_SKETCH_GAMMA + 1.0)
+    return np.where(zero, 0.0, values)
+
+
+def _group_starts(*keys: np.ndarray) -> np.ndarray:
+    changed = np.zeros(len(keys[0]), dtype=bool)
+    changed[0] = True
+    for key in keys:
+        changed[1:] |= key[1:] != key[:-1]
+    return np.flatnonzero(changed)
+
+
+class FpsByPopulation:
+    def __init__(self, arrays: Union[Dict[str, np.ndarray], None] = None):
+        if arrays is None:
+            arrays = {
+                "bins": np.empty(0, dtype=np.int64),
+                "rows": np.empty(0, dtype=np.int64),
+                "fps_sum": np.empty(0),
+                "fps_min": np.empty(0),
+                "fps_max": np.empty(0),
+                "population_sum": np.empty(0),
+                "sketch_bins": np.empty(0, dtype=np.int64),
+                "sketch_buckets": np.empty(0, dtype=np.int64),
+                "sketch_rows": np.empty(0, dtype=np.int64),
+            }
+        self.arrays = arrays
+
+    def __len__(self):
+        return len(self.arrays["bins"])
+
+    def _combine(self, bins, rows, fps_sum, fps_min, fps_max, population_sum, sketch_bins, sketch_buckets, sketch_rows):
+        current = self.arrays
+        bins = np.concatenate([current["bins"], bins])
+        if len(bins) == 0:
+            return
+        order = np.argsort(bins, kind="stable")
+        bins = bins[order]
+        starts = _group_starts(bins)
+        self.arrays = {
+            "bins": bins[starts],
+            "rows": np.add.reduceat(np.concatenate([current["rows"], rows])[order], starts),
+            "fps_sum": np.add.reduceat(np.concatenate([current["fps_sum"], fps_sum])[order], starts),
+            "fps_min": np.minimum.reduceat(np.concatenate([current["fps_min"], fps_min])[order], starts),
+            "fps_max": np.maximum.reduceat(np.concatenate([current["fps_max"], fps_max])[order], starts),
+            "population_sum": np.add.reduceat(np.concatenate([current["population_sum"], population_sum])[order], starts),
+        }
+        sketch_bins = np.concatenate([current["sketch_bins"], sketch_bins])
+        sketch_buckets = np.concatenate([current["sketch_buckets"], sketch_buckets])
+        sketch_rows = np.concatenate([current["sketch_rows"], sketch_rows])
+        order = np.lexsort((sketch_buckets, sketch_bins))
+        sketch_bins, sketch_buckets = sketch_bins[order], sketch_buckets[order]
+        starts = _group_starts(sketch_bins, sketch_buckets)
+        self.arrays["sketch_bins"] = sketch_bins[starts]
+        self.arrays["sketch_buckets"] = sketch_buckets[starts]
+        self.arrays["sketch_rows"] = np.add.reduceat(sketch_rows[order], starts)
+
+    def update(self, organism_counts: np.ndarray, fps_values: np.ndarray):
+        usable = ~(np.isnan(organism_counts) | np.isnan(fps_values))
+        if not usable.any():
+            return
+        counts = organism_counts[usable].astype(np.int64)
+        fps_values = fps_values[usable]
+        bins = population_bins(counts)
+        buckets = fps_sketch_buckets(fps_values)
+        order = np.lexsort((buckets, bins))
+        bins, buckets, counts, fps_values = bins[order], buckets[order], counts[order], fps_values[order]
+        bin_starts = _group_starts(bins)
+        pair_starts = _group_starts(bins, buckets)
+        self._combine(
+            bins[bin_starts],
+            np.diff(np.append(bin_starts, len(bins))),
+            np.add.reduceat(fps_values, bin_starts),
+            np.minimum.reduceat(fps_values, bin_starts),
+            np.maximum.reduceat(fps_values, bin_starts),
+            np.add.reduceat(counts.astype(np.float64), bin_starts),
+            bins[pair_starts],
+            buckets[pair_starts],
+            np.diff(np.append(pair_starts, len(bins))),
+        )
+
+    def merge(self, other: "FpsByPopulation") -> "FpsByPopulation":
+        self._combine(*(other.arrays[name] for name in [
+            "bins", "rows", "fps_sum", "fps_min", "fps_max", "population_sum", "sketch_bins", "sketch_buckets", "sketch_rows"]))
+        return self
+
+    def quantiles(self, quantiles: List[float] = FPS_QUANTILES) -> np.ndarray:
+        arrays = self.arrays
+        result = np.full((len(self), len(quantiles)), np.nan)
+        if len(self) == 0:
+            return result
+        cumulative = np.cumsum(arrays["sketch_rows"])
+        # Rows are grouped by bin in the same order in both tables, so each bin's sketch is a contiguous run.
+        bin_offsets = np.concatenate(([0], np.cumsum(arrays["rows"])[:-1]))
+        values = fps_bucket_values(arrays["sketch_buckets"])
+        for column, quantile in enumerate(quantiles):
+            ranks = bin_offsets + np.floor(quantile * (arrays["rows"] - 1))
+            positions = np.searchsorted(cumulative, ranks, side="right")
+            result[:, column] = np.clip(values[positions], arrays["fps_min"], arrays["fps_max"])
+        return result
+
+    def table(self, quantiles: List[float] = FPS_QUANTILES) -> Dict[str, np.ndarray]:
+        arrays = self.arrays
+        rows = np.maximum(arrays["rows"], 1)
+        table = {
+            "population": arrays["population_sum"] / rows,
+            "rows": arrays["rows"],
+            "mean": arrays["fps_sum"] / rows,
+            "min": arrays["fps_min"],
+            "max": arrays["fps_max"],
+        }
+        for quantile, values in zip(quantiles, self.quantiles(quantiles).T):
+            table[f"p{round(quantile * 100)}"] = values
+        return table
+
+    def to_arrays(self, prefix: str = "fps_population") -> Dict[str, np.ndarray]:
+        return {f"{prefix}_{name}": values for name, values in self.arrays.items()}
+
+    @classmethod
+    def from_arrays(cls, arrays, prefix: str = "fps_population") -> "FpsByPopulation":
+        names = ["bins", "rows", "fps_sum", "fps_min", "fps_max", "population_sum", "sketch_bins", "sketch_buckets", "sketch_rows"]
+        return cls({name: arrays[f"{prefix}_{name}"] for name in names})
+
+
+def write_population_report(fps_by_population: FpsByPopulation, report_path: Union[str, Path]) -> bool:
+    table = fps_by_population.table()
+    try:
+        with open(report_path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f, delimiter=";")
+            writer.writerow(["Organism count", "Rows", "Mean FPS", "Min FPS", "P50 FPS", "P95 FPS", "P99 FPS", "Max FPS"])
+            for i in range(len(table["rows"])):
+                writer.writerow([
+                    f"{table['population'][i]:.0f}", int(table["rows"][i]), f"{table['mean'][i]:.2f}", f"{table['min'][i]:.2f}",
+                    f"{table['p50'][i]:.2f}", f"{table['p95'][i]:.2f}", f"{table['p99'][i]:.2f}", f"{table['max'][i]:.2f}",
+                ])
+        return True
+    except OSError as e:
+        print(f"  Warning: Could not write FPS by population report '{report_path}': {e}")
+        return False
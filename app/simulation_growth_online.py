@@ -0,0 +1,129 @@
+import re
+from pathlib import Path
+from typing import Union, Dict, List
+
+import numpy as np
+
+# Weight kept per simulated second; 0.995 forgets half of the evidence in ~140 s of simulated time.
+GROWTH_FORGETTING_FACTOR = 0.995
+# Below this weighted spread of simulated time (s^2) the slope is not reported.
+GROWTH_MIN_TIME_VARIANCE = 1.0
+# CreatePrefabsOnClick.cs builds each organism as "new <Name>Component{TimeReference=1080f,...}".
+TIME_REFERENCE_PATTERN = re.compile(r"new\s+(\w+?)Component\s*\{[^}]*?TimeReference\s*=\s*([0-9]+(?:\.[0-9]+)?)f?")
+
+
+def read_requested_doubling_times(simulation_folder: Union[str, Path]) -> Dict[str, float]:
+    requested = {}
+    scripts_folder = Path(simulation_folder) / "Assets" / "Scripts"
+    if not scripts_folder.is_dir():
+        return requested
+    for script_path in sorted(scripts_folder.rglob("*.cs")):
+        try:
+            text = script_path.read_text(encoding="utf-8", errors="replace")
+        except OSError as e:
+            print(f"  Warning: Could not read '{script_path}': {e}")
+            continue
+        for organism, seconds in TIME_REFERENCE_PATTERN.findall(text):
+            requested.setdefault(organism, float(seconds))
+    return requested
+
+
+class OnlineGrowthEstimator:
+    def __init__(self, organism_columns: List[str], forgetting_factor: float = GROWTH_FORGETTING_FACTOR,
+                 time_column: str = "SimulatedTime", paused_column: str = "Paused"):
+        self.columns = list(organism_columns)
+        self.log_decay = np.log(forgetting_factor)
+        self.time_column = time_column
+        self.paused_column = paused_column
+        self.reset()
+
+    def reset(self):
+        # Exponentially weighted sums of 1, t, t^2, log(y), t*log(y), with t measured from the latest row.
+        # Their normal equations give the same slope as recursive least squares with this forgetting factor.
+        size = len(self.columns)
+        self.weight = np.zeros(size)
+        self.sum_t = np.zeros(size)
+        self.sum_tt = np.zeros(size)
+        self.sum_y = np.zeros(size)
+        self.sum_ty = np.zeros(size)
+        self.reference_time = None
+        self.rows = 0
+
+    def _shift(self, new_reference: float):
+        elapsed = new_reference - self.reference_time
+        decay = np.exp(self.log_decay * elapsed)
+        self.sum_tt = decay * (self.sum_tt - 2 * elapsed * self.sum_t + elapsed * elapsed * self.weight)
+        self.sum_ty = decay * (self.sum_ty - elapsed * self.sum_y)
+        self.sum_t = decay * (self.sum_t - elapsed * self.weight)
+        self.sum_y = decay * self.sum_y
+        self.weight = decay * self.weight
+        self.reference_time = new_reference
+
+    def update(self, columns: Dict[str, np.ndarray]):
+        times = columns.get(self.time_column)
+        if times is None or len(times) == 0 or not self.columns:
+            return
+        times = np.asarray(times, dtype=np.float64)
+        usable = np.isfinite(times)
+        paused = columns.get(self.paused_column)
+        if paused is not None:
+            # SimulatedTime stands still while paused, so those rows would only repeat the last point.
+            usable &= ~np.asarray(paused, dtype=bool)
+        if not usable.any():
+            return
+        times = times[usable]
+        latest = float(times.max())
+        if self.reference_time is None:
+            self.reference_time = latest
+        elif latest > self.reference_time:
+            self._shift(latest)
+        offsets = times - self.reference_time
+        row_weights = np.exp(self.log_decay * -offsets)
+        counts = np.column_stack([np.asarray(columns[name], dtype=np.float64)[usable] if name in columns
+                                  else np.full(len(times), np.nan) for name in self.columns])
+        with np.errstate(divide="ignore", invalid="ignore"):
+            log_counts = np.log(counts)
+        valid = np.isfinite(log_counts)
+        weights = np.where(valid, row_weights[:, None], 0.0)
+        log_counts = np.where(valid, log_counts, 0.0)
+        weighted_offsets = weights * offsets[:, None]
+        self.weight += weights.sum(axis=0)
+        self.sum_t += weighted_offsets.sum(axis=0)
+        self.sum_tt += (weighted_offsets * offsets[:, None]).sum(axis=0)
+        self.sum_y += (weights * log_counts).sum(axis=0)
+        self.sum_ty += (weighted_offsets * log_counts).sum(axis=0)
+        self.rows += len(times)
+
+    def growth_rates(self) -> np.ndarray:
+        with np.errstate(divide="ignore", invalid="ignore"):
+            mean_t = self.sum_t / self.weight
+            variance = self.sum_tt / self.weight - mean_t * mean_t
+            covariance = self.sum_ty / self.weight - mean_t * self.sum_y / self.weight
+            rates = covariance / variance
+        return np.where((self.weight > 0) & (variance >= GROWTH_MIN_TIME_VARIANCE), rates, np.nan)
+
+    def estimates(self, requested_doubling_times: Union[Dict[str, float], None] = None) -> List[dict]:
+        requested_doubling_times = requested_doubling_times or {}
+        estimates = []
+        for column, rate in zip(self.columns, self.growth_rates()):
+            doubling_time = np.log(2) / rate if np.isfinite(rate) and rate > 0 else np.nan
+            requested = requested_doubling_times.get(column, np.nan)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                deviation = (doubling_time - requested) / requested
+            estimates.append({"column": column, "growth_rate": float(rate), "doubling_time": float(doubling_time),
+                              "requested_doubling_time": float(requested), "deviation": float(deviation)})
+        return estimates
+
+    def summary(self, requested_doubling_times: Union[Dict[str, float], None] = None) -> str:
+        parts = []
+        for estimate in self.estimates(requested_doubling_times):
+            if not np.isfinite(estimate["growth_rate"]):
+                parts.append(f"{estimate['column']}: estimating...")
+                continue
+            text = f"{estimate['column']}: r={estimate['growth_rate']:.4g}/s"
+            if np.isfinite(estimate["doubling_time"]):
+                text += f", doubling {estimate['doubling_time']:.0f}s"
+            if np.isfinite(estimate["deviation"]):
+                text += f" ({estimate['deviation']:+.0%} vs requested {estimate['requested_doubling_time']:.0f}s)"
+            parts.append(text)
+        return "   ".join(parts) if parts else "No organism columns to estimate growth from."
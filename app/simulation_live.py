@@ -0,0 +1,131 @@
+from typing import Dict
+
+import numpy as np
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+
+TIMESTAMP_COLUMN = "Timestamp"
+TOTAL_ORGANISMS_COLUMN = "Organism count"
+LIVE_WINDOW_SECONDS = 600
+LIVE_REFRESH_MS = 1000
+# Enough trailing CSV to fill the window at a few hundred rows per second, without replaying a long run.
+LIVE_BACKLOG_BYTES = 8 * 1024 * 1024
+LIVE_FIGSIZE = (8, 5)
+LIVE_Y_HEADROOM = 1.15
+
+
+class LiveStatsChart:
+    def __init__(self, master, window_seconds: int = LIVE_WINDOW_SECONDS, figsize=LIVE_FIGSIZE):
+        self.window_seconds = window_seconds
+        self.figure = Figure(figsize=figsize)
+        self.fps_axes = self.figure.add_subplot(2, 1, 1)
+        self.organisms_axes = self.figure.add_subplot(2, 1, 2, sharex=self.fps_axes)
+        self.fps_line, = self.fps_axes.plot([], [], color="blue", animated=True)
+        self.organisms_line, = self.organisms_axes.plot([], [], color="purple", animated=True)
+        self.fps_axes.set_ylabel("FPS (mean per second)")
+        self.organisms_axes.set_ylabel("Total Organisms")
+        self.organisms_axes.set_xlabel("Seconds before latest row")
+        self.fps_axes.set_xlim(-window_seconds, 0)
+        for axes in (self.fps_axes, self.organisms_axes):
+            axes.grid(True, linestyle='--', alpha=0.6)
+        self.figure.tight_layout()
+        self.canvas = FigureCanvasTkAgg(self.figure, master=master)
+        self.canvas.mpl_connect("draw_event", self._capture_background)
+        self.reset()
+
+    def widget(self):
+        return self.canvas.get_tk_widget()
+
+    def reset(self):
+        self.seconds = np.empty(0, dtype=np.int64)
+        self.fps_sums = np.empty(0, dtype=np.float64)
+        self.fps_rows = np.empty(0, dtype=np.int64)
+        self.organisms = np.empty(0, dtype=np.float64)
+        self.total_rows = 0
+        self.total_fps_sum = 0.0
+        self.total_fps_rows = 0
+        for axes in (self.fps_axes, self.organisms_axes):
+            axes.set_ylim(0, 1)
+        self._background = None
+
+    def _capture_background(self, event=None):
+        self._background = self.canvas.copy_from_bbox(self.figure.bbox)
+        self._draw_lines()
+
+    def _draw_lines(self):
+        self.fps_axes.draw_artist(self.fps_line)
+        self.organisms_axes.draw_artist(self.organisms_line)
+
+    def append(self, columns: Dict[str, np.ndarray]):
+        timestamps = columns.get(TIMESTAMP_COLUMN)
+        if timestamps is None or len(timestamps) == 0:
+            return
+        fps = columns.get("FPS", np.full(len(timestamps), np.nan))
+        organisms = columns.get(TOTAL_ORGANISMS_COLUMN, np.full(len(timestamps), np.nan))
+        self.total_rows += len(timestamps)
+        finite_fps = ~np.isnan(fps)
+        self.total_fps_sum += float(fps[finite_fps].sum())
+        self.total_fps_rows += int(finite_fps.sum())
+
+        seconds, inverse = np.unique(timestamps, return_inverse=True)
+        fps_sums = np.bincount(inverse, weights=np.where(finite_fps, fps, 0.0), minlength=len(seconds))
+        fps_rows = np.bincount(inverse, weights=finite_fps, minlength=len(seconds)).astype(np.int64)
+        last_rows = np.zeros(len(seconds), dtype=np.int64)
+        np.maximum.at(last_rows, inverse, np.arange(len(timestamps)))
+        last_organisms = organisms[last_rows]
+
+        if len(self.seconds) and seconds[0] <= self.seconds[-1]:
+            # Rows of the second already on screen arrive split across logger batches.
+            overlap = seconds <= self.seconds[-1]
+            same = seconds == self.seconds[-1]
+            if same.any():
+                self.fps_sums[-1] += fps_sums[same].sum()
+                self.fps_rows[-1] += fps_rows[same].sum()
+                self.organisms[-1] = last_organisms[same][-1]
+            seconds, fps_sums, fps_rows, last_organisms = seconds[~overlap], fps_sums[~overlap], fps_rows[~overlap], last_organisms[~overlap]
+
+        keep_after = (seconds[-1] if len(seconds) else self.seconds[-1]) - self.window_seconds
+        keep = self.seconds > keep_after
+        self.seconds = np.concatenate([self.seconds[keep], seconds])
+        self.fps_sums = np.concatenate([self.fps_sums[keep], fps_sums])
+        self.fps_rows = np.concatenate([self.fps_rows[keep], fps_rows])
+        self.organisms = np.concatenate([self.organisms[keep], last_organisms])
+
+    def _fit_y_limits(self, axes, values: np.ndarray) -> bool:
+        finite = values[np.isfinite(values)]
+        if len(finite) == 0:
+            return False
+        low, high = axes.get_ylim()
+        data_low, data_high = min(0.0, float(finite.min())), float(finite.max())
+        if data_low >= low and data_high <= high:
+            return False
+        axes.set_ylim(min(low, data_low), max(high, data_high * LIVE_Y_HEADROOM, 1.0))
+        return True
+
+    def redraw(self):
+        if len(self.seconds):
+            offsets = self.seconds - self.seconds[-1]
+            with np.errstate(invalid="ignore", divide="ignore"):
+                fps_means = np.where(self.fps_rows > 0, self.fps_sums / self.fps_rows, np.nan)
+        else:
+            offsets = fps_means = np.empty(0)
+        self.fps_line.set_data(offsets, fps_means)
+        self.organisms_line.set_data(offsets, self.organisms)
+        limits_changed = self._fit_y_limits(self.fps_axes, fps_means)
+        limits_changed = self._fit_y_limits(self.organisms_axes, self.organisms) or limits_changed
+        if limits_changed or self._background is None:
+            # A full draw refreshes the axes and re-captures the blit background through draw_event.
+            self.canvas.draw_idle()
+            return
+        self.canvas.restore_region(self._background)
+        self._draw_lines()
+        self.canvas.blit(self.figure.bbox)
+
+    def summary(self) -> str:
+        if not len(self.seconds):
+            return "Waiting for statistics rows..."
+        latest_fps = self.fps_sums[-1] / self.fps_rows[-1] if self.fps_rows[-1] else float("nan")
+        mean_fps = self.total_fps_sum / self.total_fps_rows if self.total_fps_rows else float("nan")
+        latest_time = np.datetime64(int(self.seconds[-1]), "s").astype(str).replace("T", " ")
+        return (f"Rows: {self.total_rows:,}   Last update: {latest_time}   "
+                f"FPS: {latest_fps:.1f} (run mean {mean_fps:.1f})   Organisms: {self.organisms[-1]:.0f}")
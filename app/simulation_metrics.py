@@ -0,0 +1,72 @@
+from typing import Union, Dict
+
+import numpy as np
+
+# sklearn's mean_absolute_percentage_error divides by max(|y|, eps), so zero counts give huge but finite errors.
+MAPE_EPSILON = np.finfo(np.float64).eps
+
+
+def _as_columns(observed: np.ndarray, predicted: np.ndarray, valid: Union[np.ndarray, None] = None):
+    observed = np.asarray(observed, dtype=np.float64)
+    predicted = np.asarray(predicted, dtype=np.float64)
+    if observed.ndim == 1:
+        observed = observed[:, None]
+    if predicted.ndim == 1:
+        predicted = predicted[:, None]
+    predicted = np.broadcast_to(predicted, observed.shape)
+    if valid is None:
+        valid = np.isfinite(observed) & np.isfinite(predicted)
+    else:
+        valid = np.broadcast_to(np.asarray(valid, dtype=bool).reshape(observed.shape[0], -1), observed.shape)
+    return observed, predicted, valid
+
+
+def regression_metrics(observed: np.ndarray, predicted: np.ndarray, valid: Union[np.ndarray, None] = None,
+                       param_count: int = 0) -> Dict[str, np.ndarray]:
+    # Every column of an (n, k) block is scored at once; rows outside `valid` are ignored per column.
+    observed, predicted, valid = _as_columns(observed, predicted, valid)
+    counts = valid.sum(axis=0)
+    safe_counts = np.maximum(counts, 1)
+    observed = np.where(valid, observed, 0.0)
+    with np.errstate(over="ignore", invalid="ignore"):
+        residuals = np.where(valid, observed - predicted, 0.0)
+        rss = (residuals ** 2).sum(axis=0)
+        means = observed.sum(axis=0) / safe_counts
+        total = np.where(valid, (observed - means) ** 2, 0.0).sum(axis=0)
+        absolute_percentage = np.where(valid, np.abs(residuals) / np.maximum(np.abs(observed), MAPE_EPSILON), 0.0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        r_squared = 1.0 - rss / total
+        # Same convention as sklearn's r2_score for constant targets.
+        constant = total == 0
+        r_squared[constant] = np.where(rss[constant] == 0, 1.0, 0.0)
+        rmse = np.sqrt(rss / safe_counts)
+        mae = np.abs(residuals).sum(axis=0) / safe_counts
+        mape = absolute_percentage.sum(axis=0) / safe_counts
+        log_likelihood_term = counts * np.log(np.maximum(rss, np.finfo(np.float64).tiny) / safe_counts)
+    aic = log_likelihood_term + 2 * param_count
+    bic = log_likelihood_term + param_count * np.log(safe_counts)
+    metrics = {"rss": rss, "r_squared": r_squared, "rmse": rmse, "mae": mae, "mape": mape, "aic": aic, "bic": bic, "points": counts}
+    empty = counts == 0
+    for name in ("rss", "r_squared", "rmse", "mae", "mape", "aic", "bic"):
+        metrics[name] = np.where(empty | ~np.isfinite(rss), np.nan, metrics[name])
+    return metrics
+
+
+def r2_scores(observed: np.ndarray, predicted: np.ndarray, valid: Union[np.ndarray, None] = None) -> np.ndarray:
+    return regression_metrics(observed, predicted, valid)["r_squared"]
+
+
+def rmse_scores(observed: np.ndarray, predicted: np.ndarray, valid: Union[np.ndarray, None] = None) -> np.ndarray:
+    return regression_metrics(observed, predicted, valid)["rmse"]
+
+
+def mae_scores(observed: np.ndarray, predicted: np.ndarray, valid: Union[np.ndarray, None] = None) -> np.ndarray:
+    return regression_metrics(observed, predicted, valid)["mae"]
+
+
+def mape_scores(observed: np.ndarray, predicted: np.ndarray, valid: Union[np.ndarray, None] = None) -> np.ndarray:
+    return regression_metrics(observed, predicted, valid)["mape"]
+
+
+def aic_scores(observed: np.ndarray, predicted: np.ndarray, param_count: int, valid: Union[np.ndarray, None] = None) -> np.ndarray:
+    return regression_metrics(observed, predicted, valid, param_count)["aic"]
@@ -0,0 +1,275 @@
+import json
+import os
+from pathlib import Path
+from typing import Union, Dict, List, Tuple
+
+import numpy as np
+
+from simulation_files import atomic_write
+from simulation_fitting import fit_exponential_growth
+from simulation_metrics import regression_metrics
+from simulation_workers import run_in_spawn_pool
+
+GROWTH_MODELS_FILENAME = "SimulationStats.models.npz"
+GROWTH_MODELS_VERSION = 2
+GROWTH_MODEL_NAMES = ["exponential", "logistic", "gompertz"]
+GROWTH_MODEL_LABELS = {"exponential": "Exp", "logistic": "Logistic", "gompertz": "Gompertz"}
+GROWTH_MODEL_CRITERIA = ["aic", "bic"]
+DEFAULT_MODEL_CRITERION = "aic"
+# Nonlinear fits run on evenly spaced samples; AIC/BIC are still scored on every row.
+MODEL_FIT_MAX_POINTS = 20000
+# The linearized logistic and Gompertz starts need a carrying capacity strictly above every count.
+MODEL_CAPACITY_HEADROOM = 1.05
+MODEL_MIN_RATE = 1e-9
+MODEL_MAXFEV = 10000
+GROWTH_MODEL_DTYPE = np.dtype([
+    ("params", np.float64, (3,)),
+    ("rss", np.float64),
+    ("aic", np.float64),
+    ("bic", np.float64),
+    ("r_squared", np.float64),
+    ("rmse", np.float64),
+    ("mape", np.float64),
+    ("points", np.int64),
+    ("converged", np.bool_),
+])
+
+
+def exponential_model(x, a, b):
+    return a * np.exp(b * x)
+
+
+def logistic_model(x, capacity, rate, midpoint):
+    return capacity / (1.0 + np.exp(-rate * (x - midpoint)))
+
+
+def gompertz_model(x, capacity, rate, midpoint):
+    return capacity * np.exp(-np.exp(-rate * (x - midpoint)))
+
+
+GROWTH_MODEL_FUNCS = {"exponential": exponential_model, "logistic": logistic_model, "gompertz": gompertz_model}
+GROWTH_MODEL_PARAM_NAMES = {"exponential": ["a", "b"], "logistic": ["K", "r", "t0"], "gompertz": ["K", "r", "t0"]}
+
+
+def evaluate_growth_model(model: str, x: np.ndarray, params) -> np.ndarray:
+    param_count = len(GROWTH_MODEL_PARAM_NAMES[model])
+    with np.errstate(over="ignore", invalid="ignore"):
+        return GROWTH_MODEL_FUNCS[model](np.asarray(x, dtype=np.float64), *list(params)[:param_count])
+
+
+def _linear_fits(times: np.ndarray, transformed: np.ndarray, valid: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    counts = valid.sum(axis=0)
+    safe_counts = np.maximum(counts, 1)
+    x = np.where(valid, times, 0.0)
+    y = np.where(valid, transformed, 0.0)
+    mean_x = x.sum(axis=0) / safe_counts
+    mean_y = y.sum(axis=0) / safe_counts
+    centered = np.where(valid, x - mean_x, 0.0)
+    spread = (centered ** 2).sum(axis=0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        slopes = np.where(spread > 0, (centered * (y - mean_y)).sum(axis=0) / spread, np.nan)
+    slopes[counts < 2] = np.nan
+    return slopes, mean_y - slopes * mean_x
+
+
+def initial_model_params(time_values: np.ndarray, counts: np.ndarray) -> Dict[str, np.ndarray]:
+    # Every model is linear in t after a transform, so all columns get their starting point from one least-squares pass.
+    times = np.asarray(time_values, dtype=np.float64)[:, None]
+    counts = np.asarray(counts, dtype=np.float64)
+    exponential = fit_exponential_growth(time_values, counts)
+    starts = {"exponential": np.column_stack([exponential["a"], exponential["b"], np.zeros(counts.shape[1])])}
+    capacities = np.where(np.isfinite(counts), counts, -np.inf).max(axis=0, initial=-np.inf) * MODEL_CAPACITY_HEADROOM
+    inside = np.isfinite(times) & np.isfinite(counts) & (counts > 0) & (counts < capacities)
+    fractions = np.where(inside, counts / capacities, 0.5)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        transforms = {
+            "logistic": np.log(fractions / (1.0 - fractions)),
+            "gompertz": -np.log(-np.log(fractions)),
+        }
+    for model, transformed in transforms.items():
+        slopes, intercepts = _linear_fits(times, transformed, inside & np.isfinite(transformed))
+        rates = np.maximum(np.where(np.isfinite(slopes), slopes, MODEL_MIN_RATE), MODEL_MIN_RATE)
+        midpoints = np.where(np.isfinite(intercepts), -intercepts / rates, 0.0)
+        starts[model] = np.column_stack([capacities, rates, midpoints])
+    return starts
+
+
+def _model_bounds(model: str):
+    if model == "exponential":
+        return [0, -np.inf], [np.inf, np.inf]
+    return [0, 0, -np.inf], [np.inf, np.inf, np.inf]
+
+
+def _fit_model(column: str, model: str, time_values: np.ndarray, counts: np.ndarray, start: np.ndarray) -> Tuple[str, str, np.ndarray, bool, List[str]]:
+    from scipy.optimize import curve_fit
+    messages = []
+    param_count = len(GROWTH_MODEL_PARAM_NAMES[model])
+    params = np.array(start, dtype=np.float64)
+    if not np.isfinite(params[:param_count]).all():
+        return column, model, params, False, messages
+    lower, upper = _model_bounds(model)
+    try:
+        with np.errstate(over="ignore", invalid="ignore"):
+            fitted, _ = curve_fit(GROWTH_MODEL_FUNCS[model], time_values, counts, p0=np.clip(params[:param_count], lower, upper),
+                                  bounds=(lower, upper), maxfev=MODEL_MAXFEV)
+    except (RuntimeError, ValueError) as e:
+        messages.append(f"  Warning: {model} fit did not converge for '{column}'; scoring its closed-form start instead. {e}")
+        return column, model, params, False, messages
+    params[:param_count] = fitted
+    return column, model, params, True, messages
+
+
+def _sample_indices(valid: np.ndarray, max_points: int) -> np.ndarray:
+    indices = np.flatnonzero(valid)
+    if len(indices) > max_points:
+        indices = indices[np.linspace(0, len(indices) - 1, max_points).astype(np.int64)]
+    return indices
+
+
+class GrowthModelSelection:
+    def __init__(self, columns: List[str], records: np.ndarray, criterion: str = DEFAULT_MODEL_CRITERION, time_column: str = "SimulatedTime"):
+        self.columns = list(columns)
+        self.records = records
+        self.criterion = criterion
+        self.time_column = time_column
+
+    def __len__(self):
+        return len(self.columns)
+
+    def __contains__(self, column):
+        return column in self.columns
+
+    def _entry(self, column_index: int, model_index: int) -> dict:
+        record = self.records[column_index, model_index]
+        model = GROWTH_MODEL_NAMES[model_index]
+        entry = {name: record[name].item() for name in GROWTH_MODEL_DTYPE.names if name != "params"}
+        entry["model"] = model
+        entry["params"] = dict(zip(GROWTH_MODEL_PARAM_NAMES[model], record["params"].tolist()))
+        rate = record["params"][1]
+        # Exponential and logistic growth double every ln(2)/r early on; Gompertz has no constant doubling time.
+        entry["doubling_time"] = float(np.log(2.0) / rate) if model != "gompertz" and rate > 0 else np.nan
+        return entry
+
+    def ranking(self, column) -> List[dict]:
+        column_index = self.columns.index(column)
+        scores = self.records[column_index][self.criterion]
+        order = np.argsort(np.where(np.isfinite(scores), scores, np.inf), kind="stable")
+        return [self._entry(column_index, int(model_index)) for model_index in order if np.isfinite(scores[model_index])]
+
+    def best(self, column) -> Union[dict, None]:
+        ranking = self.ranking(column)
+        return ranking[0] if ranking else None
+
+    def items(self):
+        return [(column, self.best(column)) for column in self.columns]
+
+
+def describe_growth_model(entry: dict) -> str:
+    params = ", ".join(f"{name}={value:.3g}" for name, value in entry["params"].items())
+    return f"{GROWTH_MODEL_LABELS[entry['model']]}: {params}, R²={entry['r_squared']:.2f}, RMSE={entry['rmse']:.3g}"
+
+
+def _score_models(time_values: np.ndarray, counts: np.ndarray, records: np.ndarray):
+    # One pass per model scores every organism column together.
+    times = np.asarray(time_values, dtype=np.float64)[:, None]
+    valid = np.isfinite(times) & np.isfinite(counts)
+    for model_index, model in enumerate(GROWTH_MODEL_NAMES):
+        param_count = len(GROWTH_MODEL_PARAM_NAMES[model])
+        params = records[:, model_index]["params"][:, :param_count]
+        predicted = evaluate_growth_model(model, times, params.T)
+        metrics = regression_metrics(counts, predicted, valid, param_count)
+        scored = np.isfinite(params).all(axis=1) & (metrics["points"] > param_count)
+        for name in ("rss", "aic", "bic", "r_squared", "rmse", "mape"):
+            records[name][:, model_index] = np.where(scored, metrics[name], np.nan)
+        records["points"][:, model_index] = metrics["points"]
+
+
+def fit_growth_models(columns: Dict[str, np.ndarray], organism_columns: List[str], time_column: str = "SimulatedTime",
+                      criterion: str = DEFAULT_MODEL_CRITERION, max_workers: Union[int, None] = None) -> GrowthModelSelection:
+    time_values = np.asarray(columns[time_column], dtype=np.float64)
+    if organism_columns:
+        counts = np.column_stack([np.asarray(columns[name], dtype=np.float64) for name in organism_columns])
+    else:
+        counts = np.empty((len(time_values), 0))
+    records = np.zeros((counts.shape[1], len(GROWTH_MODEL_NAMES)), dtype=GROWTH_MODEL_DTYPE)
+    starts = initial_model_params(time_values, counts)
+    pending = {}
+    for column_index, column in enumerate(organism_columns):
+        indices = _sample_indices(np.isfinite(time_values) & np.isfinite(counts[:, column_index]), MODEL_FIT_MAX_POINTS)
+        for model_index, model in enumerate(GROWTH_MODEL_NAMES):
+            records[column_index, model_index]["params"] = starts[model][column_index]
+            if len(indices) > len(GROWTH_MODEL_PARAM_NAMES[model]):
+                pending[(column, model)] = (time_values[indices], counts[indices, column_index], starts[model][column_index])
+
+    def store(key, result):
+        column, model, params, converged, messages = result
+        for message in messages:
+            print(message)
+        record = records[organism_columns.index(column), GROWTH_MODEL_NAMES.index(model)]
+        record["params"] = params
+        record["converged"] = converged
+
+    worker_count = min(len(pending), max_workers or os.cpu_count() or 1)
+    run_in_spawn_pool(_fit_model, {(column, model): (column, model, *arguments) for (column, model), arguments in pending.items()},
+                      worker_count, store, "model fitting")
+    _score_models(time_values, counts, records)
+    return GrowthModelSelection(organism_columns, records, criterion, time_column)
+
+
+def get_growth_models_path(csv_path: Union[str, Path]) -> Path:
+    return Path(csv_path).with_name(GROWTH_MODELS_FILENAME)
+
+
+def _growth_models_key(csv_path: Path, organism_columns: List[str], time_column: str) -> dict:
+    stat = csv_path.stat()
+    return {
+        "version": GROWTH_MODELS_VERSION,
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+        "columns": list(organism_columns),
+        "time_column": time_column,
+        "models": GROWTH_MODEL_NAMES,
+    }
+
+
+def _read_growth_models(cache_path: Path, key: dict, criterion: str) -> Union[GrowthModelSelection, None]:
+    try:
+        with np.load(cache_path, allow_pickle=False) as cache:
+            meta = json.loads(str(cache["meta"]))
+            if meta != key:
+                return None
+            records = cache["records"].astype(GROWTH_MODEL_DTYPE)
+    except (OSError, KeyError, ValueError, TypeError):
+        return None
+    return GrowthModelSelection(key["columns"], records, criterion, key["time_column"])
+
+
+def _write_growth_models(cache_path: Path, key: dict, selection: GrowthModelSelection):
+    try:
+        with atomic_write(cache_path, "wb") as handle:
+            np.savez(handle, meta=np.array(json.dumps(key)), records=selection.records)
+    except OSError as e:
+        print(f"  Warning: Could not write growth model cache '{cache_path}': {e}")
+
+
+def load_growth_models(csv_path: Union[str, Path], stats, organism_columns: Union[List[str], None] = None, time_column: str = "SimulatedTime",
+                       criterion: str = DEFAULT_MODEL_CRITERION, use_cache: bool = True) -> Union[GrowthModelSelection, None]:
+    csv_path = Path(csv_path)
+    if time_column not in stats:
+        return None
+    organism_columns = list(stats.organism_columns if organism_columns is None else organism_columns)
+    cache_path = get_growth_models_path(csv_path)
+    key = None
+    if use_cache:
+        try:
+            key = _growth_models_key(csv_path, organism_columns, time_column)
+        except OSError:
+            key = None
+    if key is not None:
+        cached = _read_growth_models(cache_path, key, criterion)
+        if cached is not None:
+            return cached
+    selection = fit_growth_models(stats.columns, organism_columns, time_column, criterion)
+    if key is not None:
+        _write_growth_models(cache_path, key, selection)
+    return selection
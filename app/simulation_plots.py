@@ -0,0 +1,478 @@
+import json
+import os
+import traceback
+from multiprocessing import shared_memory
+from pathlib import Path
+from typing import Union, Dict, List, Tuple
+
+import numpy as np
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+from simulation_decimation import decimate_series
+from simulation_files import atomic_write
+from simulation_fitting import exponential_func, fit_growth_columns
+from simulation_models import evaluate_growth_model, describe_growth_model
+from simulation_workers import run_in_spawn_pool
+
+TIMESTAMP_COLUMN = "Timestamp"
+TOTAL_ORGANISMS_COLUMN = "Organism count"
+GROUPED_COUNTS_COLUMN = "__grouped_organism_count"
+GROUPED_FPS_COLUMN = "__grouped_fps"
+GROUPED_QUANTILE_COLUMNS = {"p50": "__grouped_fps_p50", "p95": "__grouped_fps_p95", "p99": "__grouped_fps_p99"}
+PLOT_FIGSIZE = (12, 6)
+PLOT_DPI = 100
+FIT_PLOT_FIGSIZE = (14, 7)
+PLOT_DECIMATION_METHOD = "lttb"
+GRAPH_MANIFEST_FILENAME = "graphs_manifest.json"
+GRAPH_MANIFEST_VERSION = 1
+
+
+def _new_axes(figsize=PLOT_FIGSIZE):
+    figure = Figure(figsize=figsize, dpi=PLOT_DPI)
+    FigureCanvasAgg(figure)
+    return figure, figure.add_subplot()
+
+
+def _plot_decimated(figure, axes, x, y, **kwargs):
+    # One point per horizontal pixel is all the saved PNG can show; LTTB keeps the peaks and dips.
+    max_points = int(figure.get_figwidth() * figure.dpi)
+    x, y = decimate_series(x, y, max_points, PLOT_DECIMATION_METHOD)
+    return axes.plot(x, y, **kwargs)
+
+
+def _plot_time_metric(figure, axes, columns, metric, rollup=None, color=None, **kwargs):
+    if rollup is not None and metric in rollup:
+        starts, minimums, maximums, means = rollup[metric]
+        bucket_times = starts.astype("datetime64[s]")
+        lines = axes.plot(bucket_times, means, color=color, **kwargs)
+        axes.fill_between(bucket_times, minimums, maximums, color=lines[0].get_color(), alpha=0.2, linewidth=0)
+        return lines
+    return _plot_decimated(figure, axes, columns[TIMESTAMP_COLUMN].astype("datetime64[s]"), columns[metric], color=color, **kwargs)
+
+
+def _finish_time_axes(figure, axes, title: str, ylabel: str, legend: bool = False):
+    axes.set_title(title)
+    axes.set_xlabel("Timestamp")
+    axes.set_ylabel(ylabel)
+    figure.autofmt_xdate(rotation=45, ha="right")
+    if legend:
+        axes.legend()
+    axes.grid(True, linestyle='--', alpha=0.6)
+    figure.tight_layout()
+
+
+def _save_figure(figure, output_folder: str, file_name: str, messages: List[str]) -> Union[bool, None]:
+    try:
+        figure.savefig(str(Path(output_folder) / file_name))
+        return True
+    except Exception as e:
+        messages.append(f"Error saving {file_name}: {e}")
+        return None
+
+
+def plot_fps_over_time(columns, simulation_name, output_folder, messages, rollup=None, **options):
+    figure, axes = _new_axes()
+    _plot_time_metric(figure, axes, columns, "FPS", rollup, marker=".", linestyle="-", color="blue")
+    _finish_time_axes(figure, axes, f"FPS over Time ({simulation_name})", "FPS")
+    return _save_figure(figure, output_folder, "fps_over_time.png", messages)
+
+
+def plot_time_comparison(columns, simulation_name, output_folder, messages, **options):
+    figure, axes = _new_axes()
+    timestamps = columns[TIMESTAMP_COLUMN].astype("datetime64[s]")
+    _plot_decimated(figure, axes, timestamps, columns["RealTime"], label="RealTime", marker=".", linestyle="-")
+    _plot_decimated(figure, axes, timestamps, columns["SimulatedTime"], label="SimulatedTime", marker=".", linestyle="-", color="orange")
+    _finish_time_axes(figure, axes, f"RealTime vs SimulatedTime ({simulation_name})", "Time (s)", legend=True)
+    return _save_figure(figure, output_folder, "time_comparison.png", messages)
+
+
+def plot_organism_counts(columns, simulation_name, output_folder, messages, organism_columns=(), rollup=None, **options):
+    figure, axes = _new_axes()
+    for col in organism_columns:
+        _plot_time_metric(figure, axes, columns, col, rollup, label=col, marker=".", linestyle="-")
+    _finish_time_axes(figure, axes, f"Organism Counts over Time ({simulation_name})", "Count", legend=True)
+    return _save_figure(figure, output_folder, "organism_counts.png", messages)
+
+
+def plot_total_organisms(columns, simulation_name, output_folder, messages, rollup=None, **options):
+    figure, axes = _new_axes()
+    _plot_time_metric(figure, axes, columns, TOTAL_ORGANISMS_COLUMN, rollup, marker=".", linestyle="-", color="purple")
+    _finish_time_axes(figure, axes, f"Total Organisms over Time ({simulation_name})", "Total Count")
+    return _save_figure(figure, output_folder, "total_organisms.png", messages)
+
+
+def plot_frame_count(columns, simulation_name, output_folder, messages, **options):
+    figure, axes = _new_axes()
+    _plot_decimated(figure, axes, columns[TIMESTAMP_COLUMN].astype("datetime64[s]"), columns["FrameCount"], marker=".", linestyle="-", color="darkcyan")
+    _finish_time_axes(figure, axes, f"Frame Count over Time ({simulation_name})", "Frame Count")
+    return _save_figure(figure, output_folder, "frame_count.png", messages)
+
+
+def plot_fps_histogram(columns, simulation_name, output_folder, messages, **options):
+    fps_values = columns["FPS"]
+    fps_values = fps_values[~np.isnan(fps_values)]
+    if len(fps_values) == 0:
+        messages.append("Column 'FPS' found but contains no valid data, skipping FPS histogram.")
+        return False
+    figure, axes = _new_axes()
+    axes.hist(fps_values, bins=20, color="green", edgecolor="black")
+    axes.set_title(f"FPS Distribution ({simulation_name})")
+    axes.set_xlabel("FPS")
+    axes.set_ylabel("Frequency")
+    axes.grid(True, axis='y', linestyle='--', alpha=0.6)
+    figure.tight_layout()
+    return _save_figure(figure, output_folder, "fps_histogram.png", messages)
+
+
+def plot_total_organisms_vs_fps(columns, simulation_name, output_folder, messages, **options):
+    figure, axes = _new_axes()
+    populations = columns[GROUPED_COUNTS_COLUMN]
+    _plot_decimated(figure, axes, populations, columns[GROUPED_FPS_COLUMN], label="Mean", marker="o", linestyle="-", color="red")
+    for (label, column), color in zip(GROUPED_QUANTILE_COLUMNS.items(), ["darkorange", "teal", "slateblue"]):
+        if column in columns:
+            _plot_decimated(figure, axes, populations, columns[column], label=label.upper(), linestyle="--", color=color)
+    axes.set_title(f"Average FPS per Total Organisms ({simulation_name})")
+    axes.set_xlabel("Total Organisms")
+    axes.set_ylabel("Average FPS")
+    axes.legend()
+    axes.grid(True, linestyle='--', alpha=0.6)
+    figure.tight_layout()
+    return _save_figure(figure, output_folder, "total_organisms_vs_fps.png", messages)
+
+
+def plot_organisms_vs_simulated_time_fit(columns, simulation_name, output_folder, messages, organism_columns=(), growth_fits=None, growth_models=None, **options):
+    figure, axes = _new_axes(FIT_PLOT_FIGSIZE)
+    plotted_something = False
+    actual_organisms_plotted = []
+    time_data_full = columns["SimulatedTime"]
+    if growth_fits is None:
+        growth_fits = dict(fit_growth_columns(columns, list(organism_columns)).items())
+    for col in organism_columns:
+        organism_data_full = columns[col]
+        valid_indices = ~np.isnan(organism_data_full) & ~np.isnan(time_data_full)
+        time_data_clean = time_data_full[valid_indices]
+        organism_data_clean = organism_data_full[valid_indices]
+        if len(time_data_clean) > 0:
+            _plot_decimated(figure, axes, time_data_clean, organism_data_clean, label=f"{col}", marker=".", linestyle="-", alpha=0.7)
+            plotted_something = True
+            if col not in actual_organisms_plotted:
+                actual_organisms_plotted.append(col)
+        else:
+            messages.append(f"  Warning: No valid numeric data for '{col}' on Y-axis or corresponding 'SimulatedTime'.")
+            continue
+        fit = growth_fits.get(col)
+        best = (growth_models or {}).get(col)
+        if len(time_data_clean) < 2:
+            messages.append(f"  Warning: Not enough data points ({len(time_data_clean)}) to fit curve for '{col}'.")
+        elif best is not None:
+            time_fit = np.linspace(time_data_clean.min(), time_data_clean.max(), 100)
+            organism_fit = evaluate_growth_model(best["model"], time_fit, best["params"].values())
+            axes.plot(time_fit, organism_fit, label=f"{col} ({describe_growth_model(best)})", linestyle="--")
+        elif fit is None or not (np.isfinite(fit["a"]) and np.isfinite(fit["b"])):
+            messages.append(f"  Warning: Could not fit exponential curve for '{col}'. Fewer than 2 positive counts.")
+        else:
+            time_fit = np.linspace(time_data_clean.min(), time_data_clean.max(), 100)
+            organism_fit = exponential_func(time_fit, fit["a"], fit["b"])
+            label_fit = f"{col} (Exp: a={fit['a']:.2f}, b={fit['b']:.3f}, R²={fit['r_squared']:.2f})"
+            axes.plot(time_fit, organism_fit, label=label_fit, linestyle="--")
+    if not plotted_something:
+        messages.append("  Nothing plotted for Organisms vs Simulated Time (no valid data or only 'Organism count' found).")
+        return False
+    fit_title = "Best-Fit Growth Model" if growth_models else "Exponential Fit"
+    axes.set_title(f"Specific Organism Count & {fit_title} over Simulated Time ({simulation_name})")
+    axes.set_xlabel("Simulated Time (s)")
+    axes.set_ylabel("Organism Count")
+    if len(actual_organisms_plotted) > 2:
+        axes.legend(bbox_to_anchor=(1.04, 1), loc="upper left")
+        figure.tight_layout(rect=[0, 0, 0.85, 1])
+    else:
+        axes.legend()
+        figure.tight_layout()
+    axes.grid(True, linestyle='--', alpha=0.6)
+    saved = _save_figure(figure, output_folder, "organisms_vs_simulated_time_fit.png", messages)
+    if saved:
+        messages.append("  Graph 'organisms_vs_simulated_time_fit.png' saved (excluding 'Organism count').")
+    return saved
+
+
+PLOT_JOBS = {
+    "fps_over_time": plot_fps_over_time,
+    "time_comparison": plot_time_comparison,
+    "organism_counts": plot_organism_counts,
+    "total_organisms": plot_total_organisms,
+    "frame_count": plot_frame_count,
+    "fps_histogram": plot_fps_histogram,
+    "total_organisms_vs_fps": plot_total_organisms_vs_fps,
+    "organisms_vs_simulated_time_fit": plot_organisms_vs_simulated_time_fit,
+}
+
+
+# Bump an entry whenever the code drawing that image changes so existing PNGs are regenerated.
+PLOT_SPEC_VERSIONS = {
+    "fps_over_time": 2,
+    "time_comparison": 1,
+    "organism_counts": 2,
+    "total_organisms": 2,
+    "frame_count": 1,
+    "fps_histogram": 1,
+    "total_organisms_vs_fps": 2,
+    "organisms_vs_simulated_time_fit": 2,
+}
+
+
+def plot_file_name(job_name: str) -> str:
+    return f"{job_name}.png"
+
+
+def get_graph_manifest_path(output_folder: Union[str, Path]) -> Path:
+    return Path(output_folder) / GRAPH_MANIFEST_FILENAME
+
+
+def read_graph_manifest(output_folder: Union[str, Path]) -> Union[dict, None]:
+    manifest_path = get_graph_manifest_path(output_folder)
+    if not manifest_path.is_file():
+        return None
+    try:
+        with open(manifest_path, "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"  Warning: Ignoring unreadable graph manifest '{manifest_path}': {e}")
+        return None
+    if not isinstance(manifest, dict) or manifest.get("version") != GRAPH_MANIFEST_VERSION:
+        return None
+    return manifest
+
+
+def stale_graph_jobs(output_folder: Union[str, Path], fingerprint: dict) -> List[str]:
+    manifest = read_graph_manifest(output_folder)
+    if manifest is None or manifest.get("csv") != fingerprint:
+        return list(PLOT_JOBS)
+    images = manifest.get("images", {})
+    stale = []
+    for job_name, spec_version in PLOT_SPEC_VERSIONS.items():
+        entry = images.get(job_name)
+        if not isinstance(entry, dict) or entry.get("spec") != spec_version:
+            stale.append(job_name)
+        elif entry.get("generated") and not (Path(output_folder) / plot_file_name(job_name)).is_file():
+            stale.append(job_name)
+    return stale
+
+
+def graphs_are_current(csv_path: Union[str, Path], output_folder: Union[str, Path]) -> bool:
+    from simulation_stats import csv_fingerprint
+    try:
+        fingerprint = csv_fingerprint(csv_path)
+    except OSError:
+        return False
+    return not stale_graph_jobs(output_folder, fingerprint)
+
+
+def update_graph_manifest(output_folder: Union[str, Path], fingerprint: dict, results: Dict[str, Union[bool, None]]):
+    manifest = read_graph_manifest(output_folder)
+    if manifest is None or manifest.get("csv") != fingerprint:
+        manifest = {"version": GRAPH_MANIFEST_VERSION, "csv": fingerprint, "images": {}}
+    for job_name, generated in results.items():
+        if generated is None:
+            # Failed renders stay out of the manifest so the next request retries them.
+            manifest["images"].pop(job_name, None)
+            continue
+        manifest["images"][job_name] = {
+            "file": plot_file_name(job_name),
+            "spec": PLOT_SPEC_VERSIONS[job_name],
+            "generated": bool(generated),
+        }
+    manifest_path = get_graph_manifest_path(output_folder)
+    try:
+        with atomic_write(manifest_path, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, indent=2)
+    except OSError as e:
+        print(f"  Warning: Could not write graph manifest '{manifest_path}': {e}")
+
+
+def _rollup_series(stats, metrics: List[str], figsize=PLOT_FIGSIZE) -> Union[Dict[str, Tuple[np.ndarray, ...]], None]:
+    rollups = getattr(stats, "rollups", None)
+    if rollups is None or len(stats) < 2:
+        return None
+    timestamps = stats[TIMESTAMP_COLUMN]
+    level = rollups.level_for_span(float(timestamps[-1] - timestamps[0]), int(figsize[0] * PLOT_DPI))
+    if level is None:
+        return None
+    series = {}
+    for metric in metrics:
+        result = rollups.query(metric, level)
+        if result is None:
+            return None
+        starts, counts, minimums, maximums, means = result
+        series[metric] = (starts, minimums, maximums, means)
+    return series
+
+
+def _time_metric_job(stats, job_name: str, metrics: List[str], options: dict) -> Tuple[str, List[str], dict]:
+    # Long runs are drawn from the coarsest rollup that still gives one bucket per pixel, so no raw rows are shipped.
+    rollup = _rollup_series(stats, metrics)
+    if rollup is None:
+        return job_name, [TIMESTAMP_COLUMN] + metrics, options
+    return job_name, [], dict(options, rollup=rollup)
+
+
+def build_plot_jobs(stats, growth_fits=None, growth_models=None) -> List[Tuple[str, List[str], dict]]:
+    jobs = []
+    organism_columns = stats.organism_columns
+    if "FPS" in stats:
+        jobs.append(_time_metric_job(stats, "fps_over_time", ["FPS"], {}))
+    else:
+        print("Column 'FPS' not found, skipping FPS over Time graph.")
+    if "RealTime" in stats and "SimulatedTime" in stats:
+        jobs.append(("time_comparison", [TIMESTAMP_COLUMN, "RealTime", "SimulatedTime"], {}))
+    else:
+        print("Columns 'RealTime' or 'SimulatedTime' not found, skipping Time Comparison graph.")
+    if organism_columns:
+        jobs.append(_time_metric_job(stats, "organism_counts", organism_columns, {"organism_columns": organism_columns}))
+    else:
+        print("No specific organism columns found, skipping Organism Counts graph.")
+    if TOTAL_ORGANISMS_COLUMN in stats:
+        jobs.append(_time_metric_job(stats, "total_organisms", [TOTAL_ORGANISMS_COLUMN], {}))
+    else:
+        print("Column 'Organism count' not found, skipping Total Organisms graph.")
+    if "FrameCount" in stats:
+        jobs.append(("frame_count", [TIMESTAMP_COLUMN, "FrameCount"], {}))
+    else:
+        print("Column 'FrameCount' not found, skipping Frame Count graph.")
+    if "FPS" in stats:
+        jobs.append(("fps_histogram", ["FPS"], {}))
+    if TOTAL_ORGANISMS_COLUMN in stats and "FPS" in stats:
+        if len(stats.fps_by_population) > 0:
+            jobs.append(("total_organisms_vs_fps", [GROUPED_COUNTS_COLUMN, GROUPED_FPS_COLUMN] + list(GROUPED_QUANTILE_COLUMNS.values()), {}))
+        else:
+            print("Could not group data for Average FPS per Total Organisms graph.")
+    if "SimulatedTime" in stats and organism_columns:
+        if not np.isnan(stats["SimulatedTime"]).all():
+            fit_columns = [col for col in organism_columns if col != TOTAL_ORGANISMS_COLUMN]
+            if TOTAL_ORGANISMS_COLUMN in organism_columns:
+                print(f"  Skipping column '{TOTAL_ORGANISMS_COLUMN}' from Graph 8 as requested.")
+            fit_options = {"organism_columns": fit_columns}
+            if growth_fits is not None:
+                fit_options["growth_fits"] = {col: growth_fits[col] for col in fit_columns if col in growth_fits}
+            if growth_models is not None:
+                fit_options["growth_models"] = {col: growth_models.best(col) for col in fit_columns
+                                                if col in growth_models and growth_models.best(col) is not None}
+            jobs.append(("organisms_vs_simulated_time_fit", ["SimulatedTime"] + fit_columns, fit_options))
+        else:
+            print("Column 'SimulatedTime' exists but all values are null, skipping Organisms vs Simulated Time graph.")
+    elif not organism_columns:
+        print("No specific organism columns found, skipping Organisms vs Simulated Time graph.")
+    else:
+        print("Column 'SimulatedTime' not found, skipping Organisms vs Simulated Time graph.")
+    return jobs
+
+
+def _job_source_columns(stats) -> Dict[str, np.ndarray]:
+    source = dict(stats.columns)
+    table = stats.fps_by_population.table()
+    source[GROUPED_COUNTS_COLUMN] = table["population"]
+    source[GROUPED_FPS_COLUMN] = table["mean"]
+    for name, column in GROUPED_QUANTILE_COLUMNS.items():
+        source[column] = table[name]
+    return source
+
+
+def _share_columns(source: Dict[str, np.ndarray], names: List[str]):
+    segments = {}
+    descriptors = {}
+    try:
+        for name in names:
+            values = np.ascontiguousarray(source[name])
+            segment = shared_memory.SharedMemory(create=True, size=max(values.nbytes, 1))
+            segments[name] = segment
+            np.ndarray(values.shape, dtype=values.dtype, buffer=segment.buf)[...] = values
+            descriptors[name] = (segment.name, values.dtype.str, values.shape)
+    except Exception:
+        _release_segments(segments)
+        raise
+    return segments, descriptors
+
+
+def _release_segments(segments):
+    for segment in segments.values():
+        try:
+            segment.close()
+            segment.unlink()
+        except (OSError, FileNotFoundError):
+            pass
+
+
+def _attach_columns(descriptors):
+    attached = []
+    columns = {}
+    for name, (segment_name, dtype_str, shape) in descriptors.items():
+        segment = shared_memory.SharedMemory(name=segment_name)
+        attached.append(segment)
+        columns[name] = np.ndarray(shape, dtype=np.dtype(dtype_str), buffer=segment.buf)
+    return attached, columns
+
+
+def _run_shared_plot_job(job_name, descriptors, simulation_name, output_folder, options):
+    messages = []
+    attached, columns = _attach_columns(descriptors)
+    try:
+        generated = PLOT_JOBS[job_name](columns, simulation_name, output_folder, messages, **options)
+    except Exception as e:
+        messages.append(f"Error generating {job_name}.png: {type(e).__name__}: {e}")
+        generated = None
+    finally:
+        del columns
+        for segment in attached:
+            segment.close()
+    return job_name, generated, messages
+
+
+def _run_local_plot_job(job_name, source, simulation_name, output_folder, options):
+    messages = []
+    try:
+        generated = PLOT_JOBS[job_name](source, simulation_name, output_folder, messages, **options)
+    except Exception as e:
+        messages.append(f"Error generating {job_name}.png: {type(e).__name__}: {e}")
+        traceback.print_exc()
+        generated = None
+    return job_name, generated, messages
+
+
+def render_simulation_plots(stats, simulation_name: str, output_folder: Union[str, Path], max_workers: Union[int, None] = None,
+                            growth_fits=None, only_jobs: Union[List[str], None] = None, fingerprint: Union[dict, None] = None,
+                            growth_models=None) -> int:
+    jobs = build_plot_jobs(stats, growth_fits, growth_models)
+    requested = list(PLOT_JOBS) if only_jobs is None else list(only_jobs)
+    jobs = [job for job in jobs if job[0] in requested]
+    # Jobs skipped for missing data are recorded too, so they are not retried until the CSV changes.
+    results = {job_name: False for job_name in requested}
+    source = _job_source_columns(stats)
+    output_folder = str(output_folder)
+    worker_count = min(len(jobs), max_workers or os.cpu_count() or 1)
+    options_by_job = {job_name: options for job_name, _, options in jobs}
+    segments, descriptors = {}, {}
+    if worker_count > 1:
+        try:
+            segments, descriptors = _share_columns(source, sorted({name for _, names, _ in jobs for name in names}))
+        except OSError as e:
+            print(f"  Warning: Parallel graph rendering unavailable ({type(e).__name__}: {e}). Rendering {len(jobs)} graph(s) serially.")
+            worker_count = 1
+
+    def store(job_name, result):
+        _, generated, messages = result
+        for message in messages:
+            print(message)
+        results[job_name] = generated
+
+    try:
+        run_in_spawn_pool(
+            _run_shared_plot_job,
+            {job_name: (job_name, {name: descriptors.get(name) for name in names}, simulation_name, output_folder, options)
+             for job_name, names, options in jobs},
+            worker_count, store, "graph rendering",
+            fallback=lambda job_name: _run_local_plot_job(job_name, source, simulation_name, output_folder, options_by_job[job_name]))
+    finally:
+        _release_segments(segments)
+    if fingerprint is not None:
+        update_graph_manifest(output_folder, fingerprint, results)
+    return sum(1 for generated in results.values() if generated)
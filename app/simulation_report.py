@@ -0,0 +1,430 @@
+import base64
+import html
+import json
+import re
+from pathlib import Path
+from typing import Union, List
+
+import numpy as np
+
+from simulation_decimation import decimate_series
+from simulation_files import atomic_write
+from simulation_fitting import exponential_func, fit_growth_columns
+from simulation_models import evaluate_growth_model, describe_growth_model
+
+HTML_REPORT_FILENAME = "statistics_report.html"
+HTML_REPORT_VERSION = 2
+TIMESTAMP_COLUMN = "Timestamp"
+TOTAL_ORGANISMS_COLUMN = "Organism count"
+# Enough points for a full-width chart on a large screen; zooming in shows the same decimated points spread out.
+REPORT_MAX_POINTS = 2000
+REPORT_HISTOGRAM_BINS = 20
+REPORT_FIT_POINTS = 100
+REPORT_FINGERPRINT_META = "stats-fingerprint"
+# The fingerprint meta tag sits in the first bytes of the file so staleness checks never read the embedded data.
+REPORT_HEAD_BYTES = 4096
+
+
+def _typed_array(values) -> str:
+    return base64.b64encode(np.ascontiguousarray(values, dtype="<f4").tobytes()).decode("ascii")
+
+
+def _series(label: str, x, y, low=None, high=None, dashed: bool = False) -> dict:
+    series = {"label": label, "x": _typed_array(x), "y": _typed_array(y), "dashed": dashed}
+    if low is not None and high is not None:
+        series["low"] = _typed_array(low)
+        series["high"] = _typed_array(high)
+    return series
+
+
+def _time_origin(stats) -> int:
+    return int(stats[TIMESTAMP_COLUMN][0])
+
+
+def _rollup_level(stats) -> Union[int, None]:
+    rollups = getattr(stats, "rollups", None)
+    timestamps = stats[TIMESTAMP_COLUMN]
+    if rollups is None or len(timestamps) < 2:
+        return None
+    return rollups.level_for_span(float(timestamps[-1] - timestamps[0]), REPORT_MAX_POINTS)
+
+
+def _time_metric_series(stats, metric: str, label: str, origin: int, level: Union[int, None]) -> dict:
+    result = stats.rollups.query(metric, level) if level is not None else None
+    if result is not None:
+        # Rollup buckets already hold min/mean/max per interval, so long runs cost nothing to summarize here.
+        starts, counts, minimums, maximums, means = result
+        return _series(label, starts - origin, means, minimums, maximums)
+    x, y = decimate_series(stats[TIMESTAMP_COLUMN] - origin, stats[metric], REPORT_MAX_POINTS, "minmax")
+    return _series(label, x, y)
+
+
+def _raw_series(stats, x_values: np.ndarray, column: str, label: str) -> dict:
+    values = stats[column]
+    finite = np.isfinite(x_values) & np.isfinite(values)
+    x, y = decimate_series(x_values[finite], values[finite], REPORT_MAX_POINTS, "minmax")
+    return _series(label, x, y)
+
+
+def _time_chart(chart_id: str, title: str, ylabel: str, origin: int, series: List[dict]) -> dict:
+    return {"id": chart_id, "title": title, "xlabel": "Timestamp", "ylabel": ylabel, "origin": origin, "kind": "line", "series": series}
+
+
+def build_report_charts(stats, growth_fits=None, growth_models=None) -> List[dict]:
+    charts = []
+    if len(stats) == 0:
+        return charts
+    origin = _time_origin(stats)
+    level = _rollup_level(stats)
+    relative_time = stats[TIMESTAMP_COLUMN] - origin
+    organism_columns = stats.organism_columns
+    if "FPS" in stats:
+        charts.append(_time_chart("fps_over_time", "FPS over Time", "FPS", origin, [_time_metric_series(stats, "FPS", "FPS", origin, level)]))
+    if "RealTime" in stats and "SimulatedTime" in stats:
+        charts.append(_time_chart("time_comparison", "RealTime vs SimulatedTime", "Time (s)", origin, [
+            _raw_series(stats, relative_time, "RealTime", "RealTime"),
+            _raw_series(stats, relative_time, "SimulatedTime", "SimulatedTime"),
+        ]))
+    if organism_columns:
+        charts.append(_time_chart("organism_counts", "Organism Counts over Time", "Count", origin,
+                                  [_time_metric_series(stats, col, col, origin, level) for col in organism_columns]))
+    if TOTAL_ORGANISMS_COLUMN in stats:
+        charts.append(_time_chart("total_organisms", "Total Organisms over Time", "Total Count", origin,
+                                  [_time_metric_series(stats, TOTAL_ORGANISMS_COLUMN, "Total Organisms", origin, level)]))
+    if "FrameCount" in stats:
+        charts.append(_time_chart("frame_count", "Frame Count over Time", "Frame Count", origin, [_raw_series(stats, relative_time, "FrameCount", "FrameCount")]))
+    if "FPS" in stats:
+        fps_values = stats["FPS"][np.isfinite(stats["FPS"])]
+        if len(fps_values) > 0:
+            counts, edges = np.histogram(fps_values, bins=REPORT_HISTOGRAM_BINS)
+            charts.append({"id": "fps_histogram", "title": "FPS Distribution", "xlabel": "FPS", "ylabel": "Frequency", "kind": "bars",
+                           "series": [_series("Frequency", (edges[:-1] + edges[1:]) / 2, counts)]})
+    if len(stats.fps_by_population) > 0:
+        table = stats.fps_by_population.table()
+        population_series = []
+        for key, label in [("mean", "Mean"), ("p50", "P50"), ("p95", "P95"), ("p99", "P99")]:
+            x, y = decimate_series(table["population"], table[key], REPORT_MAX_POINTS)
+            population_series.append(_series(label, x, y, dashed=key != "mean"))
+        charts.append({"id": "total_organisms_vs_fps", "title": "Average FPS per Total Organisms", "xlabel": "Total Organisms",
+                       "ylabel": "Average FPS", "kind": "line", "series": population_series})
+    fit_columns = [col for col in organism_columns if col != TOTAL_ORGANISMS_COLUMN]
+    if "SimulatedTime" in stats and fit_columns and np.isfinite(stats["SimulatedTime"]).any():
+        simulated_time = stats["SimulatedTime"]
+        if growth_fits is None:
+            growth_fits = fit_growth_columns(stats.columns, fit_columns)
+        fit_series = []
+        time_fit = np.linspace(np.nanmin(simulated_time), np.nanmax(simulated_time), REPORT_FIT_POINTS)
+        for col in fit_columns:
+            fit_series.append(_raw_series(stats, simulated_time, col, col))
+            best = growth_models.best(col) if growth_models is not None and col in growth_models else None
+            if best is not None:
+                fit_series.append(_series(f"{col} ({describe_growth_model(best)})", time_fit,
+                                          evaluate_growth_model(best["model"], time_fit, best["params"].values()), dashed=True))
+            elif col in growth_fits and growth_fits.is_valid(col):
+                fit = growth_fits[col]
+                label = f"{col} (Exp: a={fit['a']:.2f}, b={fit['b']:.3f}, R²={fit['r_squared']:.2f})"
+                fit_series.append(_series(label, time_fit, exponential_func(time_fit, fit["a"], fit["b"]), dashed=True))
+        fit_title = "Best-Fit Growth Model" if growth_models is not None else "Exponential Fit"
+        charts.append({"id": "organisms_vs_simulated_time_fit", "title": f"Specific Organism Count & {fit_title} over Simulated Time",
+                       "xlabel": "Simulated Time (s)", "ylabel": "Organism Count", "kind": "line", "series": fit_series})
+    return charts
+
+
+def _summary_rows(stats, growth_fits=None, growth_models=None) -> List[List[str]]:
+    rows = [["Rows", f"{len(stats):,}"]]
+    fps_summary = stats.rollups.summary("FPS") if getattr(stats, "rollups", None) is not None else None
+    if fps_summary and fps_summary["count"] > 0:
+        rows.append(["FPS", f"mean {fps_summary['mean']:.2f}, min {fps_summary['min']:.2f}, max {fps_summary['max']:.2f}"])
+    if growth_fits is not None:
+        for col, fit in growth_fits.items():
+            if growth_fits.is_valid(col):
+                rows.append([f"{col} growth", f"b={fit['b']:.5f}, doubling time {fit['doubling_time']:.2f}s, R²={fit['r_squared']:.3f}"])
+    if growth_models is not None:
+        criterion = growth_models.criterion
+        for col in growth_models.columns:
+            ranking = growth_models.ranking(col)
+            if ranking:
+                scores = ", ".join(f"{entry['model']} {criterion.upper()}={entry[criterion]:.1f}" for entry in ranking)
+                rows.append([f"{col} best model", f"{describe_growth_model(ranking[0])} ({scores})"])
+    return rows
+
+
+def read_report_fingerprint(report_path: Union[str, Path]) -> Union[dict, None]:
+    try:
+        with open(report_path, "r", encoding="utf-8") as f:
+            head = f.read(REPORT_HEAD_BYTES)
+    except OSError:
+        return None
+    marker = f'<meta name="{REPORT_FINGERPRINT_META}" content="'
+    start = head.find(marker)
+    if start < 0:
+        return None
+    end = head.find('"', start + len(marker))
+    try:
+        recorded = json.loads(html.unescape(head[start + len(marker):end]))
+    except ValueError:
+        return None
+    if recorded.get("version") != HTML_REPORT_VERSION:
+        return None
+    return recorded.get("fingerprint")
+
+
+def html_report_is_current(report_path: Union[str, Path], fingerprint: dict) -> bool:
+    return read_report_fingerprint(report_path) == fingerprint
+
+
+def write_html_report(stats, simulation_name: str, report_path: Union[str, Path], growth_fits=None, fingerprint: Union[dict, None] = None,
+                      growth_models=None) -> bool:
+    report_path = Path(report_path)
+    payload = {"simulation": simulation_name, "summary": _summary_rows(stats, growth_fits, growth_models),
+               "charts": build_report_charts(stats, growth_fits, growth_models)}
+    recorded = html.escape(json.dumps({"version": HTML_REPORT_VERSION, "fingerprint": fingerprint}), quote=True)
+    # "</" would end the script element early if a simulation or column name contained it.
+    data = json.dumps(payload, separators=(",", ":")).replace("</", "<\\/")
+    # One pass over the template, so a placeholder spelled inside the name or the data is never substituted again.
+    values = {"FINGERPRINT": recorded, "TITLE": html.escape(f"Simulation Statistics ({simulation_name})"), "DATA": data}
+    document = REPORT_PLACEHOLDER_PATTERN.sub(lambda match: values[match.group(1)], REPORT_TEMPLATE)
+    try:
+        with atomic_write(report_path, "w", encoding="utf-8") as f:
+            f.write(document)
+        return True
+    except OSError as e:
+        print(f"  Error saving {report_path.name}: {e}")
+        return False
+
+
+REPORT_PLACEHOLDER_PATTERN = re.compile(r"__(FINGERPRINT|TITLE|DATA)__")
+
+REPORT_TEMPLATE = """<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<meta name="stats-fingerprint" content="__FINGERPRINT__">
+<title>__TITLE__</title>
+<style>
+body { font-family: "Segoe UI", Helvetica, Arial, sans-serif; margin: 20px; background: #fafafa; color: #222; }
+h1 { font-size: 22px; }
+table.summary { border-collapse: collapse; margin-bottom: 16px; }
+table.summary td { padding: 2px 12px 2px 0; font-size: 13px; }
+.chart { background: #fff; border: 1px solid #ddd; border-radius: 4px; margin-bottom: 18px; padding: 10px; }
+.chart h2 { font-size: 16px; margin: 0 0 6px 0; }
+.chart canvas { width: 100%; height: 380px; cursor: grab; display: block; }
+.legend { font-size: 12px; margin-top: 6px; }
+.legend label { margin-right: 14px; cursor: pointer; white-space: nowrap; }
+.legend span.swatch { display: inline-block; width: 12px; height: 3px; margin: 0 4px 3px 2px; vertical-align: middle; }
+.hint { font-size: 12px; color: #666; }
+</style>
+</head>
+<body>
+<h1>__TITLE__</h1>
+<table class="summary" id="summary"></table>
+<p class="hint">Scroll to zoom, drag to pan, double-click to reset. Click a legend entry to hide or show its series.</p>
+<div id="charts"></div>
+<script id="report-data" type="application/json">__DATA__</script>
+<script>
+"use strict";
+const REPORT = JSON.parse(document.getElementById("report-data").textContent);
+const COLORS = ["#1f77b4", "#ff7f0e", "#2ca02c", "#d62728", "#9467bd", "#8c564b", "#e377c2", "#7f7f7f", "#bcbd22", "#17becf"];
+const PAD = {left: 64, right: 16, top: 10, bottom: 40};
+
+function decode(text) {
+  const raw = atob(text);
+  const bytes = new Uint8Array(raw.length);
+  for (let i = 0; i < raw.length; i++) bytes[i] = raw.charCodeAt(i);
+  return new Float32Array(bytes.buffer);
+}
+
+function niceTicks(low, high, count) {
+  const span = high - low;
+  if (!(span > 0)) return [low];
+  const rough = span / count;
+  const magnitude = Math.pow(10, Math.floor(Math.log10(rough)));
+  const step = [1, 2, 5, 10].map(f => f * magnitude).find(s => s >= rough);
+  const ticks = [];
+  for (let t = Math.ceil(low / step) * step; t <= high; t += step) ticks.push(t);
+  return ticks;
+}
+
+function formatTick(chart, value) {
+  if (chart.origin === undefined) return Math.abs(value) >= 1e5 ? value.toExponential(1) : +value.toPrecision(6) + "";
+  const date = new Date((chart.origin + value) * 1000);
+  return date.toISOString().substring(11, 19);
+}
+
+function Chart(chart) {
+  this.chart = chart;
+  this.series = chart.series.map((s, i) => ({
+    label: s.label, dashed: s.dashed, visible: true, color: COLORS[i % COLORS.length],
+    x: decode(s.x), y: decode(s.y), low: s.low ? decode(s.low) : null, high: s.high ? decode(s.high) : null,
+  }));
+  const section = document.createElement("div");
+  section.className = "chart";
+  const heading = document.createElement("h2");
+  heading.textContent = chart.title;
+  this.canvas = document.createElement("canvas");
+  const legend = document.createElement("div");
+  legend.className = "legend";
+  this.series.forEach(s => {
+    const label = document.createElement("label");
+    const box = document.createElement("input");
+    box.type = "checkbox";
+    box.checked = true;
+    box.addEventListener("change", () => { s.visible = box.checked; this.draw(); });
+    const swatch = document.createElement("span");
+    swatch.className = "swatch";
+    swatch.style.background = s.color;
+    label.append(box, swatch, document.createTextNode(s.label));
+    legend.appendChild(label);
+  });
+  section.append(heading, this.canvas, legend);
+  document.getElementById("charts").appendChild(section);
+  this.fullRange = this.xRange();
+  this.view = this.fullRange.slice();
+  this.bindEvents();
+  this.draw();
+}
+
+Chart.prototype.xRange = function () {
+  let low = Infinity, high = -Infinity;
+  this.series.forEach(s => { for (const v of s.x) { if (v < low) low = v; if (v > high) high = v; } });
+  if (this.chart.kind === "bars" && this.series.length && this.series[0].x.length > 1) {
+    const half = (this.series[0].x[1] - this.series[0].x[0]) / 2;
+    low -= half; high += half;
+  }
+  return low < high ? [low, high] : [low - 1, high + 1];
+};
+
+Chart.prototype.yRange = function () {
+  let low = Infinity, high = -Infinity;
+  const [x0, x1] = this.view;
+  this.series.forEach(s => {
+    if (!s.visible) return;
+    const lows = s.low || s.y, highs = s.high || s.y;
+    for (let i = 0; i < s.x.length; i++) {
+      if (s.x[i] < x0 || s.x[i] > x1) continue;
+      if (lows[i] < low) low = lows[i];
+      if (highs[i] > high) high = highs[i];
+    }
+  });
+  if (this.chart.kind === "bars") low = 0;
+  if (!isFinite(low) || !isFinite(high)) return [0, 1];
+  if (low === high) return [low - 1, high + 1];
+  const margin = (high - low) * 0.05;
+  return [this.chart.kind === "bars" ? 0 : low - margin, high + margin];
+};
+
+Chart.prototype.bindEvents = function () {
+  const canvas = this.canvas;
+  let dragStart = null;
+  canvas.addEventListener("wheel", event => {
+    event.preventDefault();
+    const rect = canvas.getBoundingClientRect();
+    const fraction = Math.min(1, Math.max(0, (event.clientX - rect.left - PAD.left) / (rect.width - PAD.left - PAD.right)));
+    const [x0, x1] = this.view;
+    const anchor = x0 + fraction * (x1 - x0);
+    const scale = event.deltaY < 0 ? 0.8 : 1.25;
+    this.view = [anchor - (anchor - x0) * scale, anchor + (x1 - anchor) * scale];
+    this.draw();
+  }, {passive: false});
+  canvas.addEventListener("mousedown", event => { dragStart = {x: event.clientX, view: this.view.slice()}; canvas.style.cursor = "grabbing"; });
+  window.addEventListener("mouseup", () => { dragStart = null; canvas.style.cursor = "grab"; });
+  window.addEventListener("mousemove", event => {
+    if (!dragStart) return;
+    const width = canvas.getBoundingClientRect().width - PAD.left - PAD.right;
+    const shift = (dragStart.x - event.clientX) / width * (dragStart.view[1] - dragStart.view[0]);
+    this.view = [dragStart.view[0] + shift, dragStart.view[1] + shift];
+    this.draw();
+  });
+  canvas.addEventListener("dblclick", () => { this.view = this.fullRange.slice(); this.draw(); });
+  window.addEventListener("resize", () => this.draw());
+};
+
+Chart.prototype.draw = function () {
+  const canvas = this.canvas, ratio = window.devicePixelRatio || 1;
+  const width = canvas.clientWidth, height = canvas.clientHeight;
+  canvas.width = width * ratio;
+  canvas.height = height * ratio;
+  const ctx = canvas.getContext("2d");
+  ctx.setTransform(ratio, 0, 0, ratio, 0, 0);
+  ctx.clearRect(0, 0, width, height);
+  const [x0, x1] = this.view, [y0, y1] = this.yRange();
+  const plotW = width - PAD.left - PAD.right, plotH = height - PAD.top - PAD.bottom;
+  const px = x => PAD.left + (x - x0) / (x1 - x0) * plotW;
+  const py = y => PAD.top + (1 - (y - y0) / (y1 - y0)) * plotH;
+
+  ctx.font = "11px sans-serif";
+  ctx.strokeStyle = "#e3e3e3";
+  ctx.fillStyle = "#444";
+  ctx.setLineDash([4, 3]);
+  ctx.textAlign = "center";
+  niceTicks(x0, x1, Math.max(2, Math.floor(plotW / 110))).forEach(t => {
+    ctx.beginPath(); ctx.moveTo(px(t), PAD.top); ctx.lineTo(px(t), PAD.top + plotH); ctx.stroke();
+    ctx.fillText(formatTick(this.chart, t), px(t), PAD.top + plotH + 14);
+  });
+  ctx.textAlign = "right";
+  niceTicks(y0, y1, 6).forEach(t => {
+    ctx.beginPath(); ctx.moveTo(PAD.left, py(t)); ctx.lineTo(PAD.left + plotW, py(t)); ctx.stroke();
+    ctx.fillText(+t.toPrecision(6) + "", PAD.left - 6, py(t) + 4);
+  });
+  ctx.setLineDash([]);
+  ctx.textAlign = "center";
+  ctx.fillText(this.chart.xlabel, PAD.left + plotW / 2, height - 6);
+  ctx.save();
+  ctx.translate(12, PAD.top + plotH / 2);
+  ctx.rotate(-Math.PI / 2);
+  ctx.fillText(this.chart.ylabel, 0, 0);
+  ctx.restore();
+
+  ctx.save();
+  ctx.beginPath();
+  ctx.rect(PAD.left, PAD.top, plotW, plotH);
+  ctx.clip();
+  this.series.forEach(s => {
+    if (!s.visible) return;
+    if (this.chart.kind === "bars") {
+      const barWidth = s.x.length > 1 ? Math.abs(px(s.x[1]) - px(s.x[0])) : plotW;
+      ctx.fillStyle = s.color;
+      ctx.strokeStyle = "#000";
+      for (let i = 0; i < s.x.length; i++) {
+        ctx.fillRect(px(s.x[i]) - barWidth / 2, py(s.y[i]), barWidth, py(0) - py(s.y[i]));
+        ctx.strokeRect(px(s.x[i]) - barWidth / 2, py(s.y[i]), barWidth, py(0) - py(s.y[i]));
+      }
+      return;
+    }
+    if (s.low) {
+      ctx.fillStyle = s.color;
+      ctx.globalAlpha = 0.2;
+      ctx.beginPath();
+      for (let i = 0; i < s.x.length; i++) ctx.lineTo(px(s.x[i]), py(s.high[i]));
+      for (let i = s.x.length - 1; i >= 0; i--) ctx.lineTo(px(s.x[i]), py(s.low[i]));
+      ctx.closePath();
+      ctx.fill();
+      ctx.globalAlpha = 1;
+    }
+    ctx.strokeStyle = s.color;
+    ctx.lineWidth = 1.2;
+    ctx.setLineDash(s.dashed ? [6, 4] : []);
+    ctx.beginPath();
+    let penDown = false;
+    for (let i = 0; i < s.x.length; i++) {
+      if (!isFinite(s.y[i])) { penDown = false; continue; }
+      if (penDown) ctx.lineTo(px(s.x[i]), py(s.y[i])); else ctx.moveTo(px(s.x[i]), py(s.y[i]));
+      penDown = true;
+    }
+    ctx.stroke();
+  });
+  ctx.restore();
+  ctx.strokeStyle = "#999";
+  ctx.strokeRect(PAD.left, PAD.top, plotW, plotH);
+};
+
+REPORT.summary.forEach(([name, value]) => {
+  const row = document.getElementById("summary").insertRow();
+  row.insertCell().textContent = name;
+  row.insertCell().textContent = value;
+});
+REPORT.charts.forEach(chart => new Chart(chart));
+</script>
+</body>
+</html>
+"""
@@ -0,0 +1,171 @@
+from typing import Union, Dict, List, Tuple
+
+import numpy as np
+
+ROLLUP_LEVELS = [1, 10, 60, 600]
+
+
+def _reduce_sorted(keys: np.ndarray, counts: np.ndarray, sums: np.ndarray, mins: np.ndarray, maxs: np.ndarray):
+    starts = np.flatnonzero(np.concatenate(([True], keys[1:] != keys[:-1])))
+    return (
+        keys[starts],
+        np.add.reduceat(counts, starts, axis=0),
+        np.add.reduceat(sums, starts, axis=0),
+        np.minimum.reduceat(mins, starts, axis=0),
+        np.maximum.reduceat(maxs, starts, axis=0),
+    )
+
+
+def _reduce_by_key(keys: np.ndarray, counts: np.ndarray, sums: np.ndarray, mins: np.ndarray, maxs: np.ndarray):
+    if len(keys) == 0:
+        return keys, counts, sums, mins, maxs
+    if np.any(keys[1:] < keys[:-1]):
+        order = np.argsort(keys, kind="stable")
+        keys, counts, sums, mins, maxs = keys[order], counts[order], sums[order], mins[order], maxs[order]
+    return _reduce_sorted(keys, counts, sums, mins, maxs)
+
+
+class RollupTable:
+    def __init__(self, level: int, starts: np.ndarray, counts: np.ndarray, sums: np.ndarray, mins: np.ndarray, maxs: np.ndarray):
+        self.level = level
+        self.starts = starts
+        self.counts = counts
+        self.sums = sums
+        self.mins = mins
+        self.maxs = maxs
+
+    @classmethod
+    def empty(cls, level: int, metric_count: int) -> "RollupTable":
+        return cls(level, np.empty(0, dtype=np.int64), np.empty((0, metric_count), dtype=np.int64),
+                   np.empty((0, metric_count)), np.empty((0, metric_count)), np.empty((0, metric_count)))
+
+    def __len__(self):
+        return len(self.starts)
+
+    def coarsen(self, level: int) -> "RollupTable":
+        if len(self) == 0:
+            return RollupTable.empty(level, self.counts.shape[1])
+        return RollupTable(level, *_reduce_sorted(self.starts - self.starts % level, self.counts, self.sums, self.mins, self.maxs))
+
+    def merge(self, other: "RollupTable") -> "RollupTable":
+        if len(other) == 0:
+            return self
+        if len(self) == 0:
+            return other
+        if other.starts[0] > self.starts[-1]:
+            return RollupTable(self.level, *(np.concatenate(pair) for pair in zip(
+                (self.starts, self.counts, self.sums, self.mins, self.maxs),
+                (other.starts, other.counts, other.sums, other.mins, other.maxs))))
+        # Only buckets from the overlapping tail need re-reducing; appends usually touch just the last one.
+        split = np.searchsorted(self.starts, other.starts[0])
+        merged = _reduce_by_key(
+            np.concatenate([self.starts[split:], other.starts]),
+            np.concatenate([self.counts[split:], other.counts]),
+            np.concatenate([self.sums[split:], other.sums]),
+            np.concatenate([self.mins[split:], other.mins]),
+            np.concatenate([self.maxs[split:], other.maxs]),
+        )
+        head = (self.starts[:split], self.counts[:split], self.sums[:split], self.mins[:split], self.maxs[:split])
+        return RollupTable(self.level, *(np.concatenate(pair) for pair in zip(head, merged)))
+
+    def means(self) -> np.ndarray:
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return np.where(self.counts > 0, self.sums / np.maximum(self.counts, 1), np.nan)
+
+    def minimums(self) -> np.ndarray:
+        return np.where(self.counts > 0, self.mins, np.nan)
+
+    def maximums(self) -> np.ndarray:
+        return np.where(self.counts > 0, self.maxs, np.nan)
+
+
+class StatsRollups:
+    def __init__(self, metrics: List[str], levels: List[int] = ROLLUP_LEVELS, tables: Union[Dict[int, RollupTable], None] = None):
+        self.metrics = list(metrics)
+        self.levels = sorted(levels)
+        self.tables = tables if tables is not None else {level: RollupTable.empty(level, len(self.metrics)) for level in self.levels}
+
+    def _rows_to_base(self, timestamps: np.ndarray, columns: Dict[str, np.ndarray]) -> RollupTable:
+        values = np.column_stack([columns[name] for name in self.metrics]) if self.metrics else np.empty((len(timestamps), 0))
+        present = ~np.isnan(values)
+        keys = timestamps - timestamps % self.levels[0]
+        return RollupTable(self.levels[0], *_reduce_by_key(
+            keys,
+            present.astype(np.int64),
+            np.where(present, values, 0.0),
+            np.where(present, values, np.inf),
+            np.where(present, values, -np.inf),
+        ))
+
+    def update(self, timestamps: np.ndarray, columns: Dict[str, np.ndarray]):
+        if len(timestamps) == 0:
+            return
+        base = self._rows_to_base(timestamps, columns)
+        for level in self.levels:
+            chunk_table = base if level == base.level else base.coarsen(level)
+            self.tables[level] = self.tables[level].merge(chunk_table)
+
+    def merge(self, other: "StatsRollups") -> "StatsRollups":
+        if other.metrics != self.metrics or other.levels != self.levels:
+            raise ValueError("Cannot merge rollups with different metrics or levels.")
+        for level in self.levels:
+            self.tables[level] = self.tables[level].merge(other.tables[level])
+        return self
+
+    def level_for_resolution(self, resolution_seconds: float) -> Union[int, None]:
+        usable = [level for level in self.levels if level <= resolution_seconds]
+        return usable[-1] if usable else None
+
+    def level_for_span(self, span_seconds: float, max_points: int) -> Union[int, None]:
+        if max_points <= 0:
+            return None
+        return self.level_for_resolution(span_seconds / max_points)
+
+    def query(self, metric: str, resolution_seconds: float) -> Union[Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray], None]:
+        level = self.level_for_resolution(resolution_seconds)
+        if level is None or metric not in self.metrics:
+            return None
+        table = self.tables[level]
+        index = self.metrics.index(metric)
+        return table.starts, table.counts[:, index], table.minimums()[:, index], table.maximums()[:, index], table.means()[:, index]
+
+    def summary(self, metric: str) -> Union[Dict[str, float], None]:
+        if metric not in self.metrics:
+            return None
+        table = self.tables[self.levels[-1]]
+        index = self.metrics.index(metric)
+        count = int(table.counts[:, index].sum())
+        if count == 0:
+            return {"count": 0, "min": np.nan, "max": np.nan, "mean": np.nan}
+        present = table.counts[:, index] > 0
+        return {
+            "count": count,
+            "min": float(table.mins[present, index].min()),
+            "max": float(table.maxs[present, index].max()),
+            "mean": float(table.sums[:, index].sum() / count),
+        }
+
+    def to_arrays(self, prefix: str = "rollup") -> Dict[str, np.ndarray]:
+        arrays = {}
+        for level, table in self.tables.items():
+            arrays[f"{prefix}_{level}_starts"] = table.starts
+            arrays[f"{prefix}_{level}_count"] = table.counts
+            arrays[f"{prefix}_{level}_sum"] = table.sums
+            arrays[f"{prefix}_{level}_min"] = table.mins
+            arrays[f"{prefix}_{level}_max"] = table.maxs
+        return arrays
+
+    @classmethod
+    def from_arrays(cls, arrays, metrics: List[str], levels: List[int], prefix: str = "rollup") -> "StatsRollups":
+        tables = {
+            level: RollupTable(
+                level,
+                arrays[f"{prefix}_{level}_starts"],
+                arrays[f"{prefix}_{level}_count"],
+                arrays[f"{prefix}_{level}_sum"],
+                arrays[f"{prefix}_{level}_min"],
+                arrays[f"{prefix}_{level}_max"],
+            )
+            for level in levels
+        }
+        return cls(metrics, levels, tables)
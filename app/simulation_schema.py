@@ -0,0 +1,119 @@
+import hashlib
+from functools import lru_cache
+from typing import Union, Dict, List, Tuple
+
+import numpy as np
+import pandas as pd
+
+ROLE_TIMESTAMP = "timestamp"
+ROLE_METRIC = "metric"
+ROLE_COUNTER = "counter"
+ROLE_PAUSED = "paused"
+ROLE_ORGANISM = "organism"
+PAUSED_COLUMN = "Paused"
+# Bump when roles or storage names change, so caches keyed by the schema fingerprint are rebuilt.
+SCHEMA_REGISTRY_VERSION = 1
+# Fixed leading columns written by each SimulationLogger.WriteCSVHeader release; organism columns follow them.
+LOGGER_SCHEMAS = {
+    1: [("Timestamp", ROLE_TIMESTAMP), ("FPS", ROLE_METRIC), ("RealTime", ROLE_METRIC), ("SimulatedTime", ROLE_METRIC),
+        ("DeltaTime", ROLE_METRIC), ("FrameCount", ROLE_COUNTER), ("Pausado", ROLE_PAUSED)],
+    2: [("Timestamp", ROLE_TIMESTAMP), ("FPS", ROLE_METRIC), ("RealTime", ROLE_METRIC), ("SimulatedTime", ROLE_METRIC),
+        ("DeltaTime", ROLE_METRIC), ("FrameCount", ROLE_COUNTER), ("Paused", ROLE_PAUSED)],
+}
+KNOWN_COLUMN_ROLES = {name: role for columns in LOGGER_SCHEMAS.values() for name, role in columns}
+# Logger columns with a known range are stored in the smallest dtype that holds them exactly enough for the graphs.
+ROLE_STORAGE_DTYPES = {
+    ROLE_METRIC: np.float32,
+    ROLE_COUNTER: np.uint32,
+    ROLE_ORGANISM: np.uint32,
+    ROLE_PAUSED: np.bool_,
+    ROLE_TIMESTAMP: np.int64,
+}
+COMPACT_COUNT_DTYPE = np.uint32
+PAUSED_TRUE_VALUES = ["yes", "sí", "si", "true", "1"]
+
+
+def header_fingerprint(header: List[str]) -> str:
+    text = "\n".join([f"registry={SCHEMA_REGISTRY_VERSION}"] + list(header))
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+
+class StatsSchema:
+    def __init__(self, version: Union[int, None], header: List[str], roles: Dict[str, str]):
+        self.version = version
+        self.header = list(header)
+        self.roles = roles
+        self.fingerprint = header_fingerprint(header)
+        self.organism_columns = sorted(name for name in header if roles[name] == ROLE_ORGANISM)
+        self.numeric_columns = [name for name in header if roles[name] in (ROLE_METRIC, ROLE_COUNTER, ROLE_ORGANISM)]
+        self.paused_columns = [name for name in header if roles[name] == ROLE_PAUSED]
+
+    def storage_name(self, column_name: str) -> str:
+        # Older loggers wrote the paused flag as "Pausado"; it is always stored as "Paused".
+        return PAUSED_COLUMN if self.roles.get(column_name) == ROLE_PAUSED else column_name
+
+    def storage_dtype(self, column_name: str):
+        role = self.roles.get(column_name)
+        if role is None and column_name == PAUSED_COLUMN:
+            role = ROLE_PAUSED
+        return ROLE_STORAGE_DTYPES.get(role, np.float64)
+
+    def read_dtypes(self, lenient: bool = False) -> Dict[str, str]:
+        return {name: "str" if lenient or role in (ROLE_TIMESTAMP, ROLE_PAUSED) else "float64" for name, role in self.roles.items()}
+
+    def rollup_metrics(self) -> List[str]:
+        return (["FPS"] if self.roles.get("FPS") == ROLE_METRIC else []) + self.organism_columns
+
+
+def _match_logger_version(header: Tuple[str, ...]) -> Union[int, None]:
+    for version, fixed_columns in sorted(LOGGER_SCHEMAS.items(), reverse=True):
+        if list(header[:len(fixed_columns)]) == [name for name, _ in fixed_columns]:
+            return version
+    return None
+
+
+@lru_cache(maxsize=64)
+def _resolve_header(header: Tuple[str, ...]) -> StatsSchema:
+    version = _match_logger_version(header)
+    if version is not None:
+        fixed_roles = dict(LOGGER_SCHEMAS[version])
+        roles = {name: fixed_roles.get(name, ROLE_ORGANISM) for name in header}
+    else:
+        # Unknown layout: classify by name against every known release, and say so once per header.
+        roles = {name: KNOWN_COLUMN_ROLES.get(name, ROLE_ORGANISM) for name in header}
+        print(f"  Warning: Statistics header does not match a known logger version; columns classified by name: {roles}")
+    return StatsSchema(version, list(header), roles)
+
+
+def resolve_stats_schema(header: List[str]) -> StatsSchema:
+    return _resolve_header(tuple(header))
+
+
+def _fits_count_dtype(values: np.ndarray) -> bool:
+    # Missing or fractional counts have no uint32 form, so such columns stay float64.
+    limit = np.iinfo(COMPACT_COUNT_DTYPE).max
+    with np.errstate(invalid="ignore"):
+        return bool(np.isfinite(values).all() and (values >= 0).all() and (values <= limit).all() and (values == np.floor(values)).all())
+
+
+def compact_column(values: np.ndarray, dtype) -> np.ndarray:
+    if values.dtype == dtype:
+        return values
+    if dtype == COMPACT_COUNT_DTYPE and not _fits_count_dtype(values):
+        return values
+    return values.astype(dtype)
+
+
+def compact_columns(columns: Dict[str, np.ndarray], schema: StatsSchema) -> Dict[str, np.ndarray]:
+    return {name: compact_column(values, schema.storage_dtype(name)) for name, values in columns.items()}
+
+
+def empty_column(column_name: str, schema: StatsSchema) -> np.ndarray:
+    return np.empty(0, dtype=schema.storage_dtype(column_name))
+
+
+def decode_paused_flags(raw_values: pd.Series) -> np.ndarray:
+    # Only "Yes"/"No" (or "Sí"/"No" in older logs) ever appear, so each distinct string is compared once.
+    codes, uniques = pd.factorize(raw_values)
+    flags = np.append(np.isin(np.char.lower(np.char.strip(np.asarray(uniques, dtype=str))), PAUSED_TRUE_VALUES), False)
+    return flags[codes]
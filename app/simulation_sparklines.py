@@ -0,0 +1,161 @@
+import json
+import os
+import traceback
+from pathlib import Path
+from typing import Union, Dict, List, Tuple, Callable
+
+import numpy as np
+
+from simulation_files import atomic_write
+from simulation_workers import run_in_spawn_pool
+
+SPARKLINE_SUMMARY_FILENAME = "SimulationStats.sparkline.json"
+SPARKLINE_SUMMARY_VERSION = 2
+SPARKLINE_POINTS = 256
+# Summaries read the cached rollups, so a couple of workers cover the few CSVs that still need a parse.
+SPARKLINE_MAX_WORKERS = 2
+# Characters drawn per series in the simulation list; the stored points are averaged down to this width.
+SPARKLINE_CELL_WIDTH = 12
+SPARKLINE_BLOCKS = "▁▂▃▄▅▆▇█"
+TOTAL_ORGANISMS_COLUMN = "Organism count"
+
+
+def get_sparkline_summary_path(csv_path: Union[str, Path]) -> Path:
+    return Path(csv_path).with_name(SPARKLINE_SUMMARY_FILENAME)
+
+
+def bucket_means(x: np.ndarray, sums: np.ndarray, counts: np.ndarray, points: int = SPARKLINE_POINTS) -> np.ndarray:
+    # Per-metric means of (n, k) rollup sums grouped into at most `points` equal spans of x; metrics without rows are NaN.
+    x = np.asarray(x, dtype=np.float64)
+    span = x.max() - x.min()
+    buckets = np.minimum(((x - x.min()) / span * points).astype(np.int64), points - 1) if span > 0 else np.zeros(len(x), dtype=np.int64)
+    totals = np.zeros((points, sums.shape[1]))
+    weights = np.zeros((points, sums.shape[1]))
+    np.add.at(totals, buckets, sums)
+    np.add.at(weights, buckets, counts)
+    with np.errstate(invalid="ignore"):
+        return (totals / weights)[weights.any(axis=1)]
+
+
+def summarize_sparklines(rollups) -> dict:
+    # Built from the coarsest rollup level that still gives SPARKLINE_POINTS buckets, never from the raw rows.
+    summary = {}
+    if rollups is None or not rollups.metrics or len(rollups.tables[rollups.levels[0]]) == 0:
+        return summary
+    finest = rollups.tables[rollups.levels[0]]
+    table = rollups.tables[rollups.level_for_span(float(finest.starts.max() - finest.starts.min()), SPARKLINE_POINTS) or rollups.levels[0]]
+    means = bucket_means(table.starts, table.sums, table.counts)
+    if TOTAL_ORGANISMS_COLUMN in rollups.metrics:
+        organisms = [rollups.metrics.index(TOTAL_ORGANISMS_COLUMN)]
+    else:
+        organisms = [index for index, name in enumerate(rollups.metrics) if name != "FPS"]
+    if organisms:
+        counted = means[:, organisms]
+        counted = counted[~np.isnan(counted).all(axis=1)]
+        summary["population"] = np.round(np.nansum(counted, axis=1), 2).tolist()
+    if "FPS" in rollups.metrics:
+        fps = means[:, rollups.metrics.index("FPS")]
+        summary["fps"] = np.round(fps[~np.isnan(fps)], 2).tolist()
+    return summary
+
+
+def read_sparkline_summary(csv_path: Union[str, Path], fingerprint: Union[dict, None] = None) -> Union[dict, None]:
+    from simulation_stats import csv_fingerprint
+    try:
+        if fingerprint is None:
+            fingerprint = csv_fingerprint(csv_path)
+        with open(get_sparkline_summary_path(csv_path), "r", encoding="utf-8") as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if cached.get("version") != SPARKLINE_SUMMARY_VERSION or cached.get("fingerprint") != fingerprint:
+        return None
+    return cached.get("summary")
+
+
+def _write_sparkline_summary(csv_path: Path, fingerprint: dict, summary: dict, messages: List[str]):
+    summary_path = get_sparkline_summary_path(csv_path)
+    try:
+        with atomic_write(summary_path, "w", encoding="utf-8") as f:
+            json.dump({"version": SPARKLINE_SUMMARY_VERSION, "fingerprint": fingerprint, "summary": summary}, f)
+    except OSError as e:
+        messages.append(f"  Warning: Could not write sparkline summary '{summary_path}': {e}")
+
+
+def _build_sparkline_summary(simulation_name: str, csv_path: str) -> Tuple[str, Union[dict, None], List[str]]:
+    from simulation_stats import load_stats_rollups, csv_fingerprint
+    messages = []
+    csv_path = Path(csv_path)
+    try:
+        fingerprint = csv_fingerprint(csv_path)
+        summary = summarize_sparklines(load_stats_rollups(csv_path))
+        if not summary:
+            return simulation_name, None, messages
+        _write_sparkline_summary(csv_path, fingerprint, summary, messages)
+    except Exception as e:
+        messages.append(f"  Error building sparklines for '{simulation_name}': {type(e).__name__}: {e}")
+        traceback.print_exc()
+        return simulation_name, None, messages
+    return simulation_name, summary, messages
+
+
+def build_sparkline_summaries(csv_paths: Dict[str, Path], on_ready: Callable[[str, dict], None], max_workers: Union[int, None] = None,
+                              should_stop: Callable[[], bool] = lambda: False) -> int:
+    # pandas and matplotlib load here, in the list's background worker, never while the list is drawn.
+    pending = {}
+    for simulation_name, csv_path in csv_paths.items():
+        if should_stop():
+            return 0
+        cached = read_sparkline_summary(csv_path)
+        if cached is not None:
+            on_ready(simulation_name, cached)
+        else:
+            pending[simulation_name] = str(csv_path)
+    built = 0
+
+    def store(simulation_name, result):
+        nonlocal built
+        _, summary, messages = result
+        for message in messages:
+            print(message)
+        if summary is not None:
+            built += 1
+            on_ready(simulation_name, summary)
+
+    worker_count = min(len(pending), max_workers or SPARKLINE_MAX_WORKERS, os.cpu_count() or 1)
+    run_in_spawn_pool(_build_sparkline_summary, {name: (name, path) for name, path in pending.items()},
+                      worker_count, store, "sparkline summaries", should_stop=should_stop)
+    return built
+
+
+def render_sparkline(values, width: int = SPARKLINE_CELL_WIDTH, low: Union[float, None] = None) -> str:
+    values = np.asarray(values, dtype=np.float64)
+    values = values[np.isfinite(values)]
+    if len(values) == 0:
+        return ""
+    if len(values) > width:
+        values = np.array([chunk.mean() for chunk in np.array_split(values, width)])
+    low, high = values.min() if low is None else min(low, values.min()), values.max()
+    if high <= low:
+        return SPARKLINE_BLOCKS[0] * len(values)
+    levels = np.round((values - low) / (high - low) * (len(SPARKLINE_BLOCKS) - 1)).astype(np.int64)
+    return "".join(SPARKLINE_BLOCKS[level] for level in levels)
+
+
+def format_sparkline_cell(summary: Union[dict, None]) -> str:
+    # FPS is drawn from zero so ordinary frame jitter does not look like a collapse.
+    if not summary:
+        return ""
+    return f"{render_sparkline(summary.get('population', []))}  {render_sparkline(summary.get('fps', []), low=0.0)}".strip()
+
+
+def describe_sparkline_summary(summary: Union[dict, None]) -> Union[str, None]:
+    if not summary:
+        return None
+    parts = []
+    if summary.get("population"):
+        parts.append(f"Population (left): {summary['population'][0]:.0f} → {summary['population'][-1]:.0f}")
+    if summary.get("fps"):
+        fps = np.asarray(summary["fps"], dtype=np.float64)
+        parts.append(f"FPS (right): mean {fps.mean():.1f}, min {fps.min():.1f}")
+    return "\n".join(parts) if parts else None
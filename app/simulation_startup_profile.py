@@ -0,0 +1,221 @@
+import atexit
+import json
+import os
+import platform
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Union, List
+
+STARTUP_PROFILE_ENV = "MANAGER_PROFILE_STARTUP"
+STARTUP_PROFILE_FLAG = "--profile-startup"
+STARTUP_PROFILE_VERSION = 1
+# Imports cheaper than this are folded into their parent's self time to keep the trace readable.
+STARTUP_PROFILE_MIN_IMPORT_MS = 0.5
+
+
+class _TimedLoader:
+    def __init__(self, loader, profiler, fullname: str):
+        self._loader = loader
+        self._profiler = profiler
+        self._fullname = fullname
+
+    def __getattr__(self, name):
+        return getattr(self._loader, name)
+
+    def create_module(self, spec):
+        create_module = getattr(self._loader, "create_module", None)
+        return create_module(spec) if create_module is not None else None
+
+    def exec_module(self, module):
+        # Keep the real loader on the module, so pkgutil and resource readers see what they expect.
+        module.__loader__ = self._loader
+        stack = self._profiler._import_stack()
+        start = time.perf_counter()
+        stack.append(0.0)
+        try:
+            self._loader.exec_module(module)
+        finally:
+            children = stack.pop()
+            elapsed = time.perf_counter() - start
+            if stack:
+                stack[-1] += elapsed
+            self._profiler._record_import(self._fullname, start, elapsed, elapsed - children)
+
+
+class _ImportTimer:
+    def __init__(self, profiler):
+        self._profiler = profiler
+        self._resolving = threading.local()
+
+    def find_spec(self, fullname, path=None, target=None):
+        pending = getattr(self._resolving, "names", None)
+        if pending is None:
+            pending = self._resolving.names = set()
+        if fullname in pending:
+            return None
+        pending.add(fullname)
+        try:
+            for finder in sys.meta_path:
+                if finder is self or not hasattr(finder, "find_spec"):
+                    continue
+                spec = finder.find_spec(fullname, path, target)
+                if spec is not None:
+                    break
+            else:
+                return None
+        finally:
+            pending.discard(fullname)
+        if spec.loader is None or not hasattr(spec.loader, "exec_module"):
+            return spec
+        spec.loader = _TimedLoader(spec.loader, self._profiler, fullname)
+        return spec
+
+
+class StartupProfiler:
+    def __init__(self):
+        self.enabled = False
+        self.origin = time.perf_counter()
+        self.output_path = None
+        self.imports = []
+        self.events = []
+        self.marks = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._timer = None
+        self._written = False
+
+    def _import_stack(self) -> List[float]:
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def _relative_ms(self, moment: float) -> float:
+        return round((moment - self.origin) * 1000.0, 3)
+
+    def _record_import(self, fullname: str, start: float, elapsed: float, self_elapsed: float):
+        with self._lock:
+            self.imports.append({
+                "module": fullname,
+                "start_ms": self._relative_ms(start),
+                "inclusive_ms": round(elapsed * 1000.0, 3),
+                "self_ms": round(self_elapsed * 1000.0, 3),
+                "thread": threading.current_thread().name,
+            })
+
+    def start(self, output_path: Union[str, Path]):
+        if self.enabled:
+            return
+        self.enabled = True
+        self.output_path = Path(output_path)
+        self._timer = _ImportTimer(self)
+        sys.meta_path.insert(0, self._timer)
+        atexit.register(self.write)
+        print(f"Startup profiling enabled; the trace will be written to '{self.output_path.resolve()}'.")
+
+    def mark(self, name: str):
+        if not self.enabled:
+            return
+        with self._lock:
+            self.marks.setdefault(name, self._relative_ms(time.perf_counter()))
+
+    def timed(self, name: str, function):
+        if not self.enabled:
+            return function
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                with self._lock:
+                    self.events.append({"name": name, "start_ms": self._relative_ms(start),
+                                        "duration_ms": round((time.perf_counter() - start) * 1000.0, 3),
+                                        "thread": threading.current_thread().name})
+        return wrapper
+
+    def _process_start_ms(self) -> Union[float, None]:
+        # Time spent before this module ran: interpreter start-up and, for one-file builds, unpacking the bundle.
+        try:
+            import psutil
+            return round((time.time() - psutil.Process().create_time()) * 1000.0 - self._relative_ms(time.perf_counter()), 3)
+        except Exception:
+            return None
+
+    def _trace(self) -> dict:
+        with self._lock:
+            imports = [entry for entry in self.imports if entry["inclusive_ms"] >= STARTUP_PROFILE_MIN_IMPORT_MS]
+            events = list(self.events)
+            marks = dict(self.marks)
+        threads = sorted({entry["thread"] for entry in imports + events} | {threading.main_thread().name})
+        trace_events = [{"name": entry["module"], "cat": "import", "ph": "X", "ts": entry["start_ms"] * 1000.0,
+                         "dur": entry["inclusive_ms"] * 1000.0, "pid": 1, "tid": threads.index(entry["thread"]),
+                         "args": {"self_ms": entry["self_ms"]}} for entry in imports]
+        trace_events += [{"name": event["name"], "cat": "phase", "ph": "X", "ts": event["start_ms"] * 1000.0,
+                          "dur": event["duration_ms"] * 1000.0, "pid": 1, "tid": threads.index(event["thread"])} for event in events]
+        trace_events += [{"name": name, "cat": "mark", "ph": "i", "s": "g", "ts": moment * 1000.0, "pid": 1, "tid": 0}
+                         for name, moment in marks.items()]
+        return {
+            "traceEvents": trace_events,
+            "displayTimeUnit": "ms",
+            "otherData": {
+                "version": STARTUP_PROFILE_VERSION,
+                "recorded_at": time.strftime("%Y-%m-%d %H:%M:%S"),
+                "executable": sys.executable,
+                "frozen": bool(getattr(sys, "frozen", False)),
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "before_profiler_ms": self._process_start_ms(),
+                "marks_ms": marks,
+                "phases_ms": {event["name"]: event["duration_ms"] for event in events},
+                "slowest_imports": sorted(imports, key=lambda entry: entry["self_ms"], reverse=True)[:25],
+            },
+        }
+
+    def write(self) -> Union[Path, None]:
+        if not self.enabled or self._written:
+            return None
+        self._written = True
+        if self._timer in sys.meta_path:
+            sys.meta_path.remove(self._timer)
+        trace = self._trace()
+        for path in (self.output_path, Path(tempfile.gettempdir()) / self.output_path.name):
+            try:
+                with open(path, "w", encoding="utf-8") as f:
+                    json.dump(trace, f, indent=1)
+                print(f"Startup profile written to '{path.resolve()}'.")
+                return path
+            except OSError as e:
+                print(f"Warning: Could not write startup profile '{path}': {e}")
+        return None
+
+
+startup_profiler = StartupProfiler()
+
+
+def default_startup_profile_path(folder: Union[str, Path, None] = None) -> Path:
+    return Path(folder or Path.cwd()) / f"startup_profile_{time.strftime('%Y%m%d_%H%M%S')}.json"
+
+
+def configure_startup_profiling(argv: List[str]) -> bool:
+    # Enabled by MANAGER_PROFILE_STARTUP=1|<path> or --profile-startup[=<path>]; the flag is removed from argv.
+    if any(argument.startswith("--multiprocessing") for argument in argv):
+        # Frozen pool workers re-run the entry script; only the manager process is profiled.
+        return False
+    requested = os.getenv(STARTUP_PROFILE_ENV, "").strip()
+    for argument in list(argv[1:]):
+        if argument == STARTUP_PROFILE_FLAG or argument.startswith(STARTUP_PROFILE_FLAG + "="):
+            argv.remove(argument)
+            requested = argument.partition("=")[2] or requested or "1"
+    if not requested or requested.lower() in ("0", "false", "no"):
+        return False
+    if requested.lower() in ("1", "true", "yes"):
+        output_path = default_startup_profile_path()
+    elif Path(requested).is_dir():
+        output_path = default_startup_profile_path(requested)
+    else:
+        output_path = Path(requested)
+    startup_profiler.start(output_path)
+    return True
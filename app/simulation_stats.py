@@ -0,0 +1,439 @@
+import hashlib
+import io
+import json
+import os
+from pathlib import Path
+from typing import Union, Dict, List, Tuple
+
+import numpy as np
+import pandas as pd
+
+from simulation_files import atomic_write
+from simulation_rollups import StatsRollups
+from simulation_groupby import FpsByPopulation
+from simulation_schema import StatsSchema, resolve_stats_schema, compact_columns, empty_column, decode_paused_flags
+
+CSV_SEPARATOR = ";"
+CSV_ENCODING = "utf-8-sig"
+STATS_CHUNK_ROWS = 200000
+STATS_CACHE_FILENAME = "SimulationStats.cache.npz"
+STATS_CACHE_VERSION = 5
+STATS_CACHE_HEAD_BYTES = 4096
+FINGERPRINT_SAMPLE_BYTES = 65536
+TIMESTAMP_FORMAT = "%d-%m-%Y %H:%M:%S"
+TIMESTAMP_COLUMN = "Timestamp"
+TOTAL_ORGANISMS_COLUMN = "Organism count"
+INVALID_TIMESTAMP = np.iinfo(np.int64).min
+MISSING_TIMESTAMP_VALUES = ["0", "", "nan"]
+# Character layout of "dd-MM-yyyy HH:mm:ss" as written by SimulationLogger.
+TIMESTAMP_TEXT_LENGTH = 19
+TIMESTAMP_DIGIT_POSITIONS = [0, 1, 3, 4, 6, 7, 8, 9, 11, 12, 14, 15, 17, 18]
+TIMESTAMP_SEPARATORS = {2: "-", 5: "-", 10: " ", 13: ":", 16: ":"}
+DAYS_IN_MONTH = np.array([31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31], dtype=np.int64)
+
+
+class SimulationStatsData:
+    def __init__(self, columns: Dict[str, np.ndarray], organism_columns: List[str],
+                 fps_by_population: FpsByPopulation,
+                 rows_read: int, rows_dropped: int, rollups: Union[StatsRollups, None] = None, schema: Union[StatsSchema, None] = None):
+        self.columns = columns
+        self.organism_columns = organism_columns
+        self.fps_by_population = fps_by_population
+        self.rows_read = rows_read
+        self.rows_dropped = rows_dropped
+        self.rollups = rollups
+        self.schema = schema
+
+    def __len__(self):
+        timestamps = self.columns.get(TIMESTAMP_COLUMN)
+        return 0 if timestamps is None else len(timestamps)
+
+    def __contains__(self, column_name):
+        return column_name in self.columns
+
+    def __getitem__(self, column_name):
+        return self.columns[column_name]
+
+    def timestamps_as_datetime(self) -> np.ndarray:
+        return self.columns[TIMESTAMP_COLUMN].astype("datetime64[s]")
+
+
+def _read_header_line(csv_path: Union[str, Path]) -> Tuple[List[str], int]:
+    with open(csv_path, "rb") as f:
+        raw_header = f.readline()
+    header_line = raw_header.decode(CSV_ENCODING, errors="replace").strip()
+    if not header_line or not raw_header.endswith(b"\n"):
+        return [], len(raw_header)
+    return [name.strip() for name in header_line.split(CSV_SEPARATOR)], len(raw_header)
+
+
+def read_stats_header(csv_path: Union[str, Path]) -> List[str]:
+    return _read_header_line(csv_path)[0]
+
+
+def _days_from_civil(year: np.ndarray, month: np.ndarray, day: np.ndarray) -> np.ndarray:
+    year = year - (month <= 2)
+    era = year // 400
+    year_of_era = year - era * 400
+    day_of_year = (153 * np.where(month > 2, month - 3, month + 9) + 2) // 5 + day - 1
+    day_of_era = year_of_era * 365 + year_of_era // 4 - year_of_era // 100 + day_of_year
+    return era * 146097 + day_of_era - 719468
+
+
+def _decode_fixed_timestamps(text: np.ndarray) -> np.ndarray:
+    epochs = np.full(len(text), INVALID_TIMESTAMP, dtype=np.int64)
+    if len(text) == 0:
+        return epochs
+    codes = text.astype(f"U{TIMESTAMP_TEXT_LENGTH}").view(np.uint32).reshape(len(text), TIMESTAMP_TEXT_LENGTH).astype(np.int64)
+    digits = codes[:, TIMESTAMP_DIGIT_POSITIONS] - ord("0")
+    valid = (np.char.str_len(text) == TIMESTAMP_TEXT_LENGTH) & ((digits >= 0) & (digits <= 9)).all(axis=1)
+    for position, separator in TIMESTAMP_SEPARATORS.items():
+        valid &= codes[:, position] == ord(separator)
+    pairs = digits[:, 0::2] * 10 + digits[:, 1::2]
+    day, month, century, year_in_century, hour, minute, second = pairs.T
+    year = century * 100 + year_in_century
+    month_index = np.clip(month - 1, 0, 11)
+    leap_day = (month == 2) & (year % 4 == 0) & ((year % 100 != 0) | (year % 400 == 0))
+    valid &= (month >= 1) & (month <= 12) & (day >= 1) & (day <= DAYS_IN_MONTH[month_index] + leap_day)
+    valid &= (hour < 24) & (minute < 60) & (second < 60)
+    days = _days_from_civil(year[valid], month[valid], day[valid])
+    epochs[valid] = days * 86400 + hour[valid] * 3600 + minute[valid] * 60 + second[valid]
+    return epochs
+
+
+def decode_timestamp_strings(values) -> np.ndarray:
+    text = np.char.strip(np.asarray(values, dtype=str))
+    epochs = _decode_fixed_timestamps(text)
+    # Anything off the fixed layout (unpadded fields, stray text) goes through the general parser.
+    leftover = (epochs == INVALID_TIMESTAMP) & ~np.isin(text, MISSING_TIMESTAMP_VALUES)
+    if leftover.any():
+        parsed = pd.to_datetime(pd.Series(text[leftover]), format=TIMESTAMP_FORMAT, errors="coerce")
+        epochs[leftover] = parsed.values.astype("datetime64[s]").astype(np.int64)
+    return epochs
+
+
+def decode_timestamps(raw_values: pd.Series) -> np.ndarray:
+    # The logger writes one-second timestamps once per frame, so each distinct string is parsed only once.
+    codes, uniques = pd.factorize(raw_values)
+    unique_epochs = np.append(decode_timestamp_strings(np.asarray(uniques, dtype=object)), INVALID_TIMESTAMP)
+    return unique_epochs[codes]
+
+
+class _ByteRangeReader(io.RawIOBase):
+    def __init__(self, handle, end_offset: int):
+        self._handle = handle
+        self._remaining = max(0, end_offset - handle.tell())
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        if self._remaining <= 0:
+            return 0
+        data = self._handle.read(min(len(buffer), self._remaining))
+        buffer[:len(data)] = data
+        self._remaining -= len(data)
+        return len(data)
+
+
+def find_complete_rows_end(csv_path: Union[str, Path], start_offset: int) -> int:
+    with open(csv_path, "rb") as f:
+        position = f.seek(0, io.SEEK_END)
+        while position > start_offset:
+            block_start = max(start_offset, position - 65536)
+            f.seek(block_start)
+            block = f.read(position - block_start)
+            newline_index = block.rfind(b"\n")
+            if newline_index != -1:
+                return block_start + newline_index + 1
+            position = block_start
+    return start_offset
+
+
+def iter_stats_chunks(csv_path: Union[str, Path], schema: StatsSchema, start_offset: int, end_offset: int,
+                      chunk_rows: int = STATS_CHUNK_ROWS, lenient: bool = False):
+    if end_offset <= start_offset:
+        return
+    with open(csv_path, "rb") as f:
+        f.seek(start_offset)
+        reader = pd.read_csv(
+            io.BufferedReader(_ByteRangeReader(f, end_offset)),
+            sep=CSV_SEPARATOR,
+            engine="c",
+            header=None,
+            names=schema.header,
+            dtype=schema.read_dtypes(lenient=lenient),
+            encoding=CSV_ENCODING,
+            chunksize=chunk_rows,
+            on_bad_lines="skip",
+        )
+        with reader:
+            for chunk in reader:
+                yield chunk
+
+
+def _reduce_chunk(chunk: pd.DataFrame, schema: StatsSchema, lenient: bool) -> Tuple[Dict[str, np.ndarray], int]:
+    timestamps = decode_timestamps(chunk[TIMESTAMP_COLUMN])
+    valid = timestamps != INVALID_TIMESTAMP
+    reduced = {TIMESTAMP_COLUMN: timestamps[valid]}
+    for name in schema.numeric_columns:
+        values = chunk[name]
+        if lenient:
+            values = pd.to_numeric(values, errors="coerce")
+        reduced[name] = values.to_numpy(dtype=np.float64, na_value=np.nan)[valid]
+    for name in schema.paused_columns:
+        reduced[schema.storage_name(name)] = decode_paused_flags(chunk[name])[valid]
+    return reduced, int((~valid).sum())
+
+
+def _load_stats_range(csv_path: Path, schema: StatsSchema, start_offset: int, end_offset: int, chunk_rows: int, lenient: bool,
+                      aggregates: bool = True):
+    stored_names = [TIMESTAMP_COLUMN] + schema.numeric_columns + [schema.storage_name(name) for name in schema.paused_columns]
+    collected = {name: [] for name in stored_names}
+    # Without aggregates (the live tail) only the rows are decoded; the rollups and the FPS sketch come back as None.
+    fps_by_population = FpsByPopulation() if aggregates else None
+    rollups = StatsRollups(schema.rollup_metrics()) if aggregates else None
+    rows_read = 0
+    rows_dropped = 0
+    for chunk in iter_stats_chunks(csv_path, schema, start_offset, end_offset, chunk_rows=chunk_rows, lenient=lenient):
+        rows_read += len(chunk)
+        reduced, dropped = _reduce_chunk(chunk, schema, lenient)
+        rows_dropped += dropped
+        if aggregates:
+            if TOTAL_ORGANISMS_COLUMN in reduced and "FPS" in reduced:
+                fps_by_population.update(reduced[TOTAL_ORGANISMS_COLUMN], reduced["FPS"])
+            rollups.update(reduced[TIMESTAMP_COLUMN], reduced)
+        # Aggregates above see full precision; only the retained per-row columns are narrowed.
+        for name, values in compact_columns(reduced, schema).items():
+            collected[name].append(values)
+    columns = {}
+    for name, parts in collected.items():
+        columns[name] = np.concatenate(parts) if parts else empty_column(name, schema)
+    return columns, fps_by_population, rollups, rows_read, rows_dropped
+
+
+def _parse_stats_range(csv_path: Path, schema: StatsSchema, start_offset: int, end_offset: int, chunk_rows: int, aggregates: bool = True):
+    try:
+        return _load_stats_range(csv_path, schema, start_offset, end_offset, chunk_rows, lenient=False, aggregates=aggregates)
+    except ValueError as e:
+        print(f"  Warning: Typed read of '{csv_path.name}' failed ({e}). Retrying with lenient numeric parsing.")
+        return _load_stats_range(csv_path, schema, start_offset, end_offset, chunk_rows, lenient=True, aggregates=aggregates)
+
+
+def get_stats_cache_path(csv_path: Union[str, Path]) -> Path:
+    return Path(csv_path).with_name(STATS_CACHE_FILENAME)
+
+
+def _file_head_digest(csv_path: Path, length: int) -> str:
+    with open(csv_path, "rb") as f:
+        return hashlib.sha1(f.read(length)).hexdigest()
+
+
+def csv_fingerprint(csv_path: Union[str, Path], sample_bytes: int = FINGERPRINT_SAMPLE_BYTES) -> dict:
+    csv_path = Path(csv_path)
+    with open(csv_path, "rb") as f:
+        stat = os.fstat(f.fileno())
+        head = f.read(sample_bytes)
+        f.seek(max(0, stat.st_size - sample_bytes))
+        tail = f.read(sample_bytes)
+    return {
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+        "head_sha1": hashlib.sha1(head).hexdigest(),
+        "tail_sha1": hashlib.sha1(tail).hexdigest(),
+    }
+
+
+def _read_stats_cache(cache_path: Path, rollups_only: bool = False):
+    # With rollups_only the column arrays are never read, so the columns and FPS sketch come back as None.
+    if not cache_path.is_file():
+        return None
+    try:
+        with np.load(cache_path, allow_pickle=False) as cached:
+            meta = json.loads(str(cached["meta"]))
+            if meta.get("version") != STATS_CACHE_VERSION:
+                return None
+            columns, fps_by_population = None, None
+            if not rollups_only:
+                columns = {name: cached[f"col_{i}"] for i, name in enumerate(meta["columns"])}
+                fps_by_population = FpsByPopulation.from_arrays(cached)
+            rollups = StatsRollups.from_arrays(cached, meta["rollup_metrics"], meta["rollup_levels"])
+        return meta, columns, fps_by_population, rollups
+    except Exception as e:
+        print(f"  Warning: Ignoring unreadable stats cache '{cache_path}': {e}")
+        return None
+
+
+def _write_stats_cache(cache_path: Path, meta: dict, columns: Dict[str, np.ndarray], fps_by_population: FpsByPopulation, rollups: StatsRollups):
+    arrays = {f"col_{i}": columns[name] for i, name in enumerate(meta["columns"])}
+    arrays.update(rollups.to_arrays())
+    arrays.update(fps_by_population.to_arrays())
+    arrays["meta"] = np.array(json.dumps(meta))
+    try:
+        with atomic_write(cache_path, "wb") as f:
+            np.savez(f, **arrays)
+    except OSError as e:
+        print(f"  Warning: Could not write stats cache '{cache_path}': {e}")
+
+
+def _stats_cache_matches(meta: dict, csv_path: Path, schema: StatsSchema, file_stat) -> bool:
+    # The cached rows must still be a prefix of the file: same header and schema, same leading bytes.
+    return (
+        meta["header"] == schema.header
+        and meta["schema_fingerprint"] == schema.fingerprint
+        and meta["head_length"] <= file_stat.st_size
+        and meta["head_digest"] == _file_head_digest(csv_path, meta["head_length"])
+        and meta["offset"] <= file_stat.st_size
+    )
+
+
+def _load_stats_with_cache(csv_path: Path, schema: StatsSchema, data_offset: int, chunk_rows: int):
+    file_stat = csv_path.stat()
+    head_length = min(file_stat.st_size, STATS_CACHE_HEAD_BYTES)
+    head_digest = _file_head_digest(csv_path, head_length)
+    cache_path = get_stats_cache_path(csv_path)
+    cached = _read_stats_cache(cache_path)
+    cache_valid = cached is not None and _stats_cache_matches(cached[0], csv_path, schema, file_stat)
+    if cache_valid:
+        meta, columns, fps_by_population, rollups = cached
+        if meta["size"] == file_stat.st_size and meta["mtime_ns"] == file_stat.st_mtime_ns:
+            print(f"  Stats cache is current ({meta['rows_read']} rows), skipping CSV parse.")
+            return columns, fps_by_population, rollups, meta["rows_read"], meta["rows_dropped"]
+        start_offset = meta["offset"]
+        print(f"  Stats cache found; parsing {file_stat.st_size - start_offset} appended bytes.")
+    else:
+        meta, columns, fps_by_population, rollups = None, None, None, None
+        start_offset = data_offset
+    end_offset = find_complete_rows_end(csv_path, start_offset)
+    new_columns, new_fps_by_population, new_rollups, new_rows_read, new_rows_dropped = _parse_stats_range(csv_path, schema, start_offset, end_offset, chunk_rows)
+    if columns is None:
+        columns, fps_by_population, rollups = new_columns, new_fps_by_population, new_rollups
+        rows_read, rows_dropped = new_rows_read, new_rows_dropped
+    else:
+        columns = {name: np.concatenate([columns[name], new_columns[name]]) for name in new_columns}
+        fps_by_population.merge(new_fps_by_population)
+        rollups.merge(new_rollups)
+        rows_read = meta["rows_read"] + new_rows_read
+        rows_dropped = meta["rows_dropped"] + new_rows_dropped
+    new_meta = {
+        "version": STATS_CACHE_VERSION,
+        "header": schema.header,
+        "schema_version": schema.version,
+        "schema_fingerprint": schema.fingerprint,
+        "columns": list(columns.keys()),
+        "offset": end_offset,
+        "size": file_stat.st_size,
+        "mtime_ns": file_stat.st_mtime_ns,
+        "head_length": head_length,
+        "head_digest": head_digest,
+        "rows_read": rows_read,
+        "rows_dropped": rows_dropped,
+        "rollup_metrics": rollups.metrics,
+        "rollup_levels": rollups.levels,
+    }
+    _write_stats_cache(cache_path, new_meta, columns, fps_by_population, rollups)
+    return columns, fps_by_population, rollups, rows_read, rows_dropped
+
+
+def load_simulation_stats(csv_path: Union[str, Path], chunk_rows: int = STATS_CHUNK_ROWS, use_cache: bool = True) -> Union[SimulationStatsData, None]:
+    csv_path = Path(csv_path)
+    header, data_offset = _read_header_line(csv_path)
+    if not header:
+        print(f"  Error: The CSV file '{csv_path}' is empty or has no header.")
+        return None
+    if TIMESTAMP_COLUMN not in header:
+        print(f"  Error: Required column '{TIMESTAMP_COLUMN}' not found in the CSV.")
+        return None
+    schema = resolve_stats_schema(header)
+    if use_cache:
+        columns, fps_by_population, rollups, rows_read, rows_dropped = _load_stats_with_cache(csv_path, schema, data_offset, chunk_rows)
+    else:
+        end_offset = find_complete_rows_end(csv_path, data_offset)
+        columns, fps_by_population, rollups, rows_read, rows_dropped = _parse_stats_range(csv_path, schema, data_offset, end_offset, chunk_rows)
+    timestamps = columns[TIMESTAMP_COLUMN]
+    if len(timestamps) > 1 and np.any(timestamps[1:] < timestamps[:-1]):
+        order = np.argsort(timestamps, kind="stable")
+        columns = {name: values[order] for name, values in columns.items()}
+    return SimulationStatsData(columns, schema.organism_columns, fps_by_population, rows_read, rows_dropped, rollups, schema)
+
+
+def load_stats_rollups(csv_path: Union[str, Path]) -> Union[StatsRollups, None]:
+    # Reads only the rollup tables when the stats cache is current; otherwise loads (and refreshes the cache) as usual.
+    csv_path = Path(csv_path)
+    header, _ = _read_header_line(csv_path)
+    if header and TIMESTAMP_COLUMN in header:
+        schema = resolve_stats_schema(header)
+        cached = _read_stats_cache(get_stats_cache_path(csv_path), rollups_only=True)
+        if cached is not None:
+            meta, _, _, rollups = cached
+            file_stat = csv_path.stat()
+            if (_stats_cache_matches(meta, csv_path, schema, file_stat)
+                    and meta["size"] == file_stat.st_size and meta["mtime_ns"] == file_stat.st_mtime_ns):
+                return rollups
+    stats = load_simulation_stats(csv_path)
+    return stats.rollups if stats is not None else None
+
+
+class StatsTail:
+    def __init__(self, csv_path: Union[str, Path], chunk_rows: int = STATS_CHUNK_ROWS, backlog_bytes: Union[int, None] = None):
+        self.csv_path = Path(csv_path)
+        self.chunk_rows = chunk_rows
+        self.backlog_bytes = backlog_bytes
+        self.header = []
+        self.schema = None
+        self.organism_columns = []
+        self.offset = 0
+        self.generation = 0
+        self.rows_read = 0
+        self.rows_dropped = 0
+        self._head_length = 0
+        self._head_digest = ""
+
+    def _restart(self, file_size: int) -> bool:
+        header, data_offset = _read_header_line(self.csv_path)
+        if not header or TIMESTAMP_COLUMN not in header:
+            self.header = []
+            return False
+        self.header = header
+        self.schema = resolve_stats_schema(header)
+        self.organism_columns = self.schema.organism_columns
+        self.offset = data_offset
+        if self.backlog_bytes is not None and file_size - self.backlog_bytes > data_offset:
+            # Start at the first full row inside the backlog instead of replaying the whole run.
+            with open(self.csv_path, "rb") as f:
+                f.seek(file_size - self.backlog_bytes - 1)
+                f.readline()
+                self.offset = f.tell()
+        self.rows_read = 0
+        self.rows_dropped = 0
+        self._head_length = min(file_size, STATS_CACHE_HEAD_BYTES)
+        self._head_digest = _file_head_digest(self.csv_path, self._head_length)
+        self.generation += 1
+        return True
+
+    def _file_replaced(self, file_size: int) -> bool:
+        # The logger deletes and recreates the CSV when a run restarts.
+        if file_size < self.offset or file_size < self._head_length:
+            return True
+        return _file_head_digest(self.csv_path, self._head_length) != self._head_digest
+
+    def poll(self) -> Union[Dict[str, np.ndarray], None]:
+        try:
+            file_size = self.csv_path.stat().st_size
+            if not self.header or self._file_replaced(file_size):
+                if not self._restart(file_size):
+                    return None
+            end_offset = find_complete_rows_end(self.csv_path, self.offset)
+            if end_offset <= self.offset:
+                return None
+            columns, _, _, rows_read, rows_dropped = _parse_stats_range(self.csv_path, self.schema, self.offset, end_offset, self.chunk_rows, aggregates=False)
+        except OSError:
+            return None
+        self.offset = end_offset
+        if self._head_length < STATS_CACHE_HEAD_BYTES:
+            # Widen the identity sample past the header so a recreated file with the same header is noticed.
+            self._head_length = min(end_offset, STATS_CACHE_HEAD_BYTES)
+            self._head_digest = _file_head_digest(self.csv_path, self._head_length)
+        self.rows_read += rows_read
+        self.rows_dropped += rows_dropped
+        return columns
@@ -0,0 +1,202 @@
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Union, Callable, Dict, List, Tuple
+
+DEFAULT_TOKEN_MODEL = "gpt-3.5-turbo"
+DEFAULT_TOKEN_ENCODING = "cl100k_base"
+TOKEN_LEDGER_VERSION = 1
+# Fine-tuned inference prices in USD per million (input, output) tokens, matched by base-model prefix.
+MODEL_PRICES_PER_MILLION = {
+    "gpt-4o-mini": (0.30, 1.20),
+    "gpt-4o": (3.75, 15.00),
+    "gpt-4.1-nano": (0.20, 0.80),
+    "gpt-4.1-mini": (0.80, 3.20),
+    "gpt-4.1": (3.00, 12.00),
+    "gpt-3.5-turbo": (3.00, 6.00),
+}
+
+_encoders = {}
+_static_counts = {}
+_encoder_lock = threading.Lock()
+
+
+def get_encoder(model_name: Union[str, None] = None):
+    # encoding_for_model builds (and may download) the BPE tables, so each model resolves once per process.
+    key = model_name or DEFAULT_TOKEN_MODEL
+    with _encoder_lock:
+        if key in _encoders:
+            return _encoders[key]
+        try:
+            import tiktoken
+        except ImportError:
+            encoder = None
+        else:
+            try:
+                encoder = tiktoken.encoding_for_model(key)
+            except Exception:
+                try:
+                    encoder = tiktoken.get_encoding(DEFAULT_TOKEN_ENCODING)
+                except Exception as e:
+                    print(f"Warning: No tiktoken encoding available ({type(e).__name__}); token counts will be word estimates.")
+                    encoder = None
+        _encoders[key] = encoder
+        return encoder
+
+
+def count_tokens(text: str, model_name: Union[str, None] = None) -> int:
+    encoder = get_encoder(model_name)
+    if encoder is None:
+        return len(text.split())
+    return len(encoder.encode(text))
+
+
+def count_static_tokens(text: str, counter: Callable[[str], int]) -> int:
+    # System prompts never change while the app runs; count them once per counter.
+    key = (counter, text)
+    count = _static_counts.get(key)
+    if count is None:
+        count = _static_counts[key] = counter(text)
+    return count
+
+
+def usage_token_counts(response) -> Union[Tuple[int, int], None]:
+    try:
+        usage = response.get("usage")
+    except AttributeError:
+        usage = getattr(response, "usage", None)
+    if not usage:
+        return None
+    try:
+        return int(usage["prompt_tokens"]), int(usage["completion_tokens"])
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+def model_prices(model_name: Union[str, None]) -> Union[Tuple[float, float], None]:
+    if not model_name:
+        return None
+    # Fine-tuned ids look like "ft:gpt-4o-mini-2024-07-18:org::id".
+    base = model_name[3:] if model_name.startswith("ft:") else model_name
+    for prefix in sorted(MODEL_PRICES_PER_MILLION, key=len, reverse=True):
+        if base.startswith(prefix):
+            return MODEL_PRICES_PER_MILLION[prefix]
+    return None
+
+
+def estimate_cost(model_name: Union[str, None], input_tokens: int, output_tokens: int) -> Union[float, None]:
+    prices = model_prices(model_name)
+    if prices is None:
+        return None
+    return (input_tokens * prices[0] + output_tokens * prices[1]) / 1_000_000
+
+
+class TokenLedger:
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._ready = False
+
+    def _connect(self) -> sqlite3.Connection:
+        if not self._ready:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+        connection = sqlite3.connect(self.path, timeout=10)
+        connection.row_factory = sqlite3.Row
+        if not self._ready:
+            with connection:
+                connection.execute(
+                    "CREATE TABLE IF NOT EXISTS token_usage ("
+                    " id INTEGER PRIMARY KEY AUTOINCREMENT,"
+                    " recorded_at TEXT NOT NULL,"
+                    " day TEXT NOT NULL,"
+                    " simulation TEXT,"
+                    " stage TEXT,"
+                    " model TEXT,"
+                    " input_tokens INTEGER NOT NULL,"
+                    " output_tokens INTEGER NOT NULL,"
+                    " source TEXT NOT NULL,"
+                    " cost_usd REAL)")
+                connection.execute("CREATE INDEX IF NOT EXISTS token_usage_day ON token_usage (day)")
+                connection.execute("CREATE INDEX IF NOT EXISTS token_usage_simulation ON token_usage (simulation)")
+                connection.execute(f"PRAGMA user_version = {TOKEN_LEDGER_VERSION}")
+            self._ready = True
+        return connection
+
+    def record(self, simulation: Union[str, None], stage: str, model_name: Union[str, None],
+               input_tokens: int, output_tokens: int, source: str) -> Union[float, None]:
+        cost = estimate_cost(model_name, input_tokens, output_tokens)
+        now = time.localtime()
+        with self._lock:
+            connection = self._connect()
+            try:
+                with connection:
+                    connection.execute(
+                        "INSERT INTO token_usage (recorded_at, day, simulation, stage, model, input_tokens, output_tokens, source, cost_usd)"
+                        " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                        (time.strftime("%Y-%m-%d %H:%M:%S", now), time.strftime("%Y-%m-%d", now), simulation, stage,
+                         model_name, int(input_tokens), int(output_tokens), source, cost))
+            finally:
+                connection.close()
+        return cost
+
+    def _totals(self, group_column: str, where: str = "", parameters: tuple = ()) -> List[Dict]:
+        with self._lock:
+            connection = self._connect()
+            try:
+                rows = connection.execute(
+                    f"SELECT {group_column} AS key, COUNT(*) AS calls, SUM(input_tokens) AS input_tokens,"
+                    f" SUM(output_tokens) AS output_tokens, SUM(cost_usd) AS cost_usd"
+                    f" FROM token_usage {where} GROUP BY {group_column} ORDER BY {group_column}", parameters).fetchall()
+            finally:
+                connection.close()
+        return [dict(row) for row in rows]
+
+    def by_day(self, since: Union[str, None] = None) -> List[Dict]:
+        if since:
+            return self._totals("day", "WHERE day >= ?", (since,))
+        return self._totals("day")
+
+    def by_simulation(self, simulation: Union[str, None] = None) -> List[Dict]:
+        if simulation is not None:
+            return self._totals("simulation", "WHERE simulation = ?", (simulation,))
+        return self._totals("simulation")
+
+
+_ledgers = {}
+
+
+def token_ledger(path: Union[str, Path]) -> TokenLedger:
+    key = str(path)
+    with _encoder_lock:
+        if key not in _ledgers:
+            _ledgers[key] = TokenLedger(path)
+        return _ledgers[key]
+
+
+def record_token_usage(path: Union[str, Path, None], simulation: Union[str, None], stage: str, model_name: Union[str, None],
+                       input_tokens: int, output_tokens: int, source: str) -> Union[float, None]:
+    if path is None:
+        return estimate_cost(model_name, input_tokens, output_tokens)
+    try:
+        return token_ledger(path).record(simulation, stage, model_name, input_tokens, output_tokens, source)
+    except (sqlite3.Error, OSError) as e:
+        print(f"Warning: Could not record token usage in '{path}': {e}")
+        return estimate_cost(model_name, input_tokens, output_tokens)
+
+
+def describe_token_totals(totals: Dict) -> str:
+    cost = totals.get("cost_usd")
+    cost_text = f", est. ${cost:.4f}" if cost is not None else ""
+    return f"{totals.get('calls', 0)} calls, {totals.get('input_tokens') or 0:,} in / {totals.get('output_tokens') or 0:,} out tokens{cost_text}"
+
+
+def simulation_token_summary(path: Union[str, Path, None], simulation: str) -> Union[str, None]:
+    if path is None:
+        return None
+    try:
+        totals = token_ledger(path).by_simulation(simulation)
+    except (sqlite3.Error, OSError) as e:
+        print(f"Warning: Could not read token usage from '{path}': {e}")
+        return None
+    return describe_token_totals(totals[0]) if totals else None
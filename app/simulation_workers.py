@@ -0,0 +1,66 @@
+import contextlib
+import sys
+import threading
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing import get_context
+from typing import Union, Callable, Dict, Hashable
+
+
+_main_script_lock = threading.Lock()
+_main_script_users = 0
+_main_script_file = None
+
+
+@contextlib.contextmanager
+def _main_script_hidden_from_workers():
+    # Spawned workers re-run the main script unless it is hidden, and the manager scripts build their window at import.
+    # Pools on other threads overlap, so the first one in hides the file and the last one out restores it.
+    global _main_script_users, _main_script_file
+    if getattr(sys, "frozen", False):
+        yield
+        return
+    main_module = sys.modules.get("__main__")
+    with _main_script_lock:
+        if _main_script_users == 0:
+            _main_script_file = getattr(main_module, "__file__", None)
+            if _main_script_file is not None:
+                del main_module.__file__
+        _main_script_users += 1
+    try:
+        yield
+    finally:
+        with _main_script_lock:
+            _main_script_users -= 1
+            if _main_script_users == 0 and _main_script_file is not None:
+                main_module.__file__ = _main_script_file
+                _main_script_file = None
+
+
+def run_in_spawn_pool(function: Callable, jobs: Dict[Hashable, tuple], worker_count: int, on_result: Callable[[Hashable, object], None],
+                      description: str, fallback: Union[Callable[[Hashable], object], None] = None,
+                      should_stop: Callable[[], bool] = lambda: False) -> bool:
+    # Runs function(*jobs[key]) in spawned workers and hands each result to on_result(key, result) as it arrives.
+    # Jobs the pool could not finish run in this process, through fallback(key) when given. False if should_stop() ended the run.
+    pending = dict(jobs)
+    if worker_count > 1 and len(pending) > 1:
+        try:
+            with _main_script_hidden_from_workers():
+                with ProcessPoolExecutor(max_workers=min(worker_count, len(pending)), mp_context=get_context("spawn")) as executor:
+                    futures = {executor.submit(function, *arguments): key for key, arguments in pending.items()}
+                    for future in as_completed(futures):
+                        result = future.result()
+                        key = futures[future]
+                        pending.pop(key, None)
+                        on_result(key, result)
+                        if should_stop():
+                            for other in futures:
+                                other.cancel()
+                            return False
+        except (BrokenProcessPool, OSError, RuntimeError) as e:
+            print(f"  Warning: Parallel {description} unavailable ({type(e).__name__}: {e}). Running {len(pending)} remaining job(s) serially.")
+    for key, arguments in pending.items():
+        if should_stop():
+            return False
+        on_result(key, fallback(key) if fallback is not None else function(*arguments))
+    return True
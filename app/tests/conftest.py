@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# The manager scripts import the simulation_* modules from the app folder, not as a package.
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
@@ -0,0 +1,60 @@
+import asyncio
+import concurrent.futures
+import time
+
+import pytest
+
+from simulation_api_async import ApiPipelineRunner
+
+
+def test_close_cancels_in_flight_work_and_closes_the_session():
+    runner = ApiPipelineRunner()
+    started = concurrent.futures.Future()
+
+    async def request():
+        async with runner.api_slot():
+            started.set_result(runner._http)
+            await asyncio.sleep(30)
+
+    future = runner.submit(request())
+    http = started.result(5)
+    begin = time.perf_counter()
+    runner.close()
+    assert time.perf_counter() - begin < 5
+    assert http.closed
+    assert not runner._thread.is_alive()
+    with pytest.raises(concurrent.futures.CancelledError):
+        future.result(1)
+
+
+def test_runner_can_be_used_again_after_close():
+    runner = ApiPipelineRunner()
+    assert runner.run(runner.to_thread(sum, [1, 2, 3])) == 6
+    runner.close()
+    assert runner.run(runner.to_thread(sum, [4, 5])) == 9
+    runner.close()
+    runner.close()
+
+
+def test_background_close_returns_before_requests_finish_cancelling():
+    runner = ApiPipelineRunner()
+    started = concurrent.futures.Future()
+
+    async def request():
+        async with runner.api_slot():
+            started.set_result(runner._http)
+            try:
+                await asyncio.sleep(30)
+            finally:
+                # A request that takes a while to unwind after it is cancelled.
+                await asyncio.sleep(0.5)
+
+    runner.submit(request())
+    http = started.result(5)
+    begin = time.perf_counter()
+    closing = runner.close_in_background()
+    assert time.perf_counter() - begin < 0.25
+    assert not http.closed
+    closing.join(5)
+    assert http.closed
+    assert not closing.daemon
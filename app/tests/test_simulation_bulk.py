@@ -0,0 +1,102 @@
+import asyncio
+import json
+
+import pytest
+
+from simulation_bulk import (read_bulk_manifest, run_bulk_creation, write_bulk_report, count_bulk_results, BULK_FAILED_MANIFEST_FILENAME,
+                             STATUS_CREATED, STATUS_FAILED, STATUS_SKIPPED, STATUS_INVALID)
+
+
+def write_jsonl(path, lines):
+    path.write_text("\n".join(line if isinstance(line, str) else json.dumps(line) for line in lines) + "\n", encoding="utf-8")
+    return path
+
+
+def test_jsonl_manifest_rows_and_errors(tmp_path):
+    manifest = write_jsonl(tmp_path / "manifest.jsonl", [
+        {"name": "Alpha", "description": "E. coli doubling every 20 min"},
+        "# comment",
+        "",
+        {"name": "Beta", "description": "Yeast", "options": {"use_cache": "no"}},
+        {"name": "alpha", "description": "duplicate"},
+        {"name": "Bad/Name", "description": "x"},
+        {"name": "NoDescription"},
+        {"name": "Gamma", "description": "x", "options": {"color": "red"}},
+        "{not json",
+        "[1, 2]",
+    ])
+    rows, invalid = read_bulk_manifest(manifest)
+    assert [(row["line"], row["name"], row["options"]) for row in rows] == [(1, "Alpha", {}), (4, "Beta", {"use_cache": False})]
+    assert [entry["line"] for entry in invalid] == [5, 6, 7, 8, 9, 10]
+    assert all(entry["status"] == STATUS_INVALID for entry in invalid)
+    assert "duplicate name" in invalid[0]["error"]
+    assert "unknown option 'color'" in invalid[3]["error"]
+
+
+def test_csv_manifest_with_option_columns(tmp_path):
+    manifest = tmp_path / "manifest.csv"
+    manifest.write_text("name,description,use_cache\nAlpha,First,yes\nBeta,Second,\nGamma,Third,maybe\n", encoding="utf-8")
+    rows, invalid = read_bulk_manifest(manifest)
+    assert [(row["line"], row["name"], row["options"]) for row in rows] == [(2, "Alpha", {"use_cache": True}), (3, "Beta", {})]
+    assert invalid[0]["line"] == 4 and "invalid 'use_cache'" in invalid[0]["error"]
+
+
+def test_rerun_resumes_after_existing_folders(tmp_path):
+    simulations = tmp_path / "Simulations"
+    simulations.mkdir()
+    rows, _ = read_bulk_manifest(write_jsonl(tmp_path / "m.jsonl", [{"name": name, "description": "d"} for name in ("A", "B", "C", "D")]))
+    created = []
+
+    async def create(name, description, **options):
+        if name == "C":
+            return False, "model rejected the prompt"
+        (simulations / name).mkdir()
+        created.append(name)
+        return True, None
+
+    first = asyncio.run(run_bulk_creation(rows, create, simulations, concurrency=2, requests_per_minute=0))
+    assert [result["status"] for result in first] == [STATUS_CREATED, STATUS_CREATED, STATUS_FAILED, STATUS_CREATED]
+    second = asyncio.run(run_bulk_creation(rows, create, simulations, concurrency=2, requests_per_minute=0))
+    assert [result["status"] for result in second] == [STATUS_SKIPPED, STATUS_SKIPPED, STATUS_FAILED, STATUS_SKIPPED]
+    assert sorted(created) == ["A", "B", "D"]
+    assert count_bulk_results(second) == {STATUS_CREATED: 0, STATUS_FAILED: 1, STATUS_SKIPPED: 3, STATUS_INVALID: 0}
+
+
+def test_exceptions_and_cancellation_are_reported_per_row(tmp_path):
+    rows, _ = read_bulk_manifest(write_jsonl(tmp_path / "m.jsonl", [{"name": name, "description": "d"} for name in ("A", "B")]))
+
+    async def create(name, description, **options):
+        raise RuntimeError("connection reset")
+
+    results = asyncio.run(run_bulk_creation(rows, create, tmp_path, concurrency=1, requests_per_minute=0))
+    assert results[0]["status"] == STATUS_FAILED and results[0]["error"] == "RuntimeError: connection reset"
+    stopped = asyncio.run(run_bulk_creation(rows, create, tmp_path, concurrency=1, requests_per_minute=0, should_stop=lambda: True))
+    assert [result["error"] for result in stopped] == ["cancelled", "cancelled"]
+
+
+def test_report_lists_every_row_and_a_retry_manifest(tmp_path):
+    rows, invalid = read_bulk_manifest(write_jsonl(tmp_path / "m.jsonl", [
+        {"name": "A", "description": "d"}, {"name": "B", "description": "e", "options": {"use_cache": False}}, {"name": ""}]))
+    results = [{"line": 2, "name": "B", "status": STATUS_FAILED, "seconds": 1.5, "error": "timeout"},
+               {"line": 1, "name": "A", "status": STATUS_CREATED, "seconds": 2.0, "error": ""}] + invalid
+    report = write_bulk_report(results, rows, tmp_path / "report")
+    lines = report.read_text(encoding="utf-8").splitlines()
+    assert lines[0] == "line,name,status,seconds,error"
+    assert [line.split(",")[1] for line in lines[1:]] == ["A", "B", ""]
+    retry_rows, retry_invalid = read_bulk_manifest(tmp_path / "report" / BULK_FAILED_MANIFEST_FILENAME)
+    assert [(row["name"], row["options"]) for row in retry_rows] == [("B", {"use_cache": False})] and retry_invalid == []
+    write_bulk_report(results[1:2], rows, tmp_path / "report")
+    assert not (tmp_path / "report" / BULK_FAILED_MANIFEST_FILENAME).exists()
+
+
+@pytest.mark.parametrize("per_minute, minimum_seconds", [(0, 0.0), (600, 0.2)])
+def test_rate_limit_spaces_out_starts(tmp_path, per_minute, minimum_seconds):
+    rows, _ = read_bulk_manifest(write_jsonl(tmp_path / "m.jsonl", [{"name": name, "description": "d"} for name in "ABC"]))
+    starts = []
+
+    async def create(name, description, **options):
+        starts.append(asyncio.get_running_loop().time())
+        return True, None
+
+    asyncio.run(run_bulk_creation(rows, create, tmp_path, concurrency=3, requests_per_minute=per_minute))
+    assert max(starts) - min(starts) >= minimum_seconds - 0.01
@@ -0,0 +1,108 @@
+import asyncio
+import random
+
+import pytest
+
+from simulation_api_async import ApiPipelineRunner
+from simulation_codeblocks import CODE_BLOCK_PATTERN, IncrementalCodeBlockParser, StreamedCodeWriter
+
+REPLY = "1.A.cs{public class A { }}2.B.cs{struct B { int x; }}3.C.cs{class C { void F() { } }}"
+
+
+def buffered_blocks(reply: str):
+    return [(name, content.strip()) for _, name, content in CODE_BLOCK_PATTERN.findall(reply.strip())]
+
+
+def stream_blocks(reply: str, chunk_size: int):
+    parser = IncrementalCodeBlockParser()
+    blocks = []
+    for start in range(0, len(reply), chunk_size):
+        blocks.extend(parser.feed(reply[start:start + chunk_size]))
+    blocks.extend(parser.close())
+    return blocks, parser.block_count
+
+
+@pytest.mark.parametrize("ending", ["", " ", "\n", "\n\n", "\r\n", " \t\n"])
+@pytest.mark.parametrize("chunk_size", [1, 3, 7, 1000])
+def test_trailing_whitespace_keeps_the_last_block(ending, chunk_size):
+    blocks, count = stream_blocks(REPLY + ending, chunk_size)
+    assert [name for name, _ in blocks] == ["A.cs", "B.cs", "C.cs"]
+    assert blocks == buffered_blocks(REPLY + ending)
+    assert count == 3
+
+
+def test_block_is_held_until_the_next_marker_arrives():
+    parser = IncrementalCodeBlockParser()
+    assert parser.feed("1.A.cs{class A { }}") == []
+    assert parser.feed("2") == []
+    assert parser.feed(".B.cs{x}") == [("A.cs", "class A { }")]
+    assert parser.close() == [("B.cs", "x")]
+
+
+def test_brace_followed_by_a_number_inside_code_ends_the_block_like_findall():
+    reply = "1.A.cs{if (a) { b(); }2.0f; }2.B.cs{y}"
+    assert stream_blocks(reply, 2)[0] == buffered_blocks(reply)
+
+
+def test_text_without_blocks_yields_nothing():
+    assert stream_blocks("ERROR INVALID QUESTION FORMAT\n", 4) == ([], 0)
+
+
+def test_matches_findall_on_random_replies():
+    rng = random.Random(0)
+    alphabet = ["1.", "2.", "12.", "A.cs{", "B.cs{", "}", "{", " ", "\n", "x", ".", "3"]
+    for _ in range(500):
+        reply = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 30)))
+        assert stream_blocks(reply, rng.randint(1, 6))[0] == buffered_blocks(reply), reply
+
+
+def test_writer_writes_every_block_of_a_reply_ending_in_whitespace(tmp_path):
+    runner = ApiPipelineRunner(concurrency=1, disk_workers=2)
+    prepared = []
+
+    def prepare():
+        prepared.append(True)
+        return {"folder": tmp_path}
+
+    def write(context, file_name, content):
+        (context["folder"] / file_name).write_text(content)
+        return [file_name]
+
+    async def stream():
+        writer = StreamedCodeWriter(runner, prepare, write)
+        reply = REPLY + "\r\n"
+        for start in range(0, len(reply), 5):
+            writer.feed(reply[start:start + 5])
+        codes = await writer.finish()
+        return writer, codes
+
+    try:
+        writer, codes = asyncio.run(stream())
+    finally:
+        runner.close()
+    assert list(codes) == ["A.cs", "B.cs", "C.cs"]
+    assert writer.files_processed == ["A.cs", "B.cs", "C.cs"]
+    assert (tmp_path / "C.cs").read_text() == "class C { void F() { } }"
+    assert prepared == [True]
+
+
+def test_writer_lists_a_repeated_file_once_with_its_last_version(tmp_path):
+    runner = ApiPipelineRunner(concurrency=1, disk_workers=2)
+
+    def write(context, file_name, content):
+        path = context["folder"] / file_name
+        path.write_text(content)
+        return [str(path)]
+
+    async def stream():
+        writer = StreamedCodeWriter(runner, lambda: {"folder": tmp_path}, write)
+        writer.feed("1.A.cs{class A { }}2.B.cs{class B { }}3.A.cs{class A2 { }}")
+        await writer.finish()
+        return writer
+
+    try:
+        writer = asyncio.run(stream())
+    finally:
+        runner.close()
+    assert writer.files_processed == [str(tmp_path / "A.cs"), str(tmp_path / "B.cs")]
+    assert (tmp_path / "A.cs").read_text() == "class A2 { }"
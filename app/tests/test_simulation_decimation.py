@@ -0,0 +1,87 @@
+import math
+
+import numpy as np
+import pytest
+
+from simulation_decimation import lttb_indices, minmax_indices, decimate_series, decimation_indices
+
+
+def reference_lttb(x, y, threshold):
+    # Straight port of Steinarsson's reference implementation, one bucket at a time.
+    length = len(x)
+    every = (length - 2) / (threshold - 2)
+    selected = [0]
+    previous = 0
+    for bucket in range(threshold - 2):
+        average_start = math.floor((bucket + 1) * every) + 1
+        average_end = min(math.floor((bucket + 2) * every) + 1, length)
+        average_x = sum(x[average_start:average_end]) / (average_end - average_start)
+        average_y = sum(y[average_start:average_end]) / (average_end - average_start)
+        range_start = math.floor(bucket * every) + 1
+        range_end = math.floor((bucket + 1) * every) + 1
+        best_area, best = -1.0, range_start
+        for index in range(range_start, range_end):
+            area = abs((x[previous] - average_x) * (y[index] - y[previous]) - (x[previous] - x[index]) * (average_y - y[previous])) * 0.5
+            if area > best_area:
+                best_area, best = area, index
+        selected.append(best)
+        previous = best
+    selected.append(length - 1)
+    return selected
+
+
+@pytest.mark.parametrize("length, threshold", [(10, 5), (101, 7), (1000, 50), (1234, 100)])
+def test_lttb_matches_the_reference_implementation(length, threshold):
+    rng = np.random.default_rng(length)
+    x = np.cumsum(rng.uniform(0.5, 1.5, length))
+    y = np.cumsum(rng.normal(0, 1, length))
+    np.testing.assert_array_equal(lttb_indices(x, y, threshold), reference_lttb(x.tolist(), y.tolist(), threshold))
+
+
+def test_lttb_keeps_the_endpoints_and_a_lone_spike():
+    y = np.zeros(1000)
+    y[437] = 50.0
+    indices = lttb_indices(np.arange(1000), y, 20)
+    assert indices[0] == 0 and indices[-1] == 999
+    assert 437 in indices
+    assert len(indices) <= 20
+
+
+def test_lttb_with_epoch_second_x_values():
+    x = 1_747_483_200 + np.arange(5000, dtype=np.float64)
+    y = np.sin(np.arange(5000) / 50.0)
+    np.testing.assert_array_equal(lttb_indices(x, y, 40), lttb_indices(np.arange(5000.0), y, 40))
+
+
+def test_lttb_skips_non_finite_points():
+    y = np.sin(np.arange(500) / 10.0)
+    y[::7] = np.nan
+    indices = lttb_indices(np.arange(500), y, 30)
+    assert np.isfinite(y[indices]).all()
+    assert len(indices) <= 30
+
+
+def test_small_inputs_are_returned_whole():
+    np.testing.assert_array_equal(lttb_indices([0, 1, 2], [5, 6, 7], 10), [0, 1, 2])
+    np.testing.assert_array_equal(minmax_indices([5, 6, 7], 2), [0, 1, 2])
+
+
+def test_minmax_keeps_every_bucket_extreme():
+    y = np.array([3, 9, 1, 4, 4, 0, 8, 2, 7, 5], dtype=float)
+    indices = minmax_indices(y, 6)
+    # Two buckets of five rows: [3, 9, 1, 4, 4] and [0, 8, 2, 7, 5], plus both endpoints.
+    np.testing.assert_array_equal(indices, [0, 1, 2, 5, 6, 9])
+
+
+def test_decimate_series_accepts_datetime_x():
+    x = np.datetime64("2025-05-17T12:00:00") + np.arange(2000).astype("timedelta64[s]")
+    y = np.cos(np.arange(2000) / 30.0)
+    decimated_x, decimated_y = decimate_series(x, y, 100)
+    assert decimated_x.dtype == x.dtype
+    assert decimated_x[0] == x[0] and decimated_x[-1] == x[-1]
+    assert len(decimated_y) == 100
+
+
+def test_unknown_method_is_rejected():
+    with pytest.raises(ValueError):
+        decimation_indices([0, 1, 2, 3], [0, 1, 2, 3], 3, method="average")
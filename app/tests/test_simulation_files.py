@@ -0,0 +1,36 @@
+import os
+
+import pytest
+
+from simulation_files import atomic_write
+
+
+def test_write_replaces_the_target(tmp_path):
+    target = tmp_path / "summary.json"
+    target.write_text("old", encoding="utf-8")
+    with atomic_write(target, "w", encoding="utf-8") as f:
+        f.write("new")
+    assert target.read_text(encoding="utf-8") == "new"
+    assert os.listdir(tmp_path) == [target.name]
+
+
+def test_failed_write_keeps_the_target_and_removes_the_temp_file(tmp_path):
+    target = tmp_path / "models.npz"
+    target.write_bytes(b"old")
+    with pytest.raises(ValueError):
+        with atomic_write(target, "wb") as f:
+            f.write(b"partial")
+            raise ValueError("not serializable")
+    assert target.read_bytes() == b"old"
+    assert os.listdir(tmp_path) == [target.name]
+
+
+def test_overlapping_writers_use_separate_temp_files(tmp_path):
+    target = tmp_path / "manifest.json"
+    with atomic_write(target, "w", encoding="utf-8") as first:
+        with atomic_write(target, "w", encoding="utf-8") as second:
+            assert first.name != second.name
+            second.write("second")
+        first.write("first")
+    assert target.read_text(encoding="utf-8") == "first"
+    assert os.listdir(tmp_path) == [target.name]
@@ -0,0 +1,47 @@
+import math
+
+import numpy as np
+import pytest
+
+from simulation_fitting import fit_exponential_growth, fit_growth_columns
+
+
+def test_exact_exponential_is_recovered():
+    t = np.linspace(0, 100, 200)
+    record = fit_exponential_growth(t, 5 * np.exp(0.03 * t))[0]
+    assert record["a"] == pytest.approx(5)
+    assert record["b"] == pytest.approx(0.03)
+    assert record["r_squared"] == pytest.approx(1)
+    assert record["doubling_time"] == pytest.approx(math.log(2) / 0.03)
+    assert record["points"] == 200
+
+
+def test_columns_are_fitted_independently_in_one_pass():
+    t = np.linspace(0, 50, 101)
+    counts = np.column_stack([2 * np.exp(0.1 * t), 7 * np.exp(-0.02 * t), 3 * np.exp(0.05 * t)])
+    counts[::10, 2] = 0
+    counts[5, 0] = np.nan
+    records = fit_exponential_growth(t, counts)
+    np.testing.assert_allclose(records["a"], [2, 7, 3])
+    np.testing.assert_allclose(records["b"], [0.1, -0.02, 0.05])
+    # Shrinking populations have no doubling time.
+    assert math.isnan(records["doubling_time"][1])
+    np.testing.assert_array_equal(records["points"], [100, 101, 101])
+
+
+def test_columns_without_two_positive_counts_are_left_unfitted():
+    t = np.arange(5.0)
+    records = fit_exponential_growth(t, np.column_stack([np.zeros(5), [0, 0, 3, 0, 0], np.full(5, np.nan)]))
+    assert np.isnan(records["a"]).all() and np.isnan(records["b"]).all()
+    np.testing.assert_array_equal(records["points"], [5, 5, 0])
+
+
+def test_empty_column_list():
+    assert len(fit_exponential_growth(np.arange(3.0), np.empty((3, 0)))) == 0
+
+
+def test_fit_growth_columns_names_each_result():
+    t = np.linspace(0, 10, 50)
+    fits = fit_growth_columns({"SimulatedTime": t, "EColi": 2 * np.exp(0.3 * t), "SCerevisiae": np.zeros(50)}, ["EColi", "SCerevisiae"])
+    assert fits["EColi"]["b"] == pytest.approx(0.3)
+    assert fits.is_valid("EColi") and not fits.is_valid("SCerevisiae")
@@ -0,0 +1,69 @@
+import math
+
+import numpy as np
+import pytest
+
+from simulation_metrics import regression_metrics, r2_scores, rmse_scores, mae_scores, mape_scores, aic_scores
+
+
+def test_known_values_for_a_single_column():
+    metrics = regression_metrics([1, 2, 3, 4], [1, 2, 3, 5], param_count=2)
+    assert metrics["rss"][0] == pytest.approx(1.0)
+    assert metrics["r_squared"][0] == pytest.approx(0.8)
+    assert metrics["rmse"][0] == pytest.approx(0.5)
+    assert metrics["mae"][0] == pytest.approx(0.25)
+    assert metrics["mape"][0] == pytest.approx(0.0625)
+    assert metrics["aic"][0] == pytest.approx(4 * math.log(0.25) + 4)
+    assert metrics["bic"][0] == pytest.approx(4 * math.log(0.25) + 2 * math.log(4))
+    assert metrics["points"][0] == 4
+
+
+def test_columns_are_scored_independently():
+    observed = np.array([[1, 1], [2, 2], [3, 3], [4, 4]], dtype=float)
+    predicted = np.array([[1, 2], [2, 3], [3, 4], [5, 5]], dtype=float)
+    np.testing.assert_allclose(r2_scores(observed, predicted), [0.8, 0.2])
+    np.testing.assert_allclose(rmse_scores(observed, predicted), [0.5, 1.0])
+    np.testing.assert_allclose(mae_scores(observed, predicted), [0.25, 1.0])
+    np.testing.assert_allclose(mape_scores(observed, predicted), [0.0625, (1 + 1 / 2 + 1 / 3 + 1 / 4) / 4])
+    np.testing.assert_allclose(aic_scores(observed, predicted, 1), [4 * math.log(0.25) + 2, 2])
+
+
+def test_one_prediction_is_broadcast_across_columns():
+    observed = np.array([[1, 2], [2, 2], [3, 2]], dtype=float)
+    np.testing.assert_allclose(rmse_scores(observed, [1, 2, 3]), [0.0, math.sqrt(2 / 3)])
+
+
+def test_constant_target_follows_the_r2_score_convention():
+    assert r2_scores([3, 3, 3], [3, 3, 3])[0] == 1.0
+    assert r2_scores([3, 3, 3], [3, 3, 4])[0] == 0.0
+    assert rmse_scores([3, 3, 3], [3, 3, 4])[0] == pytest.approx(math.sqrt(1 / 3))
+    assert mae_scores([3, 3, 3], [3, 3, 4])[0] == pytest.approx(1 / 3)
+
+
+def test_nan_rows_are_ignored_per_column():
+    observed = np.array([[1, 1], [2, np.nan], [np.nan, 3], [4, 4]])
+    predicted = np.array([[1, 1], [2, 2], [3, 3], [5, 6]])
+    metrics = regression_metrics(observed, predicted)
+    np.testing.assert_array_equal(metrics["points"], [3, 3])
+    # Column 0 scores [1, 2, 4] against [1, 2, 5]; column 1 scores [1, 3, 4] against [1, 3, 6].
+    np.testing.assert_allclose(metrics["r_squared"], [1 - 1 / (42 / 9), 1 - 4 / (42 / 9)])
+    np.testing.assert_allclose(metrics["rmse"], [math.sqrt(1 / 3), math.sqrt(4 / 3)])
+    np.testing.assert_allclose(metrics["mae"], [1 / 3, 2 / 3])
+
+
+def test_explicit_mask_and_empty_columns():
+    observed = np.array([[1, 5], [2, 5], [10, 5]], dtype=float)
+    predicted = np.array([[1, 5], [3, 5], [0, 5]], dtype=float)
+    valid = np.array([[True, False], [True, False], [False, False]])
+    metrics = regression_metrics(observed, predicted, valid)
+    assert metrics["mae"][0] == pytest.approx(0.5)
+    assert metrics["rmse"][0] == pytest.approx(math.sqrt(0.5))
+    assert metrics["points"][1] == 0
+    for name in ("rss", "r_squared", "rmse", "mae", "mape", "aic", "bic"):
+        assert math.isnan(metrics[name][1]), name
+
+
+def test_non_finite_predictions_give_nan_scores():
+    metrics = regression_metrics([1, 2, 3], [1, np.inf, 3], valid=[True, True, True])
+    assert math.isnan(metrics["r_squared"][0])
+    assert math.isnan(metrics["mae"][0])
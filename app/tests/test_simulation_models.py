@@ -0,0 +1,57 @@
+import numpy as np
+import pytest
+
+from simulation_models import (fit_growth_models, evaluate_growth_model, describe_growth_model, exponential_model, logistic_model,
+                               gompertz_model)
+
+COLUMNS = ["exp", "log", "gom", "empty"]
+
+
+@pytest.fixture(scope="module")
+def series():
+    rng = np.random.default_rng(1)
+    t = np.linspace(0, 200, 400)
+    noise = lambda: 1 + rng.normal(0, 0.02, t.size)
+    return {
+        "SimulatedTime": t,
+        "exp": exponential_model(t, 5, 0.02) * noise(),
+        "log": logistic_model(t, 1000, 0.08, 90) * noise(),
+        "gom": gompertz_model(t, 800, 0.05, 70) * noise(),
+        "empty": np.full(t.size, np.nan),
+    }
+
+
+@pytest.mark.parametrize("criterion", ["aic", "bic"])
+def test_the_generating_model_is_selected(series, criterion):
+    selection = fit_growth_models(series, COLUMNS, criterion=criterion, max_workers=1)
+    assert selection.best("exp")["model"] == "exponential"
+    assert selection.best("log")["model"] == "logistic"
+    assert selection.best("gom")["model"] == "gompertz"
+    assert selection.best("empty") is None
+    for column in COLUMNS[:3]:
+        scores = [entry[criterion] for entry in selection.ranking(column)]
+        assert scores == sorted(scores)
+
+
+def test_selected_parameters_are_close_to_the_truth(series):
+    selection = fit_growth_models(series, COLUMNS, max_workers=1)
+    logistic = selection.best("log")
+    assert logistic["params"]["K"] == pytest.approx(1000, rel=0.02)
+    assert logistic["params"]["r"] == pytest.approx(0.08, rel=0.02)
+    assert logistic["params"]["t0"] == pytest.approx(90, abs=1)
+    assert logistic["doubling_time"] == pytest.approx(np.log(2) / logistic["params"]["r"])
+    gompertz = selection.best("gom")
+    assert gompertz["params"]["K"] == pytest.approx(800, rel=0.02)
+    assert np.isnan(gompertz["doubling_time"])
+    assert "Gompertz: K=" in describe_growth_model(gompertz)
+
+
+def test_parallel_and_serial_fits_agree(series):
+    serial = fit_growth_models(series, COLUMNS[:3], max_workers=1)
+    parallel = fit_growth_models(series, COLUMNS[:3], max_workers=2)
+    np.testing.assert_allclose(parallel.records["aic"], serial.records["aic"])
+
+
+def test_evaluate_ignores_unused_parameter_slots():
+    t = np.array([0.0, 10.0])
+    np.testing.assert_allclose(evaluate_growth_model("exponential", t, [2.0, 0.1, 0.0]), [2.0, 2.0 * np.e])
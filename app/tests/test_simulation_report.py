@@ -0,0 +1,18 @@
+from simulation_report import write_html_report, read_report_fingerprint
+from simulation_stats import load_simulation_stats
+
+HEADER = "Timestamp;FPS;RealTime;SimulatedTime;DeltaTime;FrameCount;Paused;EColi;Organism count\n"
+
+
+def test_placeholders_inside_the_simulation_name_stay_literal(tmp_path):
+    csv_path = tmp_path / "SimulationStats.csv"
+    rows = "".join(f"17-05-2025 12:00:{frame:02d};60.0;{frame * 0.5};{frame * 1.0};0.0167;{frame};No;{5 + frame};{5 + frame}\n"
+                   for frame in range(30))
+    csv_path.write_text(HEADER + rows, encoding="utf-8")
+    report_path = tmp_path / "report.html"
+    name = "Sim __DATA__ __TITLE__ __FINGERPRINT__"
+    assert write_html_report(load_simulation_stats(csv_path), name, report_path, fingerprint={"size": 1})
+    document = report_path.read_text(encoding="utf-8")
+    assert "<title>Simulation Statistics (Sim __DATA__ __TITLE__ __FINGERPRINT__)</title>" in document
+    assert document.count('"simulation":"Sim __DATA__ __TITLE__ __FINGERPRINT__"') == 1
+    assert read_report_fingerprint(report_path) == {"size": 1}
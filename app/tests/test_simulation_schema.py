@@ -0,0 +1,56 @@
+import numpy as np
+import pandas as pd
+
+from simulation_schema import (resolve_stats_schema, compact_columns, decode_paused_flags, header_fingerprint,
+                               ROLE_ORGANISM, ROLE_PAUSED, ROLE_COUNTER)
+
+V1_HEADER = ["Timestamp", "FPS", "RealTime", "SimulatedTime", "DeltaTime", "FrameCount", "Pausado", "EColi", "SCerevisiae"]
+V2_HEADER = ["Timestamp", "FPS", "RealTime", "SimulatedTime", "DeltaTime", "FrameCount", "Paused", "SCerevisiae", "EColi", "Organism count"]
+
+
+def test_logger_versions_are_recognised():
+    v1 = resolve_stats_schema(V1_HEADER)
+    v2 = resolve_stats_schema(V2_HEADER)
+    assert v1.version == 1 and v2.version == 2
+    assert v1.roles["Pausado"] == ROLE_PAUSED and v1.storage_name("Pausado") == "Paused"
+    assert v2.roles["FrameCount"] == ROLE_COUNTER
+    assert v2.organism_columns == ["EColi", "Organism count", "SCerevisiae"]
+    assert v2.rollup_metrics() == ["FPS", "EColi", "Organism count", "SCerevisiae"]
+
+
+def test_drifted_header_is_classified_by_name(capsys):
+    header = ["Timestamp", "FPS", "Paused", "FrameCount", "EColi"]
+    schema = resolve_stats_schema(header)
+    assert schema.version is None
+    assert schema.roles["Paused"] == ROLE_PAUSED and schema.roles["FrameCount"] == ROLE_COUNTER
+    assert schema.roles["EColi"] == ROLE_ORGANISM
+    assert "does not match a known logger version" in capsys.readouterr().out
+
+
+def test_fingerprint_changes_with_the_header():
+    assert header_fingerprint(V2_HEADER) == resolve_stats_schema(V2_HEADER).fingerprint
+    assert header_fingerprint(V2_HEADER) != header_fingerprint(V2_HEADER[:-1])
+
+
+def test_columns_are_stored_compactly_when_exact():
+    schema = resolve_stats_schema(V2_HEADER)
+    compacted = compact_columns({
+        "FPS": np.array([59.5, 60.25]),
+        "FrameCount": np.array([1.0, 2.0]),
+        "EColi": np.array([5.0, 4_000_000_000.0]),
+        "SCerevisiae": np.array([3.0, np.nan]),
+        "Organism count": np.array([1.0, 2.5]),
+        "Timestamp": np.array([0, 1], dtype=np.int64),
+    }, schema)
+    assert compacted["FPS"].dtype == np.float32
+    assert compacted["FrameCount"].dtype == np.uint32
+    assert compacted["EColi"].dtype == np.uint32
+    # Missing or fractional counts have no exact uint32 form.
+    assert compacted["SCerevisiae"].dtype == np.float64
+    assert compacted["Organism count"].dtype == np.float64
+    assert compacted["Timestamp"].dtype == np.int64
+
+
+def test_paused_flags_accept_both_languages():
+    raw = pd.Series(["Yes", "No", " Sí", "si", "TRUE", "1", "no", None])
+    np.testing.assert_array_equal(decode_paused_flags(raw), [True, False, True, True, True, True, False, False])
@@ -0,0 +1,63 @@
+import numpy as np
+
+import simulation_stats
+from simulation_rollups import StatsRollups
+from simulation_sparklines import bucket_means, summarize_sparklines, SPARKLINE_POINTS
+from simulation_stats import load_simulation_stats, load_stats_rollups
+
+HEADER = "Timestamp;FPS;RealTime;SimulatedTime;DeltaTime;FrameCount;Paused;EColi;SCerevisiae;Organism count\n"
+
+
+def write_stats(path, seconds):
+    lines = []
+    for second in range(seconds):
+        ecoli, scerevisiae = 5 + second, 3 + second // 2
+        lines.append(f"17-05-2025 {12 + second // 3600:02d}:{second // 60 % 60:02d}:{second % 60:02d};{60 - second % 7}.5;{second * 0.5};"
+                     f"{second * 1.0};0.0167;{second};No;{ecoli};{scerevisiae};{ecoli + scerevisiae}\n")
+    path.write_text(HEADER + "".join(lines), encoding="utf-8")
+
+
+def test_bucket_means_weight_rollup_rows_by_their_counts():
+    means = bucket_means(np.array([0, 1, 10]), np.array([[10.0], [30.0], [7.0]]), np.array([[1], [3], [1]]), points=2)
+    np.testing.assert_allclose(means[:, 0], [10.0, 7.0])
+
+
+def test_summary_is_built_from_the_rollups(tmp_path):
+    csv_path = tmp_path / "SimulationStats.csv"
+    write_stats(csv_path, 3000)
+    summary = summarize_sparklines(load_simulation_stats(csv_path).rollups)
+    assert len(summary["population"]) == SPARKLINE_POINTS
+    # 3000 s over 256 points reads the 10 s level, and the first point covers its first two rows.
+    assert summary["population"][0] == np.mean([8 + second + second // 2 for second in range(20)])
+    assert summary["population"][-1] > summary["population"][0]
+    assert len(summary["fps"]) == SPARKLINE_POINTS
+
+
+def test_species_columns_are_summed_without_a_total_column():
+    rollups = StatsRollups(["FPS", "EColi", "SCerevisiae"])
+    rollups.update(np.arange(4, dtype=np.int64), {"FPS": np.full(4, 60.0), "EColi": np.array([1.0, 2.0, 3.0, 4.0]),
+                                                  "SCerevisiae": np.array([10.0, np.nan, 30.0, 40.0])})
+    assert summarize_sparklines(rollups)["population"] == [11.0, 2.0, 33.0, 44.0]
+
+
+def test_current_cache_is_read_without_loading_the_columns(tmp_path, monkeypatch):
+    csv_path = tmp_path / "SimulationStats.csv"
+    write_stats(csv_path, 600)
+    expected = load_simulation_stats(csv_path).rollups
+
+    def fail(*args, **kwargs):
+        raise AssertionError("the CSV or its cached columns were loaded")
+
+    monkeypatch.setattr(simulation_stats, "load_simulation_stats", fail)
+    monkeypatch.setattr(simulation_stats.FpsByPopulation, "from_arrays", fail)
+    rollups = load_stats_rollups(csv_path)
+    for level in expected.levels:
+        np.testing.assert_array_equal(rollups.tables[level].sums, expected.tables[level].sums)
+
+
+def test_stale_cache_falls_back_to_a_load(tmp_path):
+    csv_path = tmp_path / "SimulationStats.csv"
+    write_stats(csv_path, 100)
+    load_simulation_stats(csv_path)
+    write_stats(csv_path, 200)
+    assert int(load_stats_rollups(csv_path).tables[1].counts[:, 0].sum()) == 200
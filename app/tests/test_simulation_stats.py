@@ -0,0 +1,183 @@
+import os
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import simulation_stats
+from simulation_stats import (StatsTail, load_simulation_stats, get_stats_cache_path, _read_stats_cache, _write_stats_cache,
+                              decode_timestamp_strings, decode_timestamps, INVALID_TIMESTAMP, TIMESTAMP_FORMAT)
+
+HEADER = "Timestamp;FPS;RealTime;SimulatedTime;DeltaTime;FrameCount;Paused;EColi;SCerevisiae;Organism count\n"
+
+
+def stats_rows(start: int, count: int) -> str:
+    lines = []
+    for frame in range(start, start + count):
+        ecoli, scerevisiae = 5 + frame, 3 + frame // 2
+        lines.append(f"17-05-2025 12:{frame // 60 % 60:02d}:{frame % 60:02d};{60 - frame % 7}.5;{frame * 0.5};{frame * 1.0};0.0167;"
+                     f"{frame};No;{ecoli};{scerevisiae};{ecoli + scerevisiae}\n")
+    return "".join(lines)
+
+
+@pytest.fixture
+def csv_path(tmp_path):
+    path = tmp_path / "SimulationStats.csv"
+    path.write_text(HEADER + stats_rows(0, 120), encoding="utf-8")
+    return path
+
+
+def assert_same_columns(left, right):
+    assert list(left.columns) == list(right.columns)
+    for name in left.columns:
+        np.testing.assert_array_equal(left[name], right[name], err_msg=name)
+
+
+def test_second_load_reuses_the_cache(csv_path, capsys):
+    first = load_simulation_stats(csv_path)
+    assert get_stats_cache_path(csv_path).is_file()
+    capsys.readouterr()
+    second = load_simulation_stats(csv_path)
+    assert "Stats cache is current (120 rows)" in capsys.readouterr().out
+    assert_same_columns(first, second)
+    assert second.rows_read == 120
+
+
+def test_appended_rows_are_parsed_incrementally(csv_path, capsys):
+    load_simulation_stats(csv_path)
+    with open(csv_path, "a", encoding="utf-8") as f:
+        f.write(stats_rows(120, 30))
+    capsys.readouterr()
+    updated = load_simulation_stats(csv_path)
+    assert "parsing" in capsys.readouterr().out
+    assert len(updated) == 150
+    assert_same_columns(updated, load_simulation_stats(csv_path, use_cache=False))
+
+
+def test_partial_last_row_waits_for_its_newline(csv_path):
+    with open(csv_path, "a", encoding="utf-8") as f:
+        f.write(stats_rows(120, 1)[:20])
+    assert len(load_simulation_stats(csv_path)) == 120
+    with open(csv_path, "a", encoding="utf-8") as f:
+        f.write(stats_rows(120, 1)[20:])
+    assert len(load_simulation_stats(csv_path)) == 121
+
+
+def test_rewritten_file_invalidates_the_cache(csv_path):
+    load_simulation_stats(csv_path)
+    # Same header, different first rows and a larger size: a restarted run, not an append.
+    csv_path.write_text(HEADER + stats_rows(500, 200), encoding="utf-8")
+    reloaded = load_simulation_stats(csv_path)
+    assert len(reloaded) == 200
+    assert reloaded["FrameCount"][0] == 500
+    assert_same_columns(reloaded, load_simulation_stats(csv_path, use_cache=False))
+
+
+def test_changed_header_invalidates_the_cache(csv_path):
+    load_simulation_stats(csv_path)
+    without_yeast = [";".join(fields[:8] + fields[9:]) for fields in (line.split(";") for line in (HEADER + stats_rows(0, 120)).splitlines(True))]
+    csv_path.write_text("".join(without_yeast), encoding="utf-8")
+    reloaded = load_simulation_stats(csv_path)
+    assert "SCerevisiae" not in reloaded.organism_columns
+
+
+def test_concurrent_cache_writes_leave_one_readable_cache(csv_path, monkeypatch, capsys):
+    load_simulation_stats(csv_path)
+    cache_path = get_stats_cache_path(csv_path)
+    meta, columns, fps_by_population, rollups = _read_stats_cache(cache_path)
+    barrier = threading.Barrier(8)
+    savez = np.savez
+
+    def slow_savez(*args, **kwargs):
+        # Keeps every writer's temp file open at the same time.
+        savez(*args, **kwargs)
+        time.sleep(0.05)
+
+    monkeypatch.setattr(simulation_stats.np, "savez", slow_savez)
+
+    def write():
+        barrier.wait()
+        _write_stats_cache(cache_path, meta, columns, fps_by_population, rollups)
+
+    threads = [threading.Thread(target=write) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert "Could not write stats cache" not in capsys.readouterr().out
+    assert sorted(os.listdir(csv_path.parent)) == sorted([csv_path.name, cache_path.name])
+    assert _read_stats_cache(cache_path)[0] == meta
+
+
+def test_failed_cache_write_removes_its_temp_file(csv_path, monkeypatch, capsys):
+    load_simulation_stats(csv_path)
+    cache_path = get_stats_cache_path(csv_path)
+    cached = _read_stats_cache(cache_path)
+    cache_path.unlink()
+
+    def fail(*args, **kwargs):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(simulation_stats.np, "savez", fail)
+    _write_stats_cache(cache_path, *cached)
+    assert "Could not write stats cache" in capsys.readouterr().out
+    assert os.listdir(csv_path.parent) == [csv_path.name]
+
+
+def test_tail_returns_only_new_rows_without_aggregates(csv_path, monkeypatch):
+    tail = StatsTail(csv_path)
+    first = tail.poll()
+    assert len(first["Timestamp"]) == 120
+    assert tail.poll() is None
+    with open(csv_path, "a", encoding="utf-8") as f:
+        f.write(stats_rows(120, 5))
+    built = []
+    monkeypatch.setattr(simulation_stats, "StatsRollups", lambda *args: built.append(args))
+    monkeypatch.setattr(simulation_stats, "FpsByPopulation", lambda *args: built.append(args))
+    appended = tail.poll()
+    np.testing.assert_array_equal(appended["FrameCount"], np.arange(120, 125))
+    assert built == []
+    assert tail.rows_read == 125
+
+
+def test_tail_restarts_when_the_file_is_recreated(csv_path):
+    tail = StatsTail(csv_path)
+    tail.poll()
+    generation = tail.generation
+    csv_path.write_text(HEADER + stats_rows(900, 3), encoding="utf-8")
+    restarted = tail.poll()
+    assert tail.generation == generation + 1
+    np.testing.assert_array_equal(restarted["FrameCount"], [900, 901, 902])
+
+
+@pytest.mark.parametrize("text, epoch", [
+    ("17-05-2025 12:00:00", 1747483200),
+    ("29-02-2024 23:59:59", 1709251199),
+    ("01-01-1970 00:00:00", 0),
+    ("31-12-1969 23:59:59", -1),
+    (" 17-05-2025 12:00:00 ", 1747483200),
+    ("1-05-2025 12:00:00", 1746100800),
+])
+def test_timestamps_decode_to_epoch_seconds(text, epoch):
+    assert decode_timestamp_strings([text])[0] == epoch
+
+
+@pytest.mark.parametrize("text", ["29-02-2023 00:00:00", "31-04-2025 10:00:00", "17-13-2025 10:00:00", "17-05-2025 24:00:00",
+                                  "17-05-2025 12:60:00", "17/05/2025 12:00:00", "not a timestamp", "0", "", "nan"])
+def test_invalid_or_missing_timestamps_are_flagged(text):
+    assert decode_timestamp_strings([text])[0] == INVALID_TIMESTAMP
+
+
+def test_timestamp_decoding_matches_pandas():
+    rng = np.random.default_rng(0)
+    moments = pd.to_datetime("1990-01-01") + pd.to_timedelta(rng.integers(0, 60 * 365 * 86400, 2000), unit="s")
+    text = moments.strftime(TIMESTAMP_FORMAT)
+    expected = moments.values.astype("datetime64[s]").astype(np.int64)
+    np.testing.assert_array_equal(decode_timestamp_strings(text), expected)
+
+
+def test_repeated_and_missing_timestamps_are_decoded_per_row():
+    raw = pd.Series(["17-05-2025 12:00:00", "17-05-2025 12:00:00", None, "17-05-2025 12:00:01", "0"])
+    np.testing.assert_array_equal(decode_timestamps(raw), [1747483200, 1747483200, INVALID_TIMESTAMP, 1747483201, INVALID_TIMESTAMP])
@@ -0,0 +1,64 @@
+import pytest
+
+from simulation_tokens import (TokenLedger, estimate_cost, model_prices, usage_token_counts, count_static_tokens, record_token_usage,
+                               simulation_token_summary, describe_token_totals)
+
+
+def test_fine_tuned_models_are_priced_by_their_base_model():
+    assert model_prices("ft:gpt-4o-mini-2024-07-18:org::abc") == (0.30, 1.20)
+    assert model_prices("gpt-4o-2024-08-06") == (3.75, 15.00)
+    assert model_prices("gpt-4.1-mini") == (0.80, 3.20)
+    assert model_prices("unknown-model") is None
+    assert estimate_cost("gpt-4o-mini", 1_000_000, 500_000) == pytest.approx(0.90)
+    assert estimate_cost(None, 10, 10) is None
+
+
+def test_usage_is_read_from_responses_and_stream_chunks():
+    assert usage_token_counts({"usage": {"prompt_tokens": 12, "completion_tokens": 30}}) == (12, 30)
+    assert usage_token_counts({"usage": None}) is None
+    assert usage_token_counts({"usage": {"prompt_tokens": 12}}) is None
+    assert usage_token_counts(None) is None
+
+
+def test_static_counts_are_computed_once_per_text():
+    calls = []
+
+    def counter(text):
+        calls.append(text)
+        return len(text)
+
+    assert count_static_tokens("system prompt", counter) == 13
+    assert count_static_tokens("system prompt", counter) == 13
+    assert calls == ["system prompt"]
+
+
+def test_ledger_totals_by_day_and_simulation(tmp_path):
+    ledger = TokenLedger(tmp_path / "ledger" / "TokenLedger.sqlite3")
+    ledger.record("Alpha", "secondary", "gpt-4o-mini", 100, 20, "usage")
+    ledger.record("Alpha", "primary", "gpt-4o-mini", 1000, 500, "usage")
+    ledger.record("Beta", "primary", "unknown-model", 10, 5, "estimate")
+    by_simulation = {row["key"]: row for row in ledger.by_simulation()}
+    assert by_simulation["Alpha"]["calls"] == 2
+    assert by_simulation["Alpha"]["input_tokens"] == 1100 and by_simulation["Alpha"]["output_tokens"] == 520
+    assert by_simulation["Alpha"]["cost_usd"] == pytest.approx((1100 * 0.30 + 520 * 1.20) / 1_000_000)
+    assert by_simulation["Beta"]["cost_usd"] is None
+    (day,) = ledger.by_day()
+    assert day["calls"] == 3 and day["input_tokens"] == 1110
+    assert ledger.by_day(since="9999-01-01") == []
+
+
+def test_record_helpers_survive_an_unwritable_ledger(tmp_path, capsys):
+    blocker = tmp_path / "not-a-folder"
+    blocker.write_text("")
+    cost = record_token_usage(blocker / "TokenLedger.sqlite3", "Alpha", "primary", "gpt-4o-mini", 1_000_000, 0, "usage")
+    assert cost == pytest.approx(0.30)
+    assert "Could not record token usage" in capsys.readouterr().out
+    assert record_token_usage(None, "Alpha", "primary", "gpt-4o-mini", 1_000_000, 0, "usage") == pytest.approx(0.30)
+
+
+def test_simulation_summary_text(tmp_path):
+    path = tmp_path / "TokenLedger.sqlite3"
+    record_token_usage(path, "Alpha", "primary", "gpt-4o-mini", 1500, 250, "usage")
+    assert simulation_token_summary(path, "Alpha") == "1 calls, 1,500 in / 250 out tokens, est. $0.0008"
+    assert simulation_token_summary(path, "Missing") is None
+    assert describe_token_totals({"calls": 2, "input_tokens": None, "output_tokens": 3, "cost_usd": None}) == "2 calls, 0 in / 3 out tokens"
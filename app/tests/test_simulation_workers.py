@@ -0,0 +1,64 @@
+import sys
+import threading
+import types
+
+import pytest
+
+from simulation_workers import run_in_spawn_pool, _main_script_hidden_from_workers
+
+JOBS = {"a": (7, 2), "b": (9, 4), "c": (1, 1)}
+EXPECTED = {"a": (3, 1), "b": (2, 1), "c": (1, 0)}
+
+
+@pytest.mark.parametrize("worker_count", [1, 2])
+def test_every_job_reaches_on_result_under_its_key(worker_count):
+    results = {}
+    assert run_in_spawn_pool(divmod, JOBS, worker_count, results.__setitem__, "division")
+    assert results == EXPECTED
+
+
+def test_fallback_runs_the_jobs_left_in_process():
+    results = {}
+    run_in_spawn_pool(divmod, JOBS, 1, results.__setitem__, "division", fallback=lambda key: ("local", key))
+    assert results == {key: ("local", key) for key in JOBS}
+
+
+def test_should_stop_ends_the_serial_run():
+    results = {}
+    assert not run_in_spawn_pool(divmod, JOBS, 1, results.__setitem__, "division", should_stop=lambda: len(results) == 2)
+    assert len(results) == 2
+
+
+def test_overlapping_pools_keep_the_main_script_hidden_until_the_last_exits(monkeypatch):
+    main_module = types.ModuleType("__main__")
+    main_module.__file__ = "manager.py"
+    monkeypatch.setitem(sys.modules, "__main__", main_module)
+    first, second = _main_script_hidden_from_workers(), _main_script_hidden_from_workers()
+    first.__enter__()
+    second.__enter__()
+    first.__exit__(None, None, None)
+    assert not hasattr(main_module, "__file__")
+    second.__exit__(None, None, None)
+    assert main_module.__file__ == "manager.py"
+
+
+def test_concurrent_pools_restore_the_main_script(monkeypatch):
+    main_module = types.ModuleType("__main__")
+    main_module.__file__ = "manager.py"
+    monkeypatch.setitem(sys.modules, "__main__", main_module)
+    barrier = threading.Barrier(4)
+    seen = []
+
+    def enter_and_check():
+        with _main_script_hidden_from_workers():
+            barrier.wait()
+            seen.append(hasattr(main_module, "__file__"))
+            barrier.wait()
+
+    threads = [threading.Thread(target=enter_and_check) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert seen == [False] * 4
+    assert main_module.__file__ == "manager.py"